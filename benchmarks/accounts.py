@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Build the account database for a large synthetic passwd and run the
+section 6.2 controls, compared with pairwise duplicate scans.
+
+Usage: python benchmarks/accounts.py [accounts] [pairwise-sample]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auditors.account_checks import ACCOUNT_CONTROLS, AccountChecks  # noqa: E402
+from src.probes import AccountDatabase  # noqa: E402
+
+
+def make_root(path: str, accounts: int):
+    """Write passwd/shadow/group with a few duplicates and create every home."""
+    os.makedirs(os.path.join(path, "etc"))
+    groups = max(accounts // 5, 1)
+    with open(os.path.join(path, "etc", "passwd"), 'w') as passwd, \
+            open(os.path.join(path, "etc", "shadow"), 'w') as shadow:
+        passwd.write("root:x:0:0:root:/root:/bin/bash\n")
+        shadow.write("root:*:19000:0:99999:7:::\n")
+        for i in range(accounts):
+            uid = 10000 + (i if i % 1000 else i // 2)
+            passwd.write(f"user{i}:x:{uid}:{10000 + i % groups}::/home/user{i}:/bin/bash\n")
+            shadow.write(f"user{i}:$6$salt$hash:19000:0:99999:7:::\n")
+    with open(os.path.join(path, "etc", "group"), 'w') as group:
+        group.write("root:x:0:\nshadow:x:42:\n")
+        for i in range(groups):
+            group.write(f"group{i}:x:{10000 + i}:user{i}\n")
+    for i in range(accounts):
+        os.makedirs(os.path.join(path, "home", f"user{i}"), mode=0o750)
+
+
+def pairwise_duplicates(uids):
+    """Duplicate UIDs by comparing every pair, as ad-hoc scripts do."""
+    return {a for i, a in enumerate(uids) if a in uids[:i]}
+
+
+def main():
+    accounts = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    sample = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        make_root(root, accounts)
+        print(f"{accounts:,} accounts written in {time.perf_counter() - start:.1f} s")
+
+        db = AccountDatabase(root)
+        start = time.perf_counter()
+        db.accounts, db.groups, db.shadow
+        print(f"parse + index:       {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        start = time.perf_counter()
+        db.home_stats()
+        print(f"home stats ({db.max_workers} threads): {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        checks = AccountChecks(db)
+        start = time.perf_counter()
+        results = [checks.result(check_id) for check_id in ACCOUNT_CONTROLS]
+        print(f"{len(results)} controls:         {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        uids = [a.uid for a in db.accounts[:sample]]
+        start = time.perf_counter()
+        pairwise_duplicates(uids)
+        elapsed = time.perf_counter() - start
+        print(f"pairwise duplicate UIDs, {sample:,} accounts: {elapsed * 1000:.0f} ms "
+              f"(~{elapsed * (accounts / sample) ** 2:.0f} s at {accounts:,})")
+
+
+if __name__ == "__main__":
+    main()
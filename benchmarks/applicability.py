@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Measure applicability planning and the audit time it saves on this host.
+
+Usage: python benchmarks/applicability.py [runs] [level]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auditors.ubuntu_auditor import UbuntuAuditor  # noqa: E402
+from src.probes import HostFacts  # noqa: E402
+
+
+class UnprunedAuditor(UbuntuAuditor):
+    """Run every declared check, as before applicability predicates."""
+
+    def get_applicable_specs(self):
+        return self.get_check_specs()
+
+
+def timed(func, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    level = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+
+    auditor = UbuntuAuditor(level=level)
+    planned = auditor.get_applicable_specs()
+    total = len(auditor.get_check_specs())
+    print(f"{auditor.facts.os_id}: systemd={auditor.facts.systemd} "
+          f"container={auditor.facts.container} bare_metal={auditor.facts.bare_metal}")
+    print(f"{len(planned)} of {total} checks apply at level {level}")
+    for check_id, reason in sorted(auditor.not_applicable.items()):
+        print(f"   {check_id}: {reason}")
+
+    plan = timed(lambda: UbuntuAuditor(level=level).get_applicable_specs(), runs)
+    pruned = timed(lambda: UbuntuAuditor(level=level, facts=HostFacts()).run_all_checks(), runs)
+    unpruned = timed(lambda: UnprunedAuditor(level=level).run_all_checks(), runs)
+    print(f"planning (facts + predicates): {plan * 1000:.2f} ms")
+    print(f"audit: all checks {unpruned * 1000:.1f} ms, applicable checks {pruned * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
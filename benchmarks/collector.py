@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Compare the compiled shell collector with a Python audit of the same profile,
+both started as fresh processes as they would be on a target host.
+
+Usage: python benchmarks/collector.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from src.compiler import ShellCompiler  # noqa: E402
+from src.utils.profile_loader import load_profile  # noqa: E402
+
+PYTHON_AUDIT = """
+import functools
+from src.auditors.command_checks import CommandCheckRunner
+from src.auditors.scheduler import CheckScheduler, CheckSpec
+from src.cli import main
+from src.compiler import ShellCompiler
+from src.utils.profile_loader import load_profile
+checks = ShellCompiler(load_profile("ubuntu_22_04"), "ubuntu_22_04").checks()
+runner = CommandCheckRunner(checks)
+CheckScheduler([CheckSpec(c["id"], functools.partial(runner.result, c["id"]),
+                          depends_on=c.get("depends_on")) for c in checks]).run()
+"""
+
+
+def timed(command, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        subprocess.run(command, cwd=ROOT, stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    script = ShellCompiler(load_profile("ubuntu_22_04"), "ubuntu_22_04").compile()
+    with tempfile.NamedTemporaryFile('w', suffix='.sh', delete=False) as f:
+        f.write(script)
+    try:
+        shell = timed(["sh", f.name], runs)
+        python = timed([sys.executable, "-c", PYTHON_AUDIT], runs)
+    finally:
+        os.unlink(f.name)
+    print(f"shell collector: {shell * 1000:.0f} ms per run")
+    print(f"python engine:   {python * 1000:.0f} ms per run (including interpreter and imports)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Compare the size and speed of the JSON and compact archive formats.
+
+Usage: python benchmarks/compact_format.py [hosts] [checks]
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auditors.base_auditor import CheckResult  # noqa: E402
+from src.reports.compact_reporter import CompactReporter  # noqa: E402
+
+STATUSES = ("pass", "fail", "skip", "error")
+
+
+def make_run(host: int, checks: int) -> dict:
+    results = []
+    for i in range(checks):
+        status = STATUSES[(host + i) % 7 % 4]
+        results.append(CheckResult(
+            check_id=f"{i // 50 + 1}.{i // 10 % 5 + 1}.{i % 10 + 1}",
+            title=f"Ensure control {i} is configured according to the benchmark",
+            status=status,
+            description=f"Control {i} is {'compliant' if status == 'pass' else 'not compliant'}",
+            remediation=f"Edit /etc/example/{i}.conf and apply the recommended setting",
+            severity=("low", "medium", "high", "critical")[i % 4],
+        ).to_dict())
+    return {
+        "profile": "ubuntu_22_04",
+        "level": 1,
+        "host": f"host-{host:04d}",
+        "compliance_score": 50.0,
+        "total_checks": checks,
+        "timestamp": results[0]["timestamp"],
+        "results": results,
+    }
+
+
+def timed(func):
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+def main():
+    hosts = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    checks = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    runs = [make_run(h, checks) for h in range(hosts)]
+    reporter = CompactReporter()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_dir = os.path.join(tmp, "json")
+        os.makedirs(json_dir)
+
+        def write_json():
+            for i, run in enumerate(runs):
+                with open(os.path.join(json_dir, f"{i}.json"), 'w') as f:
+                    json.dump(run, f, indent=2)
+
+        def read_json():
+            loaded = []
+            for i in range(hosts):
+                with open(os.path.join(json_dir, f"{i}.json")) as f:
+                    loaded.append(json.load(f))
+            return loaded
+
+        compact_path = os.path.join(tmp, "fleet.cisz")
+        _, json_write = timed(write_json)
+        _, json_read = timed(read_json)
+        _, compact_write = timed(lambda: reporter.write(runs, compact_path))
+        loaded, compact_read = timed(lambda: reporter.read(compact_path))
+        assert loaded == runs
+
+        json_size = sum(os.path.getsize(os.path.join(json_dir, n)) for n in os.listdir(json_dir))
+        compact_size = os.path.getsize(compact_path)
+
+    print(f"{hosts} hosts x {checks} checks")
+    print(f"{'format':<10}{'size':>14}{'write':>10}{'read':>10}")
+    print(f"{'json':<10}{json_size:>14,}{json_write:>9.2f}s{json_read:>9.2f}s")
+    print(f"{'compact':<10}{compact_size:>14,}{compact_write:>9.2f}s{compact_read:>9.2f}s")
+    print(f"size ratio: {json_size / compact_size:.1f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Time fleet dashboard generation for a synthetic fleet.
+
+Usage: python benchmarks/fleet_dashboard.py [hosts] [controls]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.reports.fleet_reporter import FleetReporter  # noqa: E402
+
+STATUSES = ("pass", "fail", "skip", "pass", "pass", "error")
+
+
+def make_runs(hosts: int, controls: int):
+    for h in range(hosts):
+        yield {
+            "host": f"host-{h:05d}",
+            "profile": "ubuntu_22_04",
+            "level": 1,
+            "timestamp": "2026-01-01T00:00:00",
+            "results": [{"check_id": f"{c // 50 + 1}.{c // 10 % 5 + 1}.{c % 10 + 1}",
+                         "title": f"Ensure control {c} is configured",
+                         "status": STATUSES[(h * 7 + c * 3) % len(STATUSES)],
+                         "description": f"Control {c} evaluated",
+                         "remediation": f"Apply setting {c}",
+                         "severity": "high"} for c in range(controls)],
+        }
+
+
+def main():
+    hosts = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    controls = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "fleet.html")
+        start = time.perf_counter()
+        FleetReporter().generate(make_runs(hosts, controls), output)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(output)
+
+    print(f"{hosts} hosts x {controls} controls: {elapsed:.2f}s, dashboard {size:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Load test the ingest server on localhost.
+
+Usage: python benchmarks/ingest_load.py [agents] [uploads_per_agent] [checks]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.aggregation import IngestClient, IngestServer, ResultStore  # noqa: E402
+
+
+def make_run(checks: int, offset: int) -> dict:
+    statuses = ("pass", "fail", "skip")
+    return {
+        "profile": "ubuntu_22_04",
+        "level": 1,
+        "timestamp": (datetime(2026, 1, 1) + timedelta(minutes=offset)).isoformat(),
+        "results": [{"check_id": f"{i // 10 + 1}.{i % 10 + 1}",
+                     "title": f"Ensure control {i} is configured",
+                     "status": statuses[(i + offset) % 3],
+                     "description": "", "remediation": "", "severity": "medium",
+                     "timestamp": "2026-01-01T00:00:00"} for i in range(checks)],
+    }
+
+
+def agent(url: str, index: int, uploads: int, checks: int):
+    """Report for 10 hosts: full runs first, then deltas."""
+    client = IngestClient(url)
+    previous = {}
+    for n in range(uploads):
+        host = f"host-{index:04d}-{n % 10}"
+        run = make_run(checks, n // 10)
+        client.upload(run, host, previous.get(host))
+        previous[host] = run
+    client.close()
+
+
+def main():
+    agents = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    uploads = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    checks = int(sys.argv[3]) if len(sys.argv) > 3 else 300
+
+    with tempfile.TemporaryDirectory() as tmp:
+        loop = asyncio.new_event_loop()
+        server = IngestServer(ResultStore(tmp), port=0, queue_size=5000)
+        loop.run_until_complete(server.start())
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.port}"
+
+        start = time.perf_counter()
+        workers = [multiprocessing.Process(target=agent, args=(url, i, uploads, checks))
+                   for i in range(agents)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        accepted = time.perf_counter() - start
+
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        elapsed = time.perf_counter() - start
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+        total = agents * uploads
+        print(f"{agents} agents x {uploads} uploads x {checks} checks")
+        print(f"accepted: {total / accepted:,.0f} ingests/s ({accepted:.2f}s)")
+        print(f"stored:   {server.ingested / elapsed:,.0f} ingests/s ({elapsed:.2f}s, "
+              f"{len(server.store.hosts)} hosts, {server.dropped} dropped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Compare SourceMatcher with scanning the whole output once per rule, and
+one substring search per ``contains`` literal with a single alternation.
+
+Usage: python benchmarks/matcher.py [lines] [rules]
+"""
+
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auditors.matcher import Rule, SourceMatcher  # noqa: E402
+
+
+def naive(rule: Rule, output: str) -> bool:
+    """Evaluate a rule by scanning the whole output, as ad-hoc checks do."""
+    if rule.type == "contains":
+        return rule.pattern in output
+    if rule.type == "exact":
+        return any(line.strip() == rule.pattern for line in output.splitlines())
+    match = re.search(rule.pattern, output, re.MULTILINE)
+    if rule.type == "absent":
+        return match is None
+    if rule.type == "numeric":
+        return match is not None and float(match.group(1)) <= rule.value
+    return match is not None
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    rules = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    output = "\n".join(f"net.ipv4.conf.if{i}.setting_{i % 97} = {i % 3}" for i in range(lines))
+    kinds = ("exact", "regex", "numeric", "absent", "contains")
+    rule_list = []
+    for i in range(rules):
+        key = f"net.ipv4.conf.if{i * lines // rules}.setting_{i * lines // rules % 97}"
+        kind = kinds[i % len(kinds)]
+        if kind == "exact":
+            rule_list.append(Rule(str(i), "exact", f"{key} = 0"))
+        elif kind == "regex":
+            rule_list.append(Rule(str(i), "regex", rf"^{re.escape(key)} = [01]$"))
+        elif kind == "numeric":
+            rule_list.append(Rule(str(i), "numeric", rf"^{re.escape(key)} = (\d+)", "<=", 1))
+        elif kind == "absent":
+            rule_list.append(Rule(str(i), "absent", rf"^{re.escape(key)}_missing"))
+        else:
+            rule_list.append(Rule(str(i), "contains", f"{key} = "))
+
+    matcher = SourceMatcher(rule_list)
+    start = time.perf_counter()
+    outcome = matcher.evaluate(output)
+    indexed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    separate = {rule.check_id: naive(rule, output) for rule in rule_list}
+    separate_time = time.perf_counter() - start
+
+    assert {k: v[0] for k, v in outcome.items()} == separate
+    print(f"{lines} lines, {rules} rules, {len(output):,} bytes")
+    print(f"indexed:  {indexed_time * 1000:.1f} ms")
+    print(f"per rule: {separate_time * 1000:.1f} ms")
+
+    literals = sorted({rule.pattern for rule in rule_list if rule.type == "contains"},
+                      key=len, reverse=True)
+    start = time.perf_counter()
+    searched = {literal: literal in output for literal in literals}
+    search_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    combined = re.compile("|".join(re.escape(literal) for literal in literals))
+    seen = {match.group() for match in combined.finditer(output)}
+    alternation_time = time.perf_counter() - start
+
+    assert searched == {literal: literal in seen for literal in literals}
+    print(f"{len(literals)} contains literals: one search each {search_time * 1000:.1f} ms, "
+          f"one alternation {alternation_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
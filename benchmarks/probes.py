@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Compare native kernel probes with the subprocesses they replace.
+
+Usage: python benchmarks/probes.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.auditors.matcher import Rule  # noqa: E402
+from src.probes import KernelSnapshot  # noqa: E402
+from src.utils.profile_loader import load_profile  # noqa: E402
+
+
+def timed(func, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    checks = load_profile("ubuntu_22_04")["checks"]
+    keys = {rule.key for check in checks if check.get("probe") == "sysctl"
+            for rule in Rule.from_check(check)}
+
+    cases = [
+        ("sysctl -a", lambda: subprocess.run("sysctl -a", shell=True, capture_output=True),
+         lambda: KernelSnapshot().read("sysctl")),
+        (f"sysctl, {len(keys)} profile keys",
+         lambda: subprocess.run("sysctl -a", shell=True, capture_output=True),
+         lambda: KernelSnapshot().read("sysctl", keys)),
+        ("lsmod", lambda: subprocess.run("lsmod", shell=True, capture_output=True),
+         lambda: KernelSnapshot().read("modules")),
+    ]
+    for name, command, probe in cases:
+        try:
+            probe()
+        except Exception as e:
+            print(f"{name}: probe unavailable ({e})")
+            continue
+        print(f"{name}: subprocess {timed(command, runs) * 1000:.2f} ms, "
+              f"probe {timed(probe, runs) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,52 +1,439 @@
-#!/bin/bash
-# Ubuntu CIS Benchmark Checks
-# Author: SiteQ8
-# Description: Bash-based compliance checks for Ubuntu Linux
-
-echo "=== Ubuntu CIS Benchmark Compliance Checks ==="
-echo ""
-
-# 1.1.1 - Check cramfs filesystem
-echo "[1.1.1] Checking cramfs filesystem..."
-if lsmod | grep -q cramfs; then
-    echo "❌ FAIL: cramfs is loaded"
-else
-    echo "✅ PASS: cramfs is not loaded"
-fi
-
-# 3.5.1.1 - Check UFW status
-echo "[3.5.1.1] Checking UFW firewall..."
-if ufw status | grep -q "Status: active"; then
-    echo "✅ PASS: UFW is active"
-else
-    echo "❌ FAIL: UFW is not active"
-fi
-
-# 4.1.1.1 - Check auditd
-echo "[4.1.1.1] Checking auditd installation..."
-if dpkg -s auditd &>/dev/null; then
-    echo "✅ PASS: auditd is installed"
-else
-    echo "❌ FAIL: auditd is not installed"
-fi
-
-# 5.4.1.1 - Check password expiration
-echo "[5.4.1.1] Checking password expiration..."
-max_days=$(grep "^PASS_MAX_DAYS" /etc/login.defs | awk '{print $2}')
-if [ "$max_days" -le 365 ] && [ "$max_days" -gt 0 ]; then
-    echo "✅ PASS: Password expiration is $max_days days"
-else
-    echo "❌ FAIL: Password expiration is $max_days days (should be ≤365)"
-fi
-
-# 6.1.2 - Check /etc/shadow permissions
-echo "[6.1.2] Checking /etc/shadow permissions..."
-perms=$(stat -c %a /etc/shadow)
-if [ "$perms" = "000" ] || [ "$perms" = "600" ]; then
-    echo "✅ PASS: /etc/shadow has correct permissions ($perms)"
-else
-    echo "❌ FAIL: /etc/shadow has incorrect permissions ($perms)"
-fi
-
-echo ""
-echo "=== Compliance Check Completed ==="
+#!/bin/sh
+# CIS collector for profile ubuntu_22_04, generated by cis-checker compile.
+# Do not edit: regenerate it from the profile instead.
+# Prints JSON Lines: one run record, then one result record per check.
+
+LC_ALL=C
+export LC_ALL
+PATH=/usr/sbin:/usr/bin:/sbin:/bin:$PATH
+
+_json() {
+    printf '%s' "$1" | sed -e 's/\\/\\\\/g' -e 's/"/\\"/g' | tr -d '\n\r\t'
+}
+
+# _load N: run source N once, caching its output and exit status
+_load() {
+    eval "[ -n \"\${_d$1}\" ]" && return 0
+    _o=$(_s$1 </dev/null 2>/dev/null)
+    _r=$?
+    eval "_d$1=1 _o$1=\$_o _r$1=\$_r"
+}
+
+# _begin: start a check
+_begin() {
+    cs=pass cd= _blocked=
+}
+
+# _need ID VAR: note a prerequisite check that did not pass
+_need() {
+    eval "_s=\${_st_$2}"
+    [ "$_s" = pass ] || _blocked="${_blocked:+$_blocked, }$1 ($_s)"
+}
+
+# _source N LABEL ERROR [FALLBACK_N FALLBACK_LABEL FALLBACK_ERROR]
+_source() {
+    ss=pass sd= _label=$2
+    _load "$1"
+    eval "OUT=\$_o$1 _rc=\$_r$1"
+    case $1 in
+        p*)
+            if [ "$_rc" != 0 ]; then
+                if [ -n "$4" ]; then
+                    _source "$4" "$5" "$6"
+                    return
+                fi
+                ss=error sd=$3
+            fi ;;
+        *)
+            case $_rc in 126|127) ss=error sd=$3 ;; esac ;;
+    esac
+}
+
+# _rule TYPE PATTERN DESCRIPTION [SED OP VALUE NOT_FOUND NO_NUMBER]
+_rule() {
+    [ "$ss" = error ] && return 0
+    _ok= _d=$3
+    case $1 in
+        contains)
+            case $OUT in *"$2"*) _ok=1 ;; esac ;;
+        exact)
+            printf '%s\n' "$OUT" | P=$2 awk '{ s = $0; sub(/^[[:space:]]+/, "", s); sub(/[[:space:]]+$/, "", s); if (s == ENVIRON["P"]) f = 1 } END { exit !f }' && _ok=1 ;;
+        regex)
+            printf '%s\n' "$OUT" | grep -Eq -- "$2" && _ok=1 ;;
+        absent)
+            if [ -n "$2" ]; then
+                printf '%s\n' "$OUT" | grep -Eq -- "$2" || _ok=1
+            else
+                [ -z "$(printf '%s' "$OUT" | tr -d '[:space:]')" ] && _ok=1
+            fi ;;
+        numeric)
+            _numeric "$2" "$4" "$5" "$6" "$7" "$8" ;;
+    esac
+    if [ -z "$sd" ] || { [ "$ss" = pass ] && [ -z "$_ok" ]; }; then
+        sd=$_d
+        if [ -n "$_ok" ]; then ss=pass; else ss=fail; fi
+    fi
+}
+
+_numeric() {
+    _l=$(printf '%s\n' "$OUT" | grep -En -- "$1" | head -n 1)
+    if [ -z "$_l" ]; then
+        _d=$5
+        return
+    fi
+    _n=$(printf '%s\n' "${_l#*:}" | sed -En "$2")
+    _d=$(awk -v a="$_n" -v op="$3" -v b="$4" 'BEGIN {
+        if (a !~ /^[ \t]*[-+]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][-+]?[0-9]+)?[ \t]*$/) exit 2
+        a += 0; b += 0
+        if (op == "<") r = a < b; else if (op == "<=") r = a <= b
+        else if (op == "==") r = a == b; else if (op == "!=") r = a != b
+        else if (op == ">=") r = a >= b; else r = a > b
+        printf "value %g, expected %s %g", a, op, b
+        exit !r
+    }')
+    case $? in
+        0) _ok=1 ;;
+        1) ;;
+        *) _d=$6 ;;
+    esac
+}
+
+_rank() {
+    case $1 in pass) _k=0 ;; fail) _k=1 ;; *) _k=2 ;; esac
+}
+
+# _source_end: merge the current source's outcome into the check
+_source_end() {
+    case $ss in
+        pass) _d="$_label satisfies $sd" ;;
+        fail) _d="$_label does not satisfy $sd" ;;
+        *) _d=$sd ;;
+    esac
+    _rank "$ss"
+    _new=$_k
+    _rank "$cs"
+    if [ -z "$cd" ] || [ "$_new" -gt "$_k" ]; then
+        cs=$ss cd=$_d
+    fi
+}
+
+# _fixed STATUS DESCRIPTION: result decided at compile time
+_fixed() {
+    cs=$1 cd=$2
+}
+
+# _emit ID VAR TITLE SEVERITY REMEDIATION
+_emit() {
+    if [ -n "$_blocked" ]; then
+        cs=skip cd="Skipped: prerequisite check did not pass: $_blocked"
+    fi
+    eval "_st_$2=\$cs"
+    _rem=
+    [ "$cs" = fail ] && _rem=$5
+    printf '{"type":"result","check_id":"%s","title":"%s","status":"%s","description":"%s","remediation":"%s","severity":"%s","timestamp":"%s"}\n' \
+        "$1" "$3" "$cs" "$cd" "$_rem" "$4" "$TS"
+}
+
+_sp1() {
+    cat '/proc/modules'
+}
+_sc2() {
+    ( lsmod
+    )
+}
+_sp3() {
+    awk '{ sub(/#.*/, "") } NF { $1 = $1; print }' '/etc/modprobe.d'/*.conf 2>/dev/null
+    return 0
+}
+_sp4() {
+    [ -d '/proc/sys' ] || return 200
+    v=$(cat '/proc/sys/net/ipv4/conf/all/accept_redirects' 2>/dev/null) && printf '%s = %s\n' 'net.ipv4.conf.all.accept_redirects' "$v"
+    v=$(cat '/proc/sys/net/ipv4/conf/all/accept_source_route' 2>/dev/null) && printf '%s = %s\n' 'net.ipv4.conf.all.accept_source_route' "$v"
+    v=$(cat '/proc/sys/net/ipv4/conf/all/send_redirects' 2>/dev/null) && printf '%s = %s\n' 'net.ipv4.conf.all.send_redirects' "$v"
+    v=$(cat '/proc/sys/net/ipv4/conf/default/accept_redirects' 2>/dev/null) && printf '%s = %s\n' 'net.ipv4.conf.default.accept_redirects' "$v"
+    v=$(cat '/proc/sys/net/ipv4/conf/default/accept_source_route' 2>/dev/null) && printf '%s = %s\n' 'net.ipv4.conf.default.accept_source_route' "$v"
+    v=$(cat '/proc/sys/net/ipv4/conf/default/send_redirects' 2>/dev/null) && printf '%s = %s\n' 'net.ipv4.conf.default.send_redirects' "$v"
+    v=$(cat '/proc/sys/net/ipv4/ip_forward' 2>/dev/null) && printf '%s = %s\n' 'net.ipv4.ip_forward' "$v"
+    return 0
+}
+_sc5() {
+    ( sysctl -a
+    )
+}
+_sc6() {
+    ( if command -v ufw >/dev/null; then ufw status; fi
+    )
+}
+_sc7() {
+    ( grep PASS_MAX_DAYS /etc/login.defs
+    )
+}
+_sc8() {
+    ( stat /etc/shadow
+    )
+}
+_sc9() {
+    ( awk -F: '($2 != "x") {print $1}' /etc/passwd
+    )
+}
+_sc10() {
+    ( awk -F: '($2 == "") {print $1}' /etc/shadow
+    )
+}
+_sc11() {
+    ( awk -F: 'NR == FNR {gids[$3]; next} !($4 in gids) {print $4}' /etc/group /etc/passwd
+    )
+}
+_sc12() {
+    ( awk -F: 'NR == FNR {if ($1 == "shadow") {gid = $3; if ($4 != "") print $4}; next} gid != "" && $4 == gid {print $1}' /etc/group /etc/passwd
+    )
+}
+_sc13() {
+    ( cut -d: -f3 /etc/passwd | sort -n | uniq -d
+    )
+}
+_sc14() {
+    ( cut -d: -f3 /etc/group | sort -n | uniq -d
+    )
+}
+_sc15() {
+    ( cut -d: -f1 /etc/passwd | sort | uniq -d
+    )
+}
+_sc16() {
+    ( cut -d: -f1 /etc/group | sort | uniq -d
+    )
+}
+_sc17() {
+    ( awk -F: '($3 == 0 && $1 != "root") {print $1}' /etc/passwd
+    )
+}
+_sc18() {
+    ( awk -F: '$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 " " $3 " " $6}' /etc/passwd | while read -r user uid dir; do [ -d "$dir" ] || echo "$user $dir"; done
+    )
+}
+_sc19() {
+    ( awk -F: '$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 " " $3 " " $6}' /etc/passwd | while read -r user uid dir; do [ -d "$dir" ] && [ "$(stat -L -c %u "$dir")" != "$uid" ] && echo "$user $dir"; done
+    )
+}
+_sc20() {
+    ( awk -F: '$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 " " $3 " " $6}' /etc/passwd | while read -r user uid dir; do [ -d "$dir" ] && [ -n "$(find -L "$dir" -maxdepth 0 -perm /027)" ] && echo "$user $dir"; done
+    )
+}
+_sc21() {
+    ( ufw status verbose
+    )
+}
+
+TS=$(date +%Y-%m-%dT%H:%M:%S)
+printf '{"type":"run","host":"%s","profile":"%s","level":%s,"timestamp":"%s","collector":"sh"}\n' \
+    "$(_json "$(uname -n)")" 'ubuntu_22_04' 1 "$TS"
+
+# 1.1.1 Ensure mounting of cramfs filesystems is disabled
+_begin
+if [ -z "$_blocked" ]; then
+    _source p1 '/proc/modules' '/proc/modules is unavailable: /proc/modules' c2 'Output of `lsmod`' '`lsmod` could not be executed'
+    _rule 'absent' '^cramfs[[:space:]]' 'no '\''^cramfs\\\\s'\'''
+    _source_end
+    _source p3 '/etc/modprobe.d' '/etc/modprobe.d is unavailable: /etc/modprobe.d'
+    _rule 'regex' '^install cramfs /bin/(true|false)$' ''\''^install cramfs /bin/(true|false)$'\'''
+    _source_end
+fi
+_emit '1.1.1' 1_1_1 'Ensure mounting of cramfs filesystems is disabled' 'medium' 'echo '\''install cramfs /bin/true'\'' >> /etc/modprobe.d/cramfs.conf && rmmod cramfs'
+
+# 1.1.2 Ensure mounting of freevxfs filesystems is disabled
+_begin
+if [ -z "$_blocked" ]; then
+    _source p1 '/proc/modules' '/proc/modules is unavailable: /proc/modules' c2 'Output of `lsmod`' '`lsmod` could not be executed'
+    _rule 'absent' '^freevxfs[[:space:]]' 'no '\''^freevxfs\\\\s'\'''
+    _source_end
+    _source p3 '/etc/modprobe.d' '/etc/modprobe.d is unavailable: /etc/modprobe.d'
+    _rule 'regex' '^install freevxfs /bin/(true|false)$' ''\''^install freevxfs /bin/(true|false)$'\'''
+    _source_end
+fi
+_emit '1.1.2' 1_1_2 'Ensure mounting of freevxfs filesystems is disabled' 'medium' 'echo '\''install freevxfs /bin/true'\'' >> /etc/modprobe.d/freevxfs.conf && rmmod freevxfs'
+
+# 3.2.1 Ensure packet redirect sending is disabled
+_begin
+if [ -z "$_blocked" ]; then
+    _source p4 '/proc/sys' '/proc/sys is unavailable: /proc/sys' c5 'Output of `sysctl -a`' '`sysctl -a` could not be executed'
+    _rule 'exact' 'net.ipv4.conf.all.send_redirects = 0' 'line '\''net.ipv4.conf.all.send_redirects = 0'\'''
+    _rule 'exact' 'net.ipv4.conf.default.send_redirects = 0' 'line '\''net.ipv4.conf.default.send_redirects = 0'\'''
+    _source_end
+fi
+_emit '3.2.1' 3_2_1 'Ensure packet redirect sending is disabled' 'medium' 'sysctl -w net.ipv4.conf.all.send_redirects=0 && sysctl -w net.ipv4.conf.default.send_redirects=0'
+
+# 3.2.2 Ensure IP forwarding is disabled
+_begin
+if [ -z "$_blocked" ]; then
+    _source p4 '/proc/sys' '/proc/sys is unavailable: /proc/sys' c5 'Output of `sysctl -a`' '`sysctl -a` could not be executed'
+    _rule 'exact' 'net.ipv4.ip_forward = 0' 'line '\''net.ipv4.ip_forward = 0'\'''
+    _source_end
+fi
+_emit '3.2.2' 3_2_2 'Ensure IP forwarding is disabled' 'medium' 'sysctl -w net.ipv4.ip_forward=0'
+
+# 3.3.1 Ensure source routed packets are not accepted
+_begin
+if [ -z "$_blocked" ]; then
+    _source p4 '/proc/sys' '/proc/sys is unavailable: /proc/sys' c5 'Output of `sysctl -a`' '`sysctl -a` could not be executed'
+    _rule 'exact' 'net.ipv4.conf.all.accept_source_route = 0' 'line '\''net.ipv4.conf.all.accept_source_route = 0'\'''
+    _rule 'exact' 'net.ipv4.conf.default.accept_source_route = 0' 'line '\''net.ipv4.conf.default.accept_source_route = 0'\'''
+    _source_end
+fi
+_emit '3.3.1' 3_3_1 'Ensure source routed packets are not accepted' 'medium' 'sysctl -w net.ipv4.conf.all.accept_source_route=0 && sysctl -w net.ipv4.conf.default.accept_source_route=0'
+
+# 3.3.2 Ensure ICMP redirects are not accepted
+_begin
+if [ -z "$_blocked" ]; then
+    _source p4 '/proc/sys' '/proc/sys is unavailable: /proc/sys' c5 'Output of `sysctl -a`' '`sysctl -a` could not be executed'
+    _rule 'exact' 'net.ipv4.conf.all.accept_redirects = 0' 'line '\''net.ipv4.conf.all.accept_redirects = 0'\'''
+    _rule 'exact' 'net.ipv4.conf.default.accept_redirects = 0' 'line '\''net.ipv4.conf.default.accept_redirects = 0'\'''
+    _source_end
+fi
+_emit '3.3.2' 3_3_2 'Ensure ICMP redirects are not accepted' 'medium' 'sysctl -w net.ipv4.conf.all.accept_redirects=0 && sysctl -w net.ipv4.conf.default.accept_redirects=0'
+
+# 3.5.1.1 Ensure ufw is installed and enabled
+_begin
+if [ -z "$_blocked" ]; then
+    _source c6 'Output of `if command -v ufw >/dev/null; then ufw status; fi`' '`if command -v ufw >/dev/null; then ufw status; fi` could not be executed'
+    _rule 'contains' 'Status: active' ''\''Status: active'\'''
+    _source_end
+fi
+_emit '3.5.1.1' 3_5_1_1 'Ensure ufw is installed and enabled' 'high' 'apt install ufw && ufw allow <ssh port>/tcp && ufw enable'
+
+# 5.4.1.1 Ensure password expiration is 365 days or less
+_begin
+if [ -z "$_blocked" ]; then
+    _source c7 'Output of `grep PASS_MAX_DAYS /etc/login.defs`' '`grep PASS_MAX_DAYS /etc/login.defs` could not be executed'
+    _rule 'numeric' '^[[:space:]]*PASS_MAX_DAYS[[:space:]]+([0-9]+)' '^\\s*PASS_MAX_DAYS\\s+(\\d+) <= 365' 's(^[[:space:]]*PASS_MAX_DAYS[[:space:]]+([0-9]+)).*$\2p' '<=' '365' ''\''^\\\\s*PASS_MAX_DAYS\\\\s+(\\\\d+)'\'' not found' 'no number captured by '\''^\\\\s*PASS_MAX_DAYS\\\\s+(\\\\d+)'\'''
+    _source_end
+fi
+_emit '5.4.1.1' 5_4_1_1 'Ensure password expiration is 365 days or less' 'high' 'sed -i '\''s/^PASS_MAX_DAYS.*/PASS_MAX_DAYS   365/'\'' /etc/login.defs'
+
+# 6.1.2 Ensure permissions on /etc/shadow are configured
+_begin
+if [ -z "$_blocked" ]; then
+    _source c8 'Output of `stat /etc/shadow`' '`stat /etc/shadow` could not be executed'
+    _rule 'contains' 'Access: (0000/----------)' ''\''Access: (0000/----------)'\'''
+    _source_end
+fi
+_emit '6.1.2' 6_1_2 'Ensure permissions on /etc/shadow are configured' 'critical' 'chmod 000 /etc/shadow'
+
+# 6.2.1 Ensure accounts in /etc/passwd use shadowed passwords
+_begin
+if [ -z "$_blocked" ]; then
+    _source c9 'Output of `awk -F: '\''($2 != \"x\") {print $1}'\'' /etc/passwd`' '`awk -F: '\''($2 != \"x\") {print $1}'\'' /etc/passwd` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.1' 6_2_1 'Ensure accounts in /etc/passwd use shadowed passwords' 'high' 'pwconv'
+
+# 6.2.2 Ensure /etc/shadow password fields are not empty
+_begin
+if [ -z "$_blocked" ]; then
+    _source c10 'Output of `awk -F: '\''($2 == \"\") {print $1}'\'' /etc/shadow`' '`awk -F: '\''($2 == \"\") {print $1}'\'' /etc/shadow` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.2' 6_2_2 'Ensure /etc/shadow password fields are not empty' 'critical' 'passwd -l <user>'
+
+# 6.2.3 Ensure all groups in /etc/passwd exist in /etc/group
+_begin
+if [ -z "$_blocked" ]; then
+    _source c11 'Output of `awk -F: '\''NR == FNR {gids[$3]; next} !($4 in gids) {print $4}'\'' /etc/group /etc/passwd`' '`awk -F: '\''NR == FNR {gids[$3]; next} !($4 in gids) {print $4}'\'' /etc/group /etc/passwd` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.3' 6_2_3 'Ensure all groups in /etc/passwd exist in /etc/group' 'medium' 'Create the missing groups or correct the accounts'\'' primary GID'
+
+# 6.2.4 Ensure shadow group is empty
+_begin
+if [ -z "$_blocked" ]; then
+    _source c12 'Output of `awk -F: '\''NR == FNR {if ($1 == \"shadow\") {gid = $3; if ($4 != \"\") print $4}; next} gid != \"\" && $4 == gid {print $1}'\'' /etc/group /etc/passwd`' '`awk -F: '\''NR == FNR {if ($1 == \"shadow\") {gid = $3; if ($4 != \"\") print $4}; next} gid != \"\" && $4 == gid {print $1}'\'' /etc/group /etc/passwd` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.4' 6_2_4 'Ensure shadow group is empty' 'high' 'sed -ri '\''s/(^shadow:[^:]*:[^:]*:)([^:]+$)/\\1/'\'' /etc/group'
+
+# 6.2.5 Ensure no duplicate UIDs exist
+_begin
+if [ -z "$_blocked" ]; then
+    _source c13 'Output of `cut -d: -f3 /etc/passwd | sort -n | uniq -d`' '`cut -d: -f3 /etc/passwd | sort -n | uniq -d` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.5' 6_2_5 'Ensure no duplicate UIDs exist' 'medium' 'usermod -u <uid> <user>'
+
+# 6.2.6 Ensure no duplicate GIDs exist
+_begin
+if [ -z "$_blocked" ]; then
+    _source c14 'Output of `cut -d: -f3 /etc/group | sort -n | uniq -d`' '`cut -d: -f3 /etc/group | sort -n | uniq -d` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.6' 6_2_6 'Ensure no duplicate GIDs exist' 'medium' 'groupmod -g <gid> <group>'
+
+# 6.2.7 Ensure no duplicate user names exist
+_begin
+if [ -z "$_blocked" ]; then
+    _source c15 'Output of `cut -d: -f1 /etc/passwd | sort | uniq -d`' '`cut -d: -f1 /etc/passwd | sort | uniq -d` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.7' 6_2_7 'Ensure no duplicate user names exist' 'medium' 'Rename or remove the duplicate accounts'
+
+# 6.2.8 Ensure no duplicate group names exist
+_begin
+if [ -z "$_blocked" ]; then
+    _source c16 'Output of `cut -d: -f1 /etc/group | sort | uniq -d`' '`cut -d: -f1 /etc/group | sort | uniq -d` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.8' 6_2_8 'Ensure no duplicate group names exist' 'medium' 'Rename or remove the duplicate groups'
+
+# 6.2.10 Ensure root is the only UID 0 account
+_begin
+if [ -z "$_blocked" ]; then
+    _source c17 'Output of `awk -F: '\''($3 == 0 && $1 != \"root\") {print $1}'\'' /etc/passwd`' '`awk -F: '\''($3 == 0 && $1 != \"root\") {print $1}'\'' /etc/passwd` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.10' 6_2_10 'Ensure root is the only UID 0 account' 'critical' 'Remove the accounts or assign them a new UID'
+
+# 6.2.11 Ensure local interactive user home directories exist
+_begin
+if [ -z "$_blocked" ]; then
+    _source c18 'Output of `awk -F: '\''$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 \" \" $3 \" \" $6}'\'' /etc/passwd | while read -r user uid dir; do [ -d \"$dir\" ] || echo \"$user $dir\"; done`' '`awk -F: '\''$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 \" \" $3 \" \" $6}'\'' /etc/passwd | while read -r user uid dir; do [ -d \"$dir\" ] || echo \"$user $dir\"; done` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.11' 6_2_11 'Ensure local interactive user home directories exist' 'medium' 'mkhomedir_helper <user>'
+
+# 6.2.12 Ensure local interactive users own their home directories
+_begin
+if [ -z "$_blocked" ]; then
+    _source c19 'Output of `awk -F: '\''$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 \" \" $3 \" \" $6}'\'' /etc/passwd | while read -r user uid dir; do [ -d \"$dir\" ] && [ \"$(stat -L -c %u \"$dir\")\" != \"$uid\" ] && echo \"$user $dir\"; done`' '`awk -F: '\''$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 \" \" $3 \" \" $6}'\'' /etc/passwd | while read -r user uid dir; do [ -d \"$dir\" ] && [ \"$(stat -L -c %u \"$dir\")\" != \"$uid\" ] && echo \"$user $dir\"; done` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.12' 6_2_12 'Ensure local interactive users own their home directories' 'medium' 'chown <user> <home>'
+
+# 6.2.13 Ensure local interactive user home directories are mode 750 or more restrictive
+_begin
+if [ -z "$_blocked" ]; then
+    _source c20 'Output of `awk -F: '\''$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 \" \" $3 \" \" $6}'\'' /etc/passwd | while read -r user uid dir; do [ -d \"$dir\" ] && [ -n \"$(find -L \"$dir\" -maxdepth 0 -perm /027)\" ] && echo \"$user $dir\"; done`' '`awk -F: '\''$7 !~ /(nologin|false|sync|shutdown|halt)$/ {print $1 \" \" $3 \" \" $6}'\'' /etc/passwd | while read -r user uid dir; do [ -d \"$dir\" ] && [ -n \"$(find -L \"$dir\" -maxdepth 0 -perm /027)\" ] && echo \"$user $dir\"; done` could not be executed'
+    _rule 'absent' '' 'no output'
+    _source_end
+fi
+_emit '6.2.13' 6_2_13 'Ensure local interactive user home directories are mode 750 or more restrictive' 'medium' 'chmod g-w,o-rwx <home>'
+
+# 3.5.1.7 Ensure ufw default deny firewall policy
+_begin
+_need '3.5.1.1' 3_5_1_1
+if [ -z "$_blocked" ]; then
+    _source c21 'Output of `ufw status verbose`' '`ufw status verbose` could not be executed'
+    _rule 'contains' 'deny (incoming)' ''\''deny (incoming)'\'''
+    _source_end
+fi
+_emit '3.5.1.7' 3_5_1_7 'Ensure ufw default deny firewall policy' 'high' 'ufw default deny incoming'
+
@@ -0,0 +1,5 @@
+from .store import ResultStore, compute_delta
+from .server import IngestServer
+from .client import IngestClient, UploadError
+
+__all__ = ['ResultStore', 'compute_delta', 'IngestServer', 'IngestClient', 'UploadError']
@@ -0,0 +1,108 @@
+"""
+HTTP client used by agents to upload audit results to the ingest server.
+"""
+
+import http.client
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from .store import compute_delta
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class UploadError(Exception):
+    """Raised when results could not be uploaded."""
+
+
+class IngestClient:
+    """Upload audit runs over pooled keep-alive connections with retry."""
+
+    def __init__(self, url: str, retries: int = 3, backoff: float = 0.5,
+                 timeout: float = 10.0, pool_size: int = 4):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported upload URL: {url}")
+        self.scheme = parts.scheme
+        self.netloc = parts.netloc
+        self.path = (parts.path.rstrip("/") or "") + "/ingest"
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self._pool: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def upload(self, audit_data: Dict, host: str, previous: Optional[Dict] = None) -> Dict:
+        """Upload a run, as a delta against previous when possible."""
+        payload = dict(audit_data, host=host)
+        delta = compute_delta(previous, payload)
+        if delta is not None:
+            status, body = self._send(delta)
+            if status != 409:
+                return body
+        return self._send(payload)[1]
+
+    def upload_batch(self, payloads: List[Dict]) -> Dict:
+        """Upload several full payloads in one request."""
+        return self._send(payloads)[1]
+
+    def close(self):
+        """Close all pooled connections."""
+        with self._lock:
+            for conn in self._pool:
+                conn.close()
+            self._pool = []
+
+    def _send(self, payload: Union[Dict, List[Dict]]) -> Tuple[int, Dict]:
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        last_error = ""
+
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * (2 ** (attempt - 1)))
+            conn = self._acquire()
+            try:
+                conn.request("POST", self.path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                last_error = str(e)
+                continue
+
+            self._release(conn, response)
+            if response.status in RETRY_STATUSES:
+                last_error = f"HTTP {response.status}"
+                retry_after = response.getheader("Retry-After")
+                if retry_after and retry_after.isdigit():
+                    time.sleep(int(retry_after))
+                continue
+            result = json.loads(data.decode('utf-8')) if data else {}
+            if response.status >= 400 and response.status != 409:
+                raise UploadError(f"HTTP {response.status}: {result.get('error', '')}")
+            return response.status, result
+
+        raise UploadError(f"Upload failed after {self.retries + 1} attempts: {last_error}")
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        with self._lock:
+            if self._pool:
+                return self._pool.pop()
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout)
+
+    def _release(self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse):
+        if response.will_close:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._pool) < self.pool_size:
+                self._pool.append(conn)
+                return
+        conn.close()
@@ -0,0 +1,256 @@
+"""
+Asyncio HTTP ingest server for fleet audit results.
+
+Agents POST audit runs (full or delta) to ``/ingest``. Payloads are queued
+on a bounded queue and a single writer task coalesces them into batched
+store writes. When the queue is full the server answers ``503`` with a
+``Retry-After`` header so agents back off. ``/summary`` returns a fleet
+summary and ``/health`` the queue state.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from .store import DeltaConflict, ResultStore
+
+logger = logging.getLogger(__name__)
+
+REASONS = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found",
+    405: "Method Not Allowed", 409: "Conflict", 411: "Length Required",
+    413: "Payload Too Large", 503: "Service Unavailable",
+}
+
+
+class IngestServer:
+    """Collect audit results from agents into a local store."""
+
+    def __init__(self, store: ResultStore, host: str = "127.0.0.1", port: int = 8765,
+                 queue_size: int = 1000, batch_size: int = 200,
+                 flush_interval: float = 1.0, max_body: int = 16 * 1024 * 1024):
+        self.store = store
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_body = max_body
+        # Payloads written to the store, and payloads the store rejected
+        self.ingested = 0
+        self.dropped = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Timestamp of each host's latest stored run, which a delta must
+        # name as its base to be accepted
+        self._bases: Dict[str, Optional[str]] = {}
+
+    async def start(self):
+        """Start listening and the batch writer."""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._bases = {host: run.get("timestamp") for host, run in self.store.hosts.items()}
+        self._writer_task = asyncio.ensure_future(self._write_batches())
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Stop accepting connections and flush everything still queued."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._writer_task is not None:
+            await self._queue.put(None)
+            await self._writer_task
+
+    def run(self):
+        """Serve until interrupted."""
+        async def serve():
+            await self.start()
+            try:
+                await asyncio.Event().wait()
+            finally:
+                await self.close()
+
+        try:
+            asyncio.run(serve())
+        except KeyboardInterrupt:
+            pass
+
+    async def _write_batches(self):
+        """Drain the queue and write each batch in one pass."""
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            batch = []
+            deadline = None
+            while len(batch) < self.batch_size:
+                timeout = None if deadline is None else deadline - loop.time()
+                if timeout is not None and timeout <= 0:
+                    break
+                try:
+                    payload = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if payload is None:
+                    stopping = True
+                    break
+                batch.append(payload)
+                if deadline is None:
+                    deadline = loop.time() + self.flush_interval
+
+            if batch:
+                self._apply(batch)
+
+    def _apply(self, batch: List[Dict]):
+        """Write a batch to the store; bad payloads are logged and dropped."""
+        hosts = set()
+        applied = 0
+        for payload in batch:
+            try:
+                hosts.add(self.store.apply(payload))
+            except DeltaConflict as e:
+                logger.warning("Dropping payload: %s", e)
+                self.dropped += 1
+                continue
+            except Exception:
+                logger.exception("Dropping payload for host %r", payload.get("host"))
+                self.dropped += 1
+                continue
+            applied += 1
+        try:
+            self.store.flush(hosts)
+        except Exception:
+            logger.exception("Failed to write %d hosts to the store", len(hosts))
+            self.dropped += applied
+            return
+        self.ingested += applied
+        for host in hosts:
+            self._bases[host] = self.store.hosts[host].get("timestamp")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, response, extra = self._route(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                self._write_response(writer, status, response, extra, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except _HTTPError as e:
+            self._write_response(writer, e.status, {"error": e.message}, {}, False)
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader
+                            ) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, path, _ = line.decode('latin-1').split(" ", 2)
+        except ValueError:
+            raise _HTTPError(400, "Malformed request line")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        body = b""
+        if method == "POST":
+            if "content-length" not in headers:
+                raise _HTTPError(411, "Content-Length required")
+            try:
+                length = int(headers["content-length"])
+            except ValueError:
+                length = -1
+            if length < 0:
+                raise _HTTPError(400, "Invalid Content-Length")
+            if length > self.max_body:
+                raise _HTTPError(413, "Payload too large")
+            body = await reader.readexactly(length)
+        return method, path, headers, body
+
+    def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict, Dict]:
+        if path == "/ingest":
+            if method != "POST":
+                return 405, {"error": "Use POST"}, {}
+            return self._ingest(body)
+        if path == "/summary" and method == "GET":
+            return 200, self.store.summary(), {}
+        if path == "/health" and method == "GET":
+            return 200, {"queued": self._queue.qsize(), "ingested": self.ingested,
+                         "dropped": self.dropped, "hosts": len(self.store.hosts)}, {}
+        return 404, {"error": f"No route for {method} {path}"}, {}
+
+    def _ingest(self, body: bytes) -> Tuple[int, Dict, Dict]:
+        try:
+            data = json.loads(body.decode('utf-8'))
+        except ValueError:
+            return 400, {"error": "Body is not valid JSON"}, {}
+
+        payloads = data if isinstance(data, list) else [data]
+        for payload in payloads:
+            error = _invalid(payload)
+            if error:
+                return 400, {"error": error}, {}
+            if payload.get("delta"):
+                if payload["host"] not in self._bases:
+                    return 409, {"error": f"No base run for host {payload['host']}"}, {}
+                if payload.get("base") != self._bases[payload["host"]]:
+                    return 409, {"error": f"Stale base run for host {payload['host']}"}, {}
+
+        if self._queue.maxsize - self._queue.qsize() < len(payloads):
+            return 503, {"error": "Ingest queue full"}, {"Retry-After": "1"}
+        for payload in payloads:
+            self._queue.put_nowait(payload)
+        return 202, {"accepted": len(payloads)}, {}
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, body: Dict,
+                        extra: Dict, keep_alive: bool):
+        data = json.dumps(body).encode('utf-8')
+        headers = {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(data)),
+            "Connection": "keep-alive" if keep_alive else "close",
+        }
+        headers.update(extra)
+        head = f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+        head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+        writer.write(head.encode('latin-1') + b"\r\n" + data)
+
+
+def _invalid(payload) -> Optional[str]:
+    """Return why an ingest payload is malformed, or None if it is well formed."""
+    if not isinstance(payload, dict):
+        return "Each payload must be an object"
+    if not isinstance(payload.get("host"), str) or not payload["host"]:
+        return "Each payload needs a 'host' string"
+    results = payload.get("results", [])
+    if not isinstance(results, list) or not all(
+            isinstance(r, dict) and isinstance(r.get("check_id"), str) for r in results):
+        return "'results' must be a list of objects with a 'check_id'"
+    removed = payload.get("removed", [])
+    if not isinstance(removed, list) or not all(isinstance(r, str) for r in removed):
+        return "'removed' must be a list of check IDs"
+    return None
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
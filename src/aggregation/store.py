@@ -0,0 +1,145 @@
+"""
+Local store for audit results collected from many hosts.
+"""
+
+import json
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9._-]')
+
+
+class DeltaConflict(Exception):
+    """Raised when a delta is not based on the host's stored run."""
+
+
+def host_filename(host: str) -> str:
+    """Return a filesystem-safe file name for a host's results."""
+    return _UNSAFE_CHARS.sub('_', host) + ".json"
+
+
+class ResultStore:
+    """Keep the latest audit run per host in memory and on disk."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hosts: Dict[str, Dict] = {}
+        os.makedirs(path, exist_ok=True)
+
+    def load(self) -> int:
+        """Load previously stored runs. Returns the number of hosts loaded."""
+        for name in os.listdir(self.path):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(self.path, name), 'r', encoding='utf-8') as f:
+                run = json.load(f)
+            if run.get("host"):
+                self.hosts[run["host"]] = run
+        return len(self.hosts)
+
+    def apply(self, payload: Dict) -> str:
+        """Merge one ingest payload into memory and return its host name.
+
+        A full payload replaces the host's run. A delta payload carries only
+        the results that changed and is merged into the stored run by check ID;
+        its ``base`` must be the timestamp of the stored run.
+        """
+        host = payload.get("host")
+        if not host:
+            raise ValueError("Payload is missing 'host'")
+
+        if not payload.get("delta"):
+            run = {k: v for k, v in payload.items() if k != "delta"}
+            self.hosts[host] = _summarize(run)
+            return host
+
+        base = self.hosts.get(host)
+        if base is None:
+            raise DeltaConflict(f"No stored run for host {host}")
+        if payload.get("base") != base.get("timestamp"):
+            raise DeltaConflict(f"Delta for host {host} is based on {payload.get('base')}, "
+                                f"stored run is from {base.get('timestamp')}")
+
+        changed = {r["check_id"]: r for r in payload.get("results", [])}
+        removed = set(payload.get("removed", []))
+        results = []
+        for result in base.get("results", []):
+            if result["check_id"] in removed:
+                continue
+            results.append(changed.pop(result["check_id"], result))
+        results.extend(changed.values())
+
+        run = {k: v for k, v in base.items() if k != "results"}
+        run.update({k: v for k, v in payload.items()
+                    if k not in ("delta", "base", "results", "removed")})
+        run["results"] = results
+        self.hosts[host] = _summarize(run)
+        return host
+
+    def flush(self, hosts: Iterable[str]):
+        """Write the current run of each host to disk atomically."""
+        for host in hosts:
+            path = os.path.join(self.path, host_filename(host))
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(self.hosts[host], separators=(',', ':'), ensure_ascii=False))
+            os.replace(tmp_path, path)
+
+    def summary(self, worst: int = 10) -> Dict:
+        """Summarize compliance across the fleet."""
+        scores = {host: run.get("compliance_score", 0.0) for host, run in self.hosts.items()}
+        failures: Dict[str, int] = {}
+        for run in self.hosts.values():
+            for result in run.get("results", []):
+                if result.get("status") == "fail":
+                    failures[result["check_id"]] = failures.get(result["check_id"], 0) + 1
+
+        return {
+            "hosts": len(scores),
+            "average_score": sum(scores.values()) / len(scores) if scores else 0.0,
+            "worst_hosts": sorted(scores.items(), key=lambda item: item[1])[:worst],
+            "top_failures": sorted(failures.items(), key=lambda item: -item[1])[:worst],
+        }
+
+
+def compute_delta(previous: Optional[Dict], current: Dict) -> Optional[Dict]:
+    """Build a delta payload from two runs of the same host.
+
+    The delta names the previous run's timestamp as its ``base``, so the
+    server can refuse it unless that is the run it stored. Returns None when
+    there is no usable previous run, in which case the full run should be
+    sent instead.
+    """
+    if (not previous or not previous.get("timestamp")
+            or previous.get("profile") != current.get("profile")):
+        return None
+
+    before = {r["check_id"]: r for r in previous.get("results", [])}
+    after = {r["check_id"]: r for r in current.get("results", [])}
+    changed: List[Dict] = [r for check_id, r in after.items()
+                           if _without_timestamp(before.get(check_id)) != _without_timestamp(r)]
+    removed: Set[str] = set(before) - set(after)
+
+    delta = {k: v for k, v in current.items() if k != "results"}
+    delta.update({"delta": True, "base": previous["timestamp"], "results": changed,
+                  "removed": sorted(removed)})
+    return delta
+
+
+def _without_timestamp(result: Optional[Dict]) -> Optional[Dict]:
+    if result is None:
+        return None
+    return {k: v for k, v in result.items() if k != "timestamp"}
+
+
+def _summarize(run: Dict) -> Dict:
+    """Recompute the counters of a run from its results."""
+    results = run.get("results", [])
+    passed = sum(1 for r in results if r.get("status") == "pass")
+    run["total_checks"] = len(results)
+    run["passed"] = passed
+    run["failed"] = sum(1 for r in results if r.get("status") == "fail")
+    run["skipped"] = sum(1 for r in results if r.get("status") == "skip")
+    run["compliance_score"] = (passed / len(results)) * 100 if results else 0.0
+    return run
@@ -1,3 +1,9 @@
 from .base_auditor import BaseAuditor, CheckResult
+from .scheduler import CheckScheduler, CheckSpec
+from .ubuntu_auditor import UbuntuAuditor
 
-__all__ = ['BaseAuditor', 'CheckResult']
+# Auditors by platform name, as reported by HostFacts.os_name or --os
+AUDITORS = {'ubuntu': UbuntuAuditor}
+
+__all__ = ['AUDITORS', 'BaseAuditor', 'CheckResult', 'CheckScheduler', 'CheckSpec',
+           'UbuntuAuditor']
@@ -0,0 +1,146 @@
+"""
+CIS section 6.2 user and group controls.
+
+All controls share one ``AccountDatabase``, so passwd, shadow and group are
+parsed once per run and home directories are stat'ed once for the three
+home directory controls.
+"""
+
+import functools
+import stat
+from typing import Dict, List, Optional, Tuple
+
+from .base_auditor import CheckResult
+from .scheduler import CheckSpec
+from ..probes.accounts import AccountDatabase
+from ..probes.kernel import ProbeUnavailable
+
+# Offenders listed in a failing result's description
+MAX_LISTED = 20
+
+# check_id -> (title, severity, finder method, remediation)
+ACCOUNT_CONTROLS: Dict[str, Tuple[str, str, str, str]] = {
+    "6.2.1": ("Ensure accounts in /etc/passwd use shadowed passwords", "high",
+              "unshadowed_accounts", "Run: sudo pwconv"),
+    "6.2.2": ("Ensure /etc/shadow password fields are not empty", "critical",
+              "empty_passwords", "Lock the listed accounts: sudo passwd -l <user>"),
+    "6.2.3": ("Ensure all groups in /etc/passwd exist in /etc/group", "medium",
+              "missing_groups", "Create the missing groups or correct the accounts' primary GID"),
+    "6.2.4": ("Ensure shadow group is empty", "high",
+              "shadow_group_members", "Remove all users from the shadow group: "
+              "sudo sed -ri 's/(^shadow:[^:]*:[^:]*:)([^:]+$)/\\1/' /etc/group"),
+    "6.2.5": ("Ensure no duplicate UIDs exist", "medium",
+              "duplicate_uids", "Assign each account a unique UID: sudo usermod -u <uid> <user>"),
+    "6.2.6": ("Ensure no duplicate GIDs exist", "medium",
+              "duplicate_gids", "Assign each group a unique GID: sudo groupmod -g <gid> <group>"),
+    "6.2.7": ("Ensure no duplicate user names exist", "medium",
+              "duplicate_user_names", "Rename or remove the duplicate accounts"),
+    "6.2.8": ("Ensure no duplicate group names exist", "medium",
+              "duplicate_group_names", "Rename or remove the duplicate groups"),
+    "6.2.10": ("Ensure root is the only UID 0 account", "critical",
+               "root_equivalents", "Remove the accounts or assign them a new UID"),
+    "6.2.11": ("Ensure local interactive user home directories exist", "medium",
+               "missing_homes", "Create the home directories: sudo mkhomedir_helper <user>"),
+    "6.2.12": ("Ensure local interactive users own their home directories", "medium",
+               "foreign_homes", "Run: sudo chown <user> <home>"),
+    "6.2.13": ("Ensure local interactive user home directories are mode 750 or more restrictive",
+               "medium", "permissive_homes", "Run: sudo chmod g-w,o-rwx <home>"),
+}
+
+
+class AccountChecks:
+    """Evaluate the account controls against a shared account database."""
+
+    def __init__(self, database: Optional[AccountDatabase] = None):
+        self.db = database or AccountDatabase()
+
+    def specs(self) -> List[CheckSpec]:
+        """Declare a check for every account control."""
+        return [
+            CheckSpec(check_id, functools.partial(self.result, check_id),
+                      title=title, severity=severity)
+            for check_id, (title, severity, _, _) in ACCOUNT_CONTROLS.items()
+        ]
+
+    def result(self, check_id: str) -> CheckResult:
+        """Return the result of one account control."""
+        title, severity, finder, remediation = ACCOUNT_CONTROLS[check_id]
+        try:
+            offenders = getattr(self, finder)()
+        except (ProbeUnavailable, OSError) as e:
+            return CheckResult(
+                check_id=check_id,
+                title=title,
+                status="error",
+                description=f"Error reading account database: {str(e)}",
+                severity=severity
+            )
+
+        if not offenders:
+            return CheckResult(
+                check_id=check_id,
+                title=title,
+                status="pass",
+                description="No offending accounts or groups found",
+                severity=severity
+            )
+
+        listed = "; ".join(offenders[:MAX_LISTED])
+        if len(offenders) > MAX_LISTED:
+            listed += f"; and {len(offenders) - MAX_LISTED} more"
+        return CheckResult(
+            check_id=check_id,
+            title=title,
+            status="fail",
+            description=f"{len(offenders)} found: {listed}",
+            remediation=remediation,
+            severity=severity
+        )
+
+    def unshadowed_accounts(self) -> List[str]:
+        return self.db.unshadowed_accounts()
+
+    def empty_passwords(self) -> List[str]:
+        return self.db.empty_passwords()
+
+    def missing_groups(self) -> List[str]:
+        return [f"GID {gid} ({', '.join(users)})" for gid, users in self.db.missing_groups().items()]
+
+    def shadow_group_members(self) -> List[str]:
+        group = self.db.group("shadow")
+        if group is None:
+            return []
+        primary = [a.name for a in self.db.accounts if a.gid == group.gid]
+        return list(dict.fromkeys(list(group.members) + primary))
+
+    def duplicate_uids(self) -> List[str]:
+        return [f"UID {uid} ({', '.join(users)})" for uid, users in self.db.duplicate_uids().items()]
+
+    def duplicate_gids(self) -> List[str]:
+        return [f"GID {gid} ({', '.join(groups)})" for gid, groups in self.db.duplicate_gids().items()]
+
+    def duplicate_user_names(self) -> List[str]:
+        return self.db.duplicate_user_names()
+
+    def duplicate_group_names(self) -> List[str]:
+        return self.db.duplicate_group_names()
+
+    def root_equivalents(self) -> List[str]:
+        return self.db.root_equivalents()
+
+    def missing_homes(self) -> List[str]:
+        stats = self.db.home_stats()
+        return [f"{a.name}: {a.home}" for a in self.db.interactive_accounts()
+                if stats[a.home] is None or not stat.S_ISDIR(stats[a.home].st_mode)]
+
+    def foreign_homes(self) -> List[str]:
+        stats = self.db.home_stats()
+        return [f"{a.name}: {a.home} is owned by UID {stats[a.home].st_uid}"
+                for a in self.db.interactive_accounts()
+                if stats[a.home] is not None and stats[a.home].st_uid != a.uid]
+
+    def permissive_homes(self) -> List[str]:
+        stats = self.db.home_stats()
+        return [f"{a.name}: {a.home} has mode {stat.S_IMODE(stats[a.home].st_mode):o}"
+                for a in self.db.interactive_accounts()
+                if stats[a.home] is not None and stats[a.home].st_mode & 0o027]
@@ -0,0 +1,108 @@
+"""
+Applicability predicates that prune controls before an audit runs.
+
+A profile check may declare ``applies_when``, a mapping of conditions that
+must all hold for the control to apply to a host::
+
+    "applies_when": {"level": 2, "systemd": true, "packages": ["auditd"]}
+
+Conditions:
+- ``level``: minimum audit level
+- ``os``: glob pattern, or list of patterns, matched against the detected
+  platform such as ``ubuntu_22_04``
+- ``systemd``, ``container``, ``bare_metal``: required value of the fact
+- ``packages``: packages that must be installed
+- ``paths``: paths that must exist
+
+Conditions on facts that cannot be determined, such as packages on a host
+without a dpkg database, never prune a control. Controls that depend on a
+pruned control are pruned with it.
+"""
+
+import fnmatch
+import os
+from typing import Dict, Iterable, List, Optional
+
+from ..probes.host import HostFacts
+
+CONDITIONS = ("level", "os", "systemd", "container", "bare_metal", "packages", "paths")
+
+
+def profile_predicates(profile_data: Dict) -> Dict[str, Dict]:
+    """Return the ``applies_when`` predicate of every profile check that has one.
+
+    Raises ValueError for unknown conditions.
+    """
+    predicates = {}
+    for check in profile_data.get("checks", []):
+        predicate = check.get("applies_when")
+        if not predicate:
+            continue
+        unknown = sorted(set(predicate) - set(CONDITIONS))
+        if unknown:
+            raise ValueError(f"{check['id']}: unknown applies_when condition {unknown[0]!r}")
+        predicates[check["id"]] = predicate
+    return predicates
+
+
+def _as_list(value) -> List[str]:
+    return [value] if isinstance(value, str) else list(value)
+
+
+class Applicability:
+    """Decide which controls apply to a host at an audit level."""
+
+    def __init__(self, facts: HostFacts, level: int = 1):
+        self.facts = facts
+        self.level = level
+
+    def reason(self, predicate: Dict) -> Optional[str]:
+        """Return why a predicate excludes the host, or None if it applies."""
+        facts = self.facts
+        if "level" in predicate and self.level < int(predicate["level"]):
+            return f"Level {int(predicate['level'])} control"
+        if "os" in predicate and not any(fnmatch.fnmatch(facts.os_id, pattern)
+                                         for pattern in _as_list(predicate["os"])):
+            return f"does not apply to {facts.os_id}"
+        for fact, present, absent in (
+                ("systemd", "requires systemd", "does not apply to systemd hosts"),
+                ("container", "applies only inside containers", "does not apply inside containers"),
+                ("bare_metal", "applies only to bare metal", "does not apply to bare metal")):
+            if fact in predicate and bool(predicate[fact]) != getattr(facts, fact):
+                return present if predicate[fact] else absent
+        if "packages" in predicate and facts.packages is not None:
+            missing = [name for name in _as_list(predicate["packages"])
+                       if name not in facts.packages]
+            if missing:
+                return f"requires package {', '.join(missing)}"
+        if "paths" in predicate:
+            missing = [path for path in _as_list(predicate["paths"])
+                       if not os.path.exists(facts.path(path.lstrip("/")))]
+            if missing:
+                return f"requires {', '.join(missing)}"
+        return None
+
+    def not_applicable(self, depends_on: Dict[str, Iterable[str]],
+                       predicates: Dict[str, Dict]) -> Dict[str, str]:
+        """Map every inapplicable check in depends_on to the reason it was pruned.
+
+        ``depends_on`` maps each planned check to its prerequisites.
+        """
+        pruned = {}
+        for check_id in depends_on:
+            predicate = predicates.get(check_id)
+            reason = self.reason(predicate) if predicate else None
+            if reason:
+                pruned[check_id] = f"Not applicable: {reason}"
+
+        changed = True
+        while changed:
+            changed = False
+            for check_id, deps in depends_on.items():
+                if check_id in pruned:
+                    continue
+                blocked = [dep for dep in deps if dep in pruned]
+                if blocked:
+                    pruned[check_id] = f"Not applicable: prerequisite {blocked[0]} does not apply"
+                    changed = True
+        return pruned
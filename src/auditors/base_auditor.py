@@ -3,9 +3,18 @@ Base auditor class for CIS Benchmark compliance checking.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
 from datetime import datetime
+import functools
 import json
+import platform
+
+from ..utils.profile_loader import check_ttls, load_profile
+
+if TYPE_CHECKING:
+    from .scheduler import CheckSpec
+    from ..probes.host import HostFacts
+    from ..utils.result_cache import ResultCache
 
 
 class CheckResult:
@@ -33,19 +42,40 @@ class CheckResult:
             "timestamp": self.timestamp.isoformat()
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CheckResult":
+        result = cls(
+            check_id=data["check_id"],
+            title=data.get("title", ""),
+            status=data.get("status", ""),
+            description=data.get("description", ""),
+            remediation=data.get("remediation", ""),
+            severity=data.get("severity", "medium")
+        )
+        if data.get("timestamp"):
+            result.timestamp = datetime.fromisoformat(data["timestamp"])
+        return result
+
 
 class BaseAuditor(ABC):
-    """Abstract base class for OS-specific auditors."""
+    """Abstract base class for OS-specific auditors.
+
+    ``facts`` is shared with platform detection so host facts are read once
+    per audit; by default they are read from the running system.
+    """
+
+    def __init__(self, profile: str, level: int = 1, max_workers: Optional[int] = None,
+                 cache: Optional["ResultCache"] = None, facts: Optional["HostFacts"] = None):
+        from ..probes.host import HostFacts
 
-    def __init__(self, profile: str, level: int = 1):
         self.profile = profile
         self.level = level
+        self.max_workers = max_workers
+        self.cache = cache
+        self.facts = facts or HostFacts()
         self.results: List[CheckResult] = []
-
-    @abstractmethod
-    def check_password_policy(self) -> CheckResult:
-        """Check password policy compliance."""
-        pass
+        self.not_applicable: Dict[str, str] = {}
+        self._profile_data: Optional[Dict] = None
 
     @abstractmethod
     def check_firewall_status(self) -> CheckResult:
@@ -67,16 +97,108 @@ class BaseAuditor(ABC):
         """Check service configurations."""
         pass
 
+    def get_check_specs(self) -> List["CheckSpec"]:
+        """Declare the checks to run and their prerequisites.
+
+        Subclasses override this to use CIS control IDs and to declare
+        dependencies between controls.
+        """
+        from .scheduler import CheckSpec
+
+        return [
+            CheckSpec("firewall_status", self.check_firewall_status),
+            CheckSpec("audit_logging", self.check_audit_logging),
+            CheckSpec("file_permissions", self.check_file_permissions),
+            CheckSpec("service_configuration", self.check_service_configuration),
+        ]
+
+    def get_profile_data(self) -> Dict:
+        """Return the profile definition, or an empty one if it does not exist."""
+        if self._profile_data is None:
+            try:
+                self._profile_data = load_profile(self.profile)
+            except FileNotFoundError:
+                self._profile_data = {"checks": []}
+        return self._profile_data
+
+    def get_profile_check_specs(self, exclude: Iterable[str] = ()) -> List["CheckSpec"]:
+        """Declare the profile's command- and probe-based checks, except those in exclude.
+
+        Subclasses call this to cover profile controls that have no native
+        implementation.
+        """
+        from .command_checks import CommandCheckRunner
+        from .scheduler import CheckSpec
+
+        excluded = set(exclude)
+        checks = [check for check in self.get_profile_data().get("checks", [])
+                  if check["id"] not in excluded
+                  and (check.get("audit_command") or check.get("probe"))]
+        runner = CommandCheckRunner(checks)
+        return [
+            CheckSpec(check["id"], functools.partial(runner.result, check["id"]),
+                      depends_on=check.get("depends_on"), title=check.get("title", ""),
+                      severity=check.get("severity", "medium"))
+            for check in checks
+        ]
+
+    def get_applicable_specs(self) -> List["CheckSpec"]:
+        """Declare the checks that apply to this host and audit level.
+
+        Pruned checks, and the checks that depend on them, are recorded in
+        ``not_applicable`` with the reason. No check runs while planning.
+        """
+        from .applicability import Applicability, profile_predicates
+
+        specs = self.get_check_specs()
+        applicability = Applicability(self.facts, self.level)
+        self.not_applicable = applicability.not_applicable(
+            {spec.check_id: spec.depends_on for spec in specs},
+            profile_predicates(self.get_profile_data()))
+        return [spec for spec in specs if spec.check_id not in self.not_applicable]
+
     def run_all_checks(self) -> List[CheckResult]:
-        """Run all compliance checks."""
-        self.results = []
-        self.results.append(self.check_password_policy())
-        self.results.append(self.check_firewall_status())
-        self.results.append(self.check_audit_logging())
-        self.results.append(self.check_file_permissions())
-        self.results.append(self.check_service_configuration())
+        """Run all applicable compliance checks in dependency order."""
+        from .scheduler import CheckScheduler
+
+        specs = self.get_applicable_specs()
+        if self.cache is not None:
+            ttls = self.get_cache_ttls()
+            for spec in specs:
+                spec.func = self._cached(spec.check_id, spec.func, ttls.get(spec.check_id, 0))
+
+        scheduler = CheckScheduler(specs, max_workers=self.max_workers)
+        self.results = scheduler.run()
+        if self.cache is not None:
+            self.cache.save()
         return self.results
 
+    def get_cache_ttls(self) -> Dict[str, float]:
+        """Return cache TTLs per check ID as declared in the profile."""
+        return check_ttls(self.get_profile_data())
+
+    def invalidate_cached(self, check_ids: Iterable[str]):
+        """Forget cached results of the given checks, after they were remediated."""
+        if self.cache is not None:
+            self.cache.invalidate(self._cache_key(check_id) for check_id in check_ids)
+            self.cache.save()
+
+    def _cache_key(self, check_id: str) -> str:
+        return f"{self.profile}:{check_id}"
+
+    def _cached(self, check_id: str, func, ttl: float):
+        """Wrap a check so fresh-enough results are served from the cache."""
+        key = self._cache_key(check_id)
+
+        def run() -> CheckResult:
+            result = self.cache.get(key, ttl)
+            if result is None:
+                result = func()
+                if result.status in ("pass", "fail"):
+                    self.cache.put(key, result)
+            return result
+        return run
+
     def get_compliance_score(self) -> float:
         """Calculate compliance score percentage."""
         if not self.results:
@@ -87,6 +209,7 @@ class BaseAuditor(ABC):
     def export_results(self, filepath: str):
         """Export results to JSON file."""
         data = {
+            "host": platform.node(),
             "profile": self.profile,
             "level": self.level,
             "compliance_score": self.get_compliance_score(),
@@ -94,6 +217,7 @@ class BaseAuditor(ABC):
             "passed": sum(1 for r in self.results if r.status == "pass"),
             "failed": sum(1 for r in self.results if r.status == "fail"),
             "skipped": sum(1 for r in self.results if r.status == "skip"),
+            "not_applicable": self.not_applicable,
             "timestamp": datetime.now().isoformat(),
             "results": [r.to_dict() for r in self.results]
         }
@@ -0,0 +1,146 @@
+"""
+Profile checks evaluated from command output or native probes.
+
+A check reads its ``probe`` (see ``probes.kernel``) when it declares one and
+its ``audit_command`` otherwise; single rules may name their own ``probe``.
+Every source is read once per run and all rules reading it are resolved
+together by one ``SourceMatcher``. If a probe is unavailable on the host,
+checks fall back to their ``audit_command``.
+"""
+
+import subprocess
+import threading
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .base_auditor import CheckResult
+from .matcher import Rule, SourceMatcher
+from ..probes.kernel import PROBES, KernelSnapshot, ProbeUnavailable
+
+# ("command", audit_command), ("probe", probe name) or ("fallback", audit_command)
+Source = Tuple[str, str]
+Outcome = Tuple[str, str]
+_STATUS_ORDER = {"pass": 0, "fail": 1, "error": 2}
+
+
+def run_shell(command: str, timeout: float) -> Tuple[int, str]:
+    """Run a shell command and return its exit code and standard output."""
+    result = subprocess.run(command, shell=True, capture_output=True, text=True,
+                            timeout=timeout)
+    return result.returncode, result.stdout
+
+
+def group_rules(checks: List[Dict]) -> Tuple[Dict[Source, List[Rule]], Dict[str, List[Source]]]:
+    """Group the rules of profile checks by the source they read.
+
+    Returns the rules per source and the sources of each check, in the
+    order they first appear. Rules reading a check-level probe are also
+    grouped under a ``("fallback", audit_command)`` source.
+    """
+    rules: Dict[Source, List[Rule]] = {}
+    check_sources: Dict[str, List[Source]] = {}
+    for check in checks:
+        sources = check_sources.setdefault(check["id"], [])
+        for rule in Rule.from_check(check):
+            probe = rule.probe or check.get("probe")
+            if probe and probe not in PROBES:
+                raise ValueError(f"Check {check['id']}: unknown probe {probe!r}")
+            source = ("probe", probe) if probe else ("command", check["audit_command"])
+            rules.setdefault(source, []).append(rule)
+            if source not in sources:
+                sources.append(source)
+            if probe and not rule.probe and check.get("audit_command"):
+                rules.setdefault(("fallback", check["audit_command"]), []).append(rule)
+    return rules, check_sources
+
+
+def probe_keys(rules: List[Rule]) -> Optional[Set[str]]:
+    """Return the exact keys a probe must read for rules, or None for all of them."""
+    keys = {rule.key for rule in rules}
+    if None in keys or any(rule.key_is_prefix for rule in rules):
+        return None
+    return keys
+
+
+class CommandCheckRunner:
+    """Read each distinct source once and resolve every check that depends on it."""
+
+    def __init__(self, checks: List[Dict], timeout: float = 60,
+                 run_command: Callable[[str, float], Tuple[int, str]] = run_shell,
+                 snapshot: Optional[KernelSnapshot] = None):
+        self.timeout = timeout
+        self.run_command = run_command
+        self.snapshot = snapshot or KernelSnapshot()
+        self.checks = {check["id"]: check for check in checks}
+        rules, self._check_sources = group_rules(checks)
+        self._matchers = {source: SourceMatcher(group) for source, group in rules.items()}
+        self._outcomes: Dict[Source, Dict[str, Outcome]] = {}
+        self._locks = {source: threading.Lock() for source in rules}
+
+    def result(self, check_id: str) -> CheckResult:
+        """Return the result of a profile check, reading its sources if needed."""
+        check = self.checks[check_id]
+        status, detail = "pass", ""
+        for source in self._check_sources[check_id]:
+            outcome = self._outcome(source).get(check_id)
+            if outcome is None:
+                continue
+            if not detail or _STATUS_ORDER[outcome[0]] > _STATUS_ORDER[status]:
+                status, detail = outcome
+
+        return CheckResult(
+            check_id=check_id,
+            title=check.get("title", ""),
+            status=status,
+            description=detail,
+            remediation=check.get("remediation", "") if status == "fail" else "",
+            severity=check.get("severity", "medium")
+        )
+
+    def _outcome(self, source: Source) -> Dict[str, Outcome]:
+        with self._locks[source]:
+            if source not in self._outcomes:
+                self._outcomes[source] = self._evaluate(source)
+        return self._outcomes[source]
+
+    def _evaluate(self, source: Source) -> Dict[str, Outcome]:
+        kind, name = source
+        matcher = self._matchers[source]
+        check_ids = {rule.check_id for rule in matcher.rules}
+
+        if kind == "probe":
+            label = PROBES[name][0]
+            try:
+                output = self.snapshot.read(name, probe_keys(matcher.rules))
+            except (ProbeUnavailable, OSError) as e:
+                return self._probe_unavailable(check_ids, label, e)
+        else:
+            label = f"Output of `{name}`"
+            try:
+                returncode, output = self.run_command(name, self.timeout)
+            except (OSError, subprocess.SubprocessError) as e:
+                return {check_id: ("error", f"Error running `{name}`: {str(e)}")
+                        for check_id in check_ids}
+            if returncode in (126, 127):
+                return {check_id: ("error", f"`{name}` could not be executed")
+                        for check_id in check_ids}
+
+        outcomes = {}
+        for check_id, (passed, detail) in matcher.evaluate(output).items():
+            if passed:
+                outcomes[check_id] = ("pass", f"{label} satisfies {detail}")
+            else:
+                outcomes[check_id] = ("fail", f"{label} does not satisfy {detail}")
+        return outcomes
+
+    def _probe_unavailable(self, check_ids, label: str, error: Exception) -> Dict[str, Outcome]:
+        outcomes = {}
+        for check_id in check_ids:
+            command = self.checks[check_id].get("audit_command")
+            fallback = ("fallback", command)
+            if command and fallback in self._matchers:
+                outcome = self._outcome(fallback).get(check_id)
+                if outcome is not None:
+                    outcomes[check_id] = outcome
+                    continue
+            outcomes[check_id] = ("error", f"{label} is unavailable: {str(error)}")
+        return outcomes
@@ -0,0 +1,218 @@
+"""
+Multi-pattern matching of profile ``expected_result`` rules over command output.
+
+All rules that inspect the same output are resolved together. The output is
+indexed once by the leading field of each line (the sysctl key, module name,
+unit name, ``login.defs`` setting, ...). Rules anchored to the start of a line
+are then answered by a hash lookup (or a sorted-key range lookup when only a
+prefix of the field is known) plus a match on the few candidate lines, so the
+cost grows with the size of the output rather than with output size times
+rule count. Only unanchored rules search the whole output.
+
+``contains`` rules are deliberately not folded into one combined regex: an
+alternation of literals is tried branch by branch at every position by the
+``re`` engine, which measures several times slower than one C substring
+search per distinct pattern (see ``benchmarks/matcher.py``). Each distinct
+literal is searched for once, however many checks share it.
+
+Supported rule types:
+
+* ``contains`` - the pattern appears literally (default for a non-empty
+  ``expected_result``)
+* ``exact``    - a line of output equals the pattern, ignoring surrounding
+  whitespace
+* ``regex``    - the regular expression matches (``^``/``$`` match per line)
+* ``numeric``  - the first capture group of ``pattern`` is a number that
+  satisfies ``op`` against ``value``
+* ``absent``   - the regular expression does not match; an empty pattern
+  means the output must be empty (default for an empty ``expected_result``)
+"""
+
+import bisect
+import operator
+import re
+from typing import Dict, List, Optional, Tuple
+
+OPERATORS = {
+    "<": operator.lt, "<=": operator.le, "==": operator.eq,
+    "!=": operator.ne, ">=": operator.ge, ">": operator.gt,
+}
+RULE_TYPES = ("contains", "exact", "regex", "numeric", "absent")
+
+# Leading field of a line: everything up to whitespace, '=' or ':'
+_LEADING_FIELD = re.compile(r'^[ \t]*([^\s=:]+)', re.MULTILINE)
+_FIELD_END = re.compile(r'[\s=:]')
+# Regex elements that guarantee the leading field has ended
+_FIELD_TERMINATORS = ("\\s", " ", "\t", "=", ":", "$")
+_REGEX_META = set(".^$*+?{}[]()|\\")
+_ALTERNATION = re.compile(r'(?<!\\)\|')
+
+
+class Rule:
+    """A single expectation about a command's output."""
+
+    def __init__(self, check_id: str, type: str, pattern: str = "",
+                 op: str = "==", value: Optional[float] = None, probe: Optional[str] = None):
+        if type not in RULE_TYPES:
+            raise ValueError(f"Check {check_id}: unknown match type {type!r}")
+        if type == "numeric" and (op not in OPERATORS or value is None):
+            raise ValueError(f"Check {check_id}: numeric match needs op and value")
+        self.check_id = check_id
+        self.type = type
+        self.pattern = pattern
+        self.op = op
+        self.value = value
+        # Native probe this rule reads instead of the check's default source
+        self.probe = probe
+        self.compiled = None
+        if type in ("regex", "numeric") or (type == "absent" and pattern):
+            self.compiled = re.compile(pattern, re.MULTILINE)
+        # Leading field of matching lines, or only its prefix if key_is_prefix
+        self.key, self.key_is_prefix = self._leading_key()
+
+    @classmethod
+    def from_check(cls, check: Dict) -> List["Rule"]:
+        """Build the rules of a profile check from ``match`` or ``expected_result``."""
+        match = check.get("match")
+        if match is None:
+            expected = check.get("expected_result", "")
+            match = {"type": "contains", "pattern": expected} if expected else {"type": "absent"}
+        specs = match if isinstance(match, list) else [match]
+        return [cls(check["id"], spec.get("type", "contains"), spec.get("pattern", ""),
+                    spec.get("op", "=="), spec.get("value"), spec.get("probe"))
+                for spec in specs]
+
+    def describe(self) -> str:
+        if self.type == "numeric":
+            return f"{self.pattern} {self.op} {self.value:g}"
+        if self.type == "absent":
+            return f"no {self.pattern!r}" if self.pattern else "no output"
+        if self.type == "exact":
+            return f"line {self.pattern!r}"
+        return repr(self.pattern)
+
+    def _leading_key(self) -> Tuple[Optional[str], bool]:
+        """Return the leading field (or its prefix) every matching line starts with."""
+        if self.type == "exact":
+            stripped = self.pattern.strip()
+            return (_FIELD_END.split(stripped, 1)[0] if stripped else None), False
+        if self.compiled is None or not self.pattern.startswith("^") \
+                or _ALTERNATION.search(self.pattern):
+            return None, False
+
+        pattern = self.pattern[1:]
+        for prefix in ("\\s*", "[ \\t]*"):
+            if pattern.startswith(prefix):
+                pattern = pattern[len(prefix):]
+
+        literal = []
+        i = 0
+        while i < len(pattern):
+            char = pattern[i]
+            if char == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+                literal.append(pattern[i + 1])
+                i += 2
+            elif char in _REGEX_META:
+                break
+            else:
+                literal.append(char)
+                i += 1
+        literal = "".join(literal)
+        rest = pattern[i:]
+
+        if rest[:1] in ("?", "*", "+", "{"):
+            # The last literal character is optional or repeated
+            literal = literal[:-1]
+        field = _FIELD_END.split(literal, 1)[0]
+        if not field:
+            return None, False
+        if field != literal:
+            return field, False
+        # The literal is the whole field only if the regex ends it right after
+        if rest.startswith(_FIELD_TERMINATORS) and not rest.startswith(("\\s*", "\\s?")):
+            return field, False
+        return field, True
+
+
+class SourceMatcher:
+    """Evaluate every rule that targets one output source together."""
+
+    def __init__(self, rules: List[Rule]):
+        self.rules = rules
+        self._indexed = any(rule.key is not None for rule in rules)
+        self._prefixed = any(rule.key_is_prefix for rule in rules)
+
+    def evaluate(self, output: str) -> Dict[str, Tuple[bool, str]]:
+        """Return ``{check_id: (passed, detail)}``; a check passes if all its rules do."""
+        index = self._index(output) if self._indexed else {}
+        keys = sorted(index) if self._prefixed else []
+        found: Dict[str, bool] = {}
+        outcome: Dict[str, Tuple[bool, str]] = {}
+
+        for rule in self.rules:
+            if rule.type == "contains":
+                if rule.pattern not in found:
+                    found[rule.pattern] = rule.pattern in output
+                passed, detail = found[rule.pattern], rule.describe()
+            else:
+                passed, detail = self._evaluate(rule, output, index, keys)
+            previous = outcome.get(rule.check_id)
+            if previous is None or (previous[0] and not passed):
+                outcome[rule.check_id] = (passed, detail)
+        return outcome
+
+    @staticmethod
+    def _index(output: str) -> Dict[str, List[int]]:
+        """Map each leading field to the start offsets of the lines it begins."""
+        index: Dict[str, List[int]] = {}
+        for match in _LEADING_FIELD.finditer(output):
+            index.setdefault(match.group(1), []).append(match.start())
+        return index
+
+    def _evaluate(self, rule: Rule, output: str, index: Dict[str, List[int]],
+                  keys: List[str]) -> Tuple[bool, str]:
+        if rule.type == "absent" and not rule.pattern:
+            return not output.strip(), rule.describe()
+        if rule.type == "exact":
+            expected = rule.pattern.strip()
+            for pos in index.get(rule.key, ()):
+                end = output.find("\n", pos)
+                if output[pos:end if end >= 0 else None].strip() == expected:
+                    return True, rule.describe()
+            return False, rule.describe()
+
+        match = self._first_match(rule, output, index, keys)
+        if rule.type == "absent":
+            return match is None, rule.describe()
+        if rule.type == "regex":
+            return match is not None, rule.describe()
+        return self._numeric(rule, match)
+
+    @staticmethod
+    def _first_match(rule: Rule, output: str, index: Dict[str, List[int]], keys: List[str]):
+        if rule.key is None:
+            return rule.compiled.search(output)
+        if rule.key_is_prefix:
+            positions = []
+            i = bisect.bisect_left(keys, rule.key)
+            while i < len(keys) and keys[i].startswith(rule.key):
+                positions.extend(index[keys[i]])
+                i += 1
+            positions.sort()
+        else:
+            positions = index.get(rule.key, ())
+        for pos in positions:
+            match = rule.compiled.match(output, pos)
+            if match:
+                return match
+        return None
+
+    @staticmethod
+    def _numeric(rule: Rule, match) -> Tuple[bool, str]:
+        if match is None:
+            return False, f"{rule.pattern!r} not found"
+        try:
+            actual = float(match.group(1))
+        except (IndexError, TypeError, ValueError):
+            return False, f"no number captured by {rule.pattern!r}"
+        return OPERATORS[rule.op](actual, rule.value), f"value {actual:g}, expected {rule.op} {rule.value:g}"
@@ -0,0 +1,104 @@
+"""
+Dependency-aware scheduler for CIS checks.
+
+Checks declare the controls they depend on. The scheduler orders them into
+topological waves, runs each wave in parallel and marks dependents of a
+non-passing check as skipped instead of probing a subsystem that is absent.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .base_auditor import CheckResult
+
+
+class CheckSpec:
+    """Declares a single check and the controls it depends on."""
+
+    def __init__(self, check_id: str, func: Callable[[], CheckResult],
+                 depends_on: Optional[Iterable[str]] = None,
+                 title: str = "", severity: str = "medium"):
+        self.check_id = check_id
+        self.func = func
+        self.depends_on = list(depends_on or [])
+        self.title = title or check_id
+        self.severity = severity
+
+
+class CheckScheduler:
+    """Run checks as a DAG of topological waves."""
+
+    def __init__(self, specs: List[CheckSpec], max_workers: Optional[int] = None):
+        self.specs = specs
+        self.max_workers = max_workers
+
+    def build_waves(self) -> List[List[CheckSpec]]:
+        """Group checks into waves whose prerequisites are all in earlier waves."""
+        by_id: Dict[str, CheckSpec] = {}
+        for spec in self.specs:
+            if spec.check_id in by_id:
+                raise ValueError(f"Duplicate check id: {spec.check_id}")
+            by_id[spec.check_id] = spec
+
+        for spec in self.specs:
+            for dep in spec.depends_on:
+                if dep not in by_id:
+                    raise ValueError(f"Check {spec.check_id} depends on unknown check {dep}")
+
+        remaining = {spec.check_id: set(spec.depends_on) for spec in self.specs}
+        waves: List[List[CheckSpec]] = []
+        done = set()
+        while remaining:
+            ready = [spec for spec in self.specs
+                     if spec.check_id in remaining and remaining[spec.check_id] <= done]
+            if not ready:
+                cycle = ", ".join(sorted(remaining))
+                raise ValueError(f"Dependency cycle between checks: {cycle}")
+            for spec in ready:
+                del remaining[spec.check_id]
+                done.add(spec.check_id)
+            waves.append(ready)
+        return waves
+
+    def run(self) -> List[CheckResult]:
+        """Run all checks and return results in declaration order."""
+        results: Dict[str, CheckResult] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for wave in self.build_waves():
+                pending = {}
+                for spec in wave:
+                    blocked = [dep for dep in spec.depends_on if results[dep].status != "pass"]
+                    if blocked:
+                        results[spec.check_id] = self._skip(spec, blocked, results)
+                    else:
+                        pending[spec.check_id] = executor.submit(self._execute, spec)
+                for check_id, future in pending.items():
+                    results[check_id] = future.result()
+
+        return [results[spec.check_id] for spec in self.specs]
+
+    @staticmethod
+    def _execute(spec: CheckSpec) -> CheckResult:
+        try:
+            return spec.func()
+        except Exception as e:
+            return CheckResult(
+                check_id=spec.check_id,
+                title=spec.title,
+                status="error",
+                description=f"Error running check: {str(e)}",
+                severity=spec.severity
+            )
+
+    @staticmethod
+    def _skip(spec: CheckSpec, blocked: List[str],
+              results: Dict[str, CheckResult]) -> CheckResult:
+        reasons = ", ".join(f"{dep} ({results[dep].status})" for dep in blocked)
+        return CheckResult(
+            check_id=spec.check_id,
+            title=spec.title,
+            status="skip",
+            description=f"Skipped: prerequisite check did not pass: {reasons}",
+            severity=spec.severity
+        )
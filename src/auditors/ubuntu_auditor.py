@@ -4,51 +4,55 @@ Ubuntu Linux CIS Benchmark auditor.
 
 import subprocess
 import os
+from typing import TYPE_CHECKING, List, Optional
+from .account_checks import AccountChecks
 from .base_auditor import BaseAuditor, CheckResult
+from .scheduler import CheckSpec
+
+if TYPE_CHECKING:
+    from ..probes.host import HostFacts
+    from ..utils.result_cache import ResultCache
 
 
 class UbuntuAuditor(BaseAuditor):
     """Ubuntu-specific CIS Benchmark auditor."""
 
-    def __init__(self, profile: str = "ubuntu_22_04", level: int = 1):
-        super().__init__(profile, level)
+    def __init__(self, profile: str = "ubuntu_22_04", level: int = 1,
+                 max_workers: Optional[int] = None, cache: Optional["ResultCache"] = None,
+                 facts: Optional["HostFacts"] = None):
+        super().__init__(profile, level, max_workers, cache, facts)
         self.os_name = "Ubuntu"
 
-    def check_password_policy(self) -> CheckResult:
-        """Check password policy configuration."""
-        try:
-            # Check /etc/login.defs for password settings
-            with open('/etc/login.defs', 'r') as f:
-                content = f.read()
-                if 'PASS_MAX_DAYS' in content and 'PASS_MIN_DAYS' in content:
-                    return CheckResult(
-                        check_id="5.4.1.1",
-                        title="Ensure password expiration is configured",
-                        status="pass",
-                        description="Password expiration policy is properly configured",
-                        severity="high"
-                    )
-        except Exception as e:
-            return CheckResult(
-                check_id="5.4.1.1",
-                title="Ensure password expiration is configured",
-                status="error",
-                description=f"Error checking password policy: {str(e)}",
-                severity="high"
-            )
+    def get_check_specs(self) -> List[CheckSpec]:
+        """Declare Ubuntu checks keyed by CIS control ID.
 
-        return CheckResult(
-            check_id="5.4.1.1",
-            title="Ensure password expiration is configured",
-            status="fail",
-            description="Password expiration policy not properly configured",
-            remediation="Edit /etc/login.defs and set PASS_MAX_DAYS, PASS_MIN_DAYS",
-            severity="high"
-        )
+        Controls implemented natively below and the section 6.2 account
+        controls take precedence; the remaining profile controls are
+        evaluated from their audit commands.
+        """
+        specs = [
+            CheckSpec("3.5.1.1", self.check_firewall_status,
+                      title="Ensure ufw is installed and enabled", severity="high"),
+            CheckSpec("3.5.1.7", self.check_firewall_default_deny, depends_on=["3.5.1.1"],
+                      title="Ensure ufw default deny firewall policy", severity="high"),
+            CheckSpec("4.1.1.1", self.check_audit_logging,
+                      title="Ensure auditd is installed", severity="medium"),
+            CheckSpec("4.1.1.2", self.check_auditd_service, depends_on=["4.1.1.1"],
+                      title="Ensure auditd service is enabled and active", severity="medium"),
+            CheckSpec("6.1.2", self.check_file_permissions,
+                      title="Ensure permissions on critical files are configured", severity="high"),
+            CheckSpec("2.1.1", self.check_service_configuration,
+                      title="Ensure unnecessary services are not running", severity="medium"),
+        ]
+        specs += AccountChecks().specs()
+        return specs + self.get_profile_check_specs(exclude=[spec.check_id for spec in specs])
 
     def check_firewall_status(self) -> CheckResult:
-        """Check UFW firewall status."""
+        """Check UFW firewall status; a missing ufw package or binary fails the control."""
+        packages = self.facts.packages
         try:
+            if packages is not None and "ufw" not in packages:
+                raise FileNotFoundError("ufw")
             result = subprocess.run(['ufw', 'status'], capture_output=True, text=True)
             if 'Status: active' in result.stdout:
                 return CheckResult(
@@ -58,6 +62,15 @@ class UbuntuAuditor(BaseAuditor):
                     description="UFW firewall is active and enabled",
                     severity="high"
                 )
+        except FileNotFoundError:
+            return CheckResult(
+                check_id="3.5.1.1",
+                title="Ensure ufw is installed and enabled",
+                status="fail",
+                description="UFW is not installed",
+                remediation="Run: sudo apt install ufw && sudo ufw allow OpenSSH && sudo ufw enable",
+                severity="high"
+            )
         except Exception as e:
             return CheckResult(
                 check_id="3.5.1.1",
@@ -72,7 +85,37 @@ class UbuntuAuditor(BaseAuditor):
             title="Ensure ufw is installed and enabled",
             status="fail",
             description="UFW firewall is not active",
-            remediation="Run: sudo ufw enable",
+            remediation="Run: sudo ufw allow OpenSSH && sudo ufw enable",
+            severity="high"
+        )
+
+    def check_firewall_default_deny(self) -> CheckResult:
+        """Check UFW default incoming policy."""
+        try:
+            result = subprocess.run(['ufw', 'status', 'verbose'], capture_output=True, text=True)
+            if 'deny (incoming)' in result.stdout or 'reject (incoming)' in result.stdout:
+                return CheckResult(
+                    check_id="3.5.1.7",
+                    title="Ensure ufw default deny firewall policy",
+                    status="pass",
+                    description="UFW denies incoming traffic by default",
+                    severity="high"
+                )
+        except Exception as e:
+            return CheckResult(
+                check_id="3.5.1.7",
+                title="Ensure ufw default deny firewall policy",
+                status="error",
+                description=f"Error checking firewall policy: {str(e)}",
+                severity="high"
+            )
+
+        return CheckResult(
+            check_id="3.5.1.7",
+            title="Ensure ufw default deny firewall policy",
+            status="fail",
+            description="UFW does not deny incoming traffic by default",
+            remediation="Run: sudo ufw default deny incoming",
             severity="high"
         )
 
@@ -96,6 +139,39 @@ class UbuntuAuditor(BaseAuditor):
             severity="medium"
         )
 
+    def check_auditd_service(self) -> CheckResult:
+        """Check that the auditd service is enabled and active."""
+        try:
+            enabled = subprocess.run(['systemctl', 'is-enabled', 'auditd'],
+                                     capture_output=True, text=True)
+            active = subprocess.run(['systemctl', 'is-active', 'auditd'],
+                                    capture_output=True, text=True)
+            if enabled.stdout.strip() == 'enabled' and active.stdout.strip() == 'active':
+                return CheckResult(
+                    check_id="4.1.1.2",
+                    title="Ensure auditd service is enabled and active",
+                    status="pass",
+                    description="Auditd service is enabled and running",
+                    severity="medium"
+                )
+        except Exception as e:
+            return CheckResult(
+                check_id="4.1.1.2",
+                title="Ensure auditd service is enabled and active",
+                status="error",
+                description=f"Error checking auditd service: {str(e)}",
+                severity="medium"
+            )
+
+        return CheckResult(
+            check_id="4.1.1.2",
+            title="Ensure auditd service is enabled and active",
+            status="fail",
+            description="Auditd service is not enabled and active",
+            remediation="Run: sudo systemctl --now enable auditd",
+            severity="medium"
+        )
+
     def check_file_permissions(self) -> CheckResult:
         """Check critical file permissions."""
         critical_files = ['/etc/passwd', '/etc/shadow', '/etc/group']
@@ -5,11 +5,45 @@ Command-line interface for CIS Benchmark Compliance Checker.
 import click
 import json
 import os
+from datetime import datetime
 from pathlib import Path
-from .auditors.ubuntu_auditor import UbuntuAuditor
+from .auditors import AUDITORS
 from .reports.html_reporter import HTMLReporter
 from .reports.json_reporter import JSONReporter
 from .reports.csv_reporter import CSVReporter
+from .reports.compact_reporter import CompactReporter, load_audit_data
+from .reports.fleet_reporter import FleetReporter, iter_runs
+from .aggregation import IngestClient, IngestServer, ResultStore, UploadError
+from .compiler import TARGETS
+from .probes import HostFacts
+from .remediation import (RemediationEngine, RemediationError, RemediationPlan,
+                          checks_to_remediate)
+from .utils.profile_loader import load_profile, profile_path
+from .utils.result_cache import ResultCache
+
+# --os names of detected platforms whose name differs
+OS_NAMES = {'amzn': 'amazon-linux'}
+OS_CHOICES = ['ubuntu', 'rhel', 'amazon-linux', 'windows', 'macos']
+
+
+def detect_os_type(facts: HostFacts) -> str:
+    """Return the --os name of the running platform."""
+    return OS_NAMES.get(facts.os_name, facts.os_name)
+
+
+def create_auditor(os_type, profile, level, facts, cache=None):
+    """Build the auditor for os_type, using the detected profile when none is given."""
+    if os_type not in AUDITORS:
+        raise click.ClickException(
+            f"No auditor for {os_type} yet (supported: {', '.join(sorted(AUDITORS))}); "
+            f"use --os to choose a supported platform")
+    if not profile and os.path.isfile(profile_path(facts.os_id)):
+        profile = facts.os_id
+
+    auditor_class = AUDITORS[os_type]
+    if profile:
+        return auditor_class(profile, level, cache=cache, facts=facts)
+    return auditor_class(level=level, cache=cache, facts=facts)
 
 
 @click.group()
@@ -20,39 +54,58 @@ def main():
 
 
 @main.command()
-@click.option('--os', 'os_type', type=click.Choice(['ubuntu', 'rhel', 'amazon-linux', 'windows', 'macos']),
+@click.option('--os', 'os_type', type=click.Choice(OS_CHOICES),
               help='Operating system to audit')
 @click.option('--profile', help='CIS profile to use')
 @click.option('--level', type=click.IntRange(1, 2), default=1,
               help='CIS Level (1 or 2)')
 @click.option('--output', type=click.Path(), default='./reports',
               help='Output directory for reports')
-@click.option('--format', 'output_format', type=click.Choice(['html', 'json', 'csv']),
+@click.option('--format', 'output_format', type=click.Choice(['html', 'json', 'csv', 'compact']),
               default='html', multiple=True, help='Report format(s)')
+@click.option('--upload', 'upload_url', help='Upload results to a cis-checker serve URL')
+@click.option('--max-age', type=click.FloatRange(min=0), default=None,
+              help='Maximum age in seconds of cached results (0 disables the cache)')
 @click.option('--verbose', is_flag=True, help='Verbose output')
-def audit(os_type, profile, level, output, output_format, verbose):
+def audit(os_type, profile, level, output, output_format, upload_url, max_age, verbose):
     """Run CIS compliance audit."""
     click.echo("🔍 Starting CIS Benchmark Compliance Audit...")
-    click.echo(f"   OS: {os_type or 'auto-detect'}")
+    facts = HostFacts()
+    if not os_type:
+        os_type = detect_os_type(facts)
+        click.echo(f"   OS: {os_type} (detected {facts.os_id})")
+    else:
+        click.echo(f"   OS: {os_type}")
     click.echo(f"   Level: {level}")
     click.echo(f"   Output: {output}")
 
+    cache = ResultCache(max_age=max_age)
+    auditor = create_auditor(os_type, profile, level, facts, cache)
+
     # Create output directory
     os.makedirs(output, exist_ok=True)
 
-    # For demo, we'll use Ubuntu auditor
     if verbose:
         click.echo("\n📊 Running checks...")
 
-    auditor = UbuntuAuditor(profile or "ubuntu_22_04", level)
-    results = auditor.run_all_checks()
+    try:
+        results = auditor.run_all_checks()
+    except ValueError as e:
+        raise click.ClickException(f"Invalid profile {auditor.profile}: {e}")
 
-    # Export to JSON first
+    # Keep the previous run so uploads can send only what changed
     json_path = os.path.join(output, "audit_results.json")
+    previous = None
+    if upload_url and os.path.exists(json_path):
+        with open(json_path, 'r') as f:
+            previous = json.load(f)
+
+    # Export to JSON first
     auditor.export_results(json_path)
 
     if verbose:
-        click.echo(f"   Ran {len(results)} checks")
+        click.echo(f"   Ran {len(results)} checks ({cache.hits} served from cache), "
+                   f"pruned {len(auditor.not_applicable)} not applicable to this host")
         click.echo(f"   Compliance Score: {auditor.get_compliance_score():.1f}%")
 
     # Load the data for reporting
@@ -75,6 +128,22 @@ def audit(os_type, profile, level, output, output_format, verbose):
         csv_reporter.generate(audit_data, csv_path)
         click.echo(f"📄 CSV report: {csv_path}")
 
+    if 'compact' in output_format:
+        compact_reporter = CompactReporter()
+        compact_path = os.path.join(output, "audit_results.cisz")
+        compact_reporter.generate(audit_data, compact_path)
+        click.echo(f"📄 Compact archive: {compact_path}")
+
+    if upload_url:
+        client = IngestClient(upload_url)
+        try:
+            client.upload(audit_data, audit_data["host"], previous)
+            click.echo(f"📤 Uploaded results to {upload_url}")
+        except (UploadError, ValueError) as e:
+            click.secho(f"⚠️  Upload failed: {e}", fg='yellow')
+        finally:
+            client.close()
+
     score = auditor.get_compliance_score()
     if score >= 80:
         click.secho(f"\n✅ Audit completed! Compliance Score: {score:.1f}%", fg='green', bold=True)
@@ -85,53 +154,109 @@ def audit(os_type, profile, level, output, output_format, verbose):
 
 
 @main.command()
-@click.option('--profile', required=True, help='CIS profile to remediate')
+@click.option('--os', 'os_type', type=click.Choice(OS_CHOICES),
+              help='Operating system to remediate')
+@click.option('--profile', help='CIS profile to remediate')
+@click.option('--level', type=click.IntRange(1, 2), default=1,
+              help='CIS Level (1 or 2)')
 @click.option('--checks', help='Comma-separated check IDs')
 @click.option('--dry-run', is_flag=True, help='Show changes without applying')
-@click.option('--backup', is_flag=True, help='Create backup before changes')
+@click.option('--backup', is_flag=True, help='Keep backups of changed files')
+@click.option('--backup-dir', type=click.Path(), default='/var/backups/cis-checker',
+              help='Directory for kept backups')
 @click.option('--force', is_flag=True, help='Skip confirmation prompts')
-def remediate(profile, checks, dry_run, backup, force):
+def remediate(os_type, profile, level, checks, dry_run, backup, backup_dir, force):
     """Apply remediation for non-compliant checks."""
     if dry_run:
         click.secho("🔍 DRY RUN MODE - No changes will be applied", fg='yellow')
 
-    if not force and not dry_run:
-        click.confirm('⚠️  This will modify system configuration. Continue?', abort=True)
-
-    click.echo(f"\n🔧 Starting remediation for profile: {profile}")
-
-    if backup:
-        click.echo("📦 Creating system backup...")
-        # Backup implementation would go here
-        click.secho("✅ Backup created", fg='green')
+    facts = HostFacts()
+    # Audit fresh, but keep the cache so remediated checks can be evicted from it
+    cache = ResultCache(max_age=0)
+    auditor = create_auditor(os_type or detect_os_type(facts), profile, level, facts, cache)
+    click.echo(f"\n🔧 Starting remediation for profile: {auditor.profile} (Level {level})")
 
     if checks:
-        check_list = checks.split(',')
+        check_list = [check_id.strip() for check_id in checks.split(',') if check_id.strip()]
         click.echo(f"   Remediating specific checks: {', '.join(check_list)}")
     else:
-        click.echo("   Remediating all failed checks")
+        click.echo("   Auditing to find failed checks...")
+        try:
+            results = auditor.run_all_checks()
+        except ValueError as e:
+            raise click.ClickException(f"Invalid profile {auditor.profile}: {e}")
+        depends_on = {spec.check_id: spec.depends_on for spec in auditor.get_check_specs()}
+        check_list = checks_to_remediate(results, depends_on)
+        click.echo(f"   Remediating {len(check_list)} failed or blocked checks")
+
+    try:
+        plan = RemediationPlan.from_profile(auditor.get_profile_data(), check_list)
+    except (KeyError, ValueError) as e:
+        raise click.ClickException(f"Invalid fix in profile: {e}")
+
+    if plan.manual:
+        click.secho(f"   ⚠️  No automated fix for: {', '.join(plan.manual)}", fg='yellow')
+    if not plan.check_ids:
+        click.echo("\nNothing to remediate.")
+        return
+
+    if backup:
+        backup_dir = os.path.join(backup_dir, datetime.now().strftime("%Y%m%d-%H%M%S"))
+    engine = RemediationEngine(backup_dir=backup_dir if backup else None)
+    steps = engine.steps(plan)
+    click.echo(f"\n📋 Plan for {len(plan.check_ids)} checks ({len(steps)} steps):")
+    for description, _ in steps:
+        click.echo(f"   • {description}")
+    if dry_run:
+        return
+
+    if not force:
+        click.confirm('\n⚠️  This will modify system configuration. If a step fails, only file '
+                      'changes are rolled back. Continue?', abort=True)
 
-    # Remediation implementation would go here
     click.echo("\n🔄 Applying remediations...")
-    click.secho("✅ Remediation completed!", fg='green', bold=True)
-    click.echo("\n💡 Tip: Run 'cis-checker audit' again to verify changes")
+    try:
+        engine.apply(plan)
+    except RemediationError as e:
+        raise click.ClickException(f"Remediation failed: {e}")
+    finally:
+        auditor.invalidate_cached(plan.check_ids)
+    if backup:
+        click.secho(f"📦 Backups kept in {backup_dir}", fg='green')
+
+    click.echo("\n🔎 Verifying remediated checks...")
+    results = engine.verify(auditor, plan.check_ids)
+    for result in results:
+        color = 'green' if result.status == "pass" else 'red'
+        click.secho(f"   {result.status.upper():<5} {result.check_id} {result.title}", fg=color)
+
+    fixed = sum(1 for result in results if result.status == "pass")
+    if fixed == len(results):
+        click.secho(f"✅ Remediation completed! {fixed}/{len(results)} checks now pass",
+                    fg='green', bold=True)
+    else:
+        click.secho(f"⚠️  Remediation completed! {fixed}/{len(results)} checks now pass",
+                    fg='yellow', bold=True)
 
 
 @main.command()
 @click.option('--input', 'input_path', required=True, type=click.Path(exists=True),
-              help='Input audit results file (JSON)')
-@click.option('--format', 'output_format', type=click.Choice(['html', 'json', 'csv']),
+              help='Input audit results file (JSON, collector JSON Lines or compact archive)')
+@click.option('--format', 'output_format', type=click.Choice(['html', 'json', 'csv', 'compact']),
               required=True, help='Output format')
 @click.option('--output', 'output_path', help='Output file path')
 def report(input_path, output_format, output_path):
     """Generate compliance reports from audit results."""
     click.echo(f"📊 Generating {output_format.upper()} report...")
 
-    with open(input_path, 'r') as f:
-        audit_data = json.load(f)
+    try:
+        audit_data = load_audit_data(input_path)
+    except ValueError as e:
+        raise click.ClickException(str(e))
 
     if not output_path:
-        output_path = f"compliance_report.{output_format}"
+        extension = 'cisz' if output_format == 'compact' else output_format
+        output_path = f"compliance_report.{extension}"
 
     if output_format == 'html':
         reporter = HTMLReporter()
@@ -142,10 +267,78 @@ def report(input_path, output_format, output_path):
     elif output_format == 'csv':
         reporter = CSVReporter()
         reporter.generate(audit_data, output_path)
+    elif output_format == 'compact':
+        reporter = CompactReporter()
+        reporter.generate(audit_data, output_path)
 
     click.secho(f"✅ Report generated: {output_path}", fg='green')
 
 
+@main.command()
+@click.option('--input', 'input_paths', required=True, multiple=True, type=click.Path(exists=True),
+              help='Audit results files or directories (JSON or compact archives)')
+@click.option('--output', 'output_path', default='fleet_dashboard.html', help='Output file path')
+@click.option('--threshold', type=click.IntRange(0, 100), default=80,
+              help='Compliance score below which a host counts as failing')
+def dashboard(input_paths, output_path, threshold):
+    """Generate a fleet dashboard from many hosts' audit results."""
+    click.echo(f"📊 Building fleet dashboard from {len(input_paths)} input(s)...")
+    reporter = FleetReporter(threshold=threshold)
+    try:
+        reporter.generate(iter_runs(input_paths), output_path)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.secho(f"✅ Dashboard generated: {output_path}", fg='green')
+
+
+@main.command()
+@click.option('--host', default='127.0.0.1', help='Address to listen on')
+@click.option('--port', type=int, default=8765, help='Port to listen on')
+@click.option('--store', 'store_path', type=click.Path(), default='./fleet',
+              help='Directory for collected results')
+@click.option('--queue-size', type=int, default=1000, help='Maximum queued payloads')
+@click.option('--batch-size', type=int, default=200, help='Maximum payloads per write')
+@click.option('--flush-interval', type=float, default=1.0,
+              help='Seconds to coalesce payloads before writing')
+def serve(host, port, store_path, queue_size, batch_size, flush_interval):
+    """Collect audit results uploaded by agents."""
+    store = ResultStore(store_path)
+    loaded = store.load()
+    server = IngestServer(store, host, port, queue_size=queue_size,
+                          batch_size=batch_size, flush_interval=flush_interval)
+    click.echo(f"📥 Ingest server listening on http://{host}:{port} ({loaded} hosts loaded)")
+    click.echo("   POST /ingest, GET /summary, GET /health")
+    server.run()
+
+
+@main.command(name='compile')
+@click.option('--profile', default='ubuntu_22_04', help='CIS profile to compile')
+@click.option('--target', type=click.Choice(sorted(TARGETS)), default='sh', help='Collector language')
+@click.option('--level', type=click.IntRange(1, 2), default=1, help='CIS Level (1 or 2)')
+@click.option('--output', 'output_path', default='cis_collector.sh', help='Output file path')
+def compile_profile(profile, target, level, output_path):
+    """Compile a profile into a standalone collector script."""
+    try:
+        profile_data = load_profile(profile)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(f"Cannot load profile {profile}: {e}")
+
+    compiler = TARGETS[target](profile_data, profile, level)
+    try:
+        script = compiler.compile()
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(script)
+    os.chmod(output_path, 0o755)
+
+    for warning in compiler.warnings:
+        click.secho(f"⚠️  {warning}", fg='yellow')
+    click.secho(f"✅ Collector generated: {output_path}", fg='green')
+    click.echo(f"💡 Run it on the target host and feed its output to "
+               f"'cis-checker report --input <file>'")
+
+
 @main.command()
 @click.option('--profiles', is_flag=True, help='List available profiles')
 @click.option('--checks', help='List checks for profile')
@@ -0,0 +1,6 @@
+from .shell import ShellCompiler, to_ere
+
+# Collector targets supported by ``cis-checker compile``
+TARGETS = {'sh': ShellCompiler}
+
+__all__ = ['ShellCompiler', 'TARGETS', 'to_ere']
@@ -0,0 +1,450 @@
+"""
+Compile a CIS profile into a standalone POSIX shell collector.
+
+The collector needs only ``sh``, ``grep``, ``sed`` and ``awk``. It evaluates
+every profile check that has an ``audit_command`` or ``probe`` with the same
+semantics as ``CommandCheckRunner``:
+- each source is read once and shared by all rules that read it
+- probes are read from /proc and /sys and fall back to the audit command
+- a check's status is its worst source outcome
+- ``depends_on`` prerequisites skip dependents that cannot pass
+- checks whose ``applies_when`` level is above the compiled level are left
+  out, with their dependents; conditions on host facts are only evaluated
+  by the Python engine
+
+Results are printed as JSON Lines: a ``run`` record followed by one
+``result`` record per check, which ``cis-checker report`` reads directly.
+
+Python regular expressions are translated to POSIX EREs. Checks whose rules
+use constructs without an ERE equivalent are compiled to ``error`` results
+and listed in ``warnings``.
+"""
+
+import json
+import os
+import re
+from typing import Dict, List, Tuple
+
+from ..auditors.applicability import Applicability, profile_predicates
+from ..auditors.command_checks import Source, group_rules, probe_keys
+from ..auditors.matcher import Rule
+from ..auditors.scheduler import CheckScheduler, CheckSpec
+from ..probes.host import HostFacts
+from ..probes.kernel import PROBES
+
+# Escapes outside and inside bracket expressions
+_ERE_ESCAPES = {
+    "s": "[[:space:]]", "S": "[^[:space:]]", "d": "[0-9]", "D": "[^0-9]",
+    "w": "[[:alnum:]_]", "W": "[^[:alnum:]_]", "t": "\t",
+}
+_CLASS_ESCAPES = {"s": "[:space:]", "d": "0-9", "w": "[:alnum:]_", "t": "\t"}
+_ERE_SPECIAL = set(".[]()*+?{}|^$\\")
+# Paths reported when a probe's source is missing, relative to the root
+_PROBE_PATHS = {"sys_modules": ("sys", "module"), "sysctl": ("proc", "sys")}
+# sed delimiter that cannot clash with a pattern
+_SED_DELIMITER = "\x01"
+
+PREAMBLE = r'''LC_ALL=C
+export LC_ALL
+PATH=/usr/sbin:/usr/bin:/sbin:/bin:$PATH
+
+_json() {
+    printf '%s' "$1" | sed -e 's/\\/\\\\/g' -e 's/"/\\"/g' | tr -d '\n\r\t'
+}
+
+# _load N: run source N once, caching its output and exit status
+_load() {
+    eval "[ -n \"\${_d$1}\" ]" && return 0
+    _o=$(_s$1 </dev/null 2>/dev/null)
+    _r=$?
+    eval "_d$1=1 _o$1=\$_o _r$1=\$_r"
+}
+
+# _begin: start a check
+_begin() {
+    cs=pass cd= _blocked=
+}
+
+# _need ID VAR: note a prerequisite check that did not pass
+_need() {
+    eval "_s=\${_st_$2}"
+    [ "$_s" = pass ] || _blocked="${_blocked:+$_blocked, }$1 ($_s)"
+}
+
+# _source N LABEL ERROR [FALLBACK_N FALLBACK_LABEL FALLBACK_ERROR]
+_source() {
+    ss=pass sd= _label=$2
+    _load "$1"
+    eval "OUT=\$_o$1 _rc=\$_r$1"
+    case $1 in
+        p*)
+            if [ "$_rc" != 0 ]; then
+                if [ -n "$4" ]; then
+                    _source "$4" "$5" "$6"
+                    return
+                fi
+                ss=error sd=$3
+            fi ;;
+        *)
+            case $_rc in 126|127) ss=error sd=$3 ;; esac ;;
+    esac
+}
+
+# _rule TYPE PATTERN DESCRIPTION [SED OP VALUE NOT_FOUND NO_NUMBER]
+_rule() {
+    [ "$ss" = error ] && return 0
+    _ok= _d=$3
+    case $1 in
+        contains)
+            case $OUT in *"$2"*) _ok=1 ;; esac ;;
+        exact)
+            printf '%s\n' "$OUT" | P=$2 awk '{ s = $0; sub(/^[[:space:]]+/, "", s); sub(/[[:space:]]+$/, "", s); if (s == ENVIRON["P"]) f = 1 } END { exit !f }' && _ok=1 ;;
+        regex)
+            printf '%s\n' "$OUT" | grep -Eq -- "$2" && _ok=1 ;;
+        absent)
+            if [ -n "$2" ]; then
+                printf '%s\n' "$OUT" | grep -Eq -- "$2" || _ok=1
+            else
+                [ -z "$(printf '%s' "$OUT" | tr -d '[:space:]')" ] && _ok=1
+            fi ;;
+        numeric)
+            _numeric "$2" "$4" "$5" "$6" "$7" "$8" ;;
+    esac
+    if [ -z "$sd" ] || { [ "$ss" = pass ] && [ -z "$_ok" ]; }; then
+        sd=$_d
+        if [ -n "$_ok" ]; then ss=pass; else ss=fail; fi
+    fi
+}
+
+_numeric() {
+    _l=$(printf '%s\n' "$OUT" | grep -En -- "$1" | head -n 1)
+    if [ -z "$_l" ]; then
+        _d=$5
+        return
+    fi
+    _n=$(printf '%s\n' "${_l#*:}" | sed -En "$2")
+    _d=$(awk -v a="$_n" -v op="$3" -v b="$4" 'BEGIN {
+        if (a !~ /^[ \t]*[-+]?([0-9]+[.]?[0-9]*|[.][0-9]+)([eE][-+]?[0-9]+)?[ \t]*$/) exit 2
+        a += 0; b += 0
+        if (op == "<") r = a < b; else if (op == "<=") r = a <= b
+        else if (op == "==") r = a == b; else if (op == "!=") r = a != b
+        else if (op == ">=") r = a >= b; else r = a > b
+        printf "value %g, expected %s %g", a, op, b
+        exit !r
+    }')
+    case $? in
+        0) _ok=1 ;;
+        1) ;;
+        *) _d=$6 ;;
+    esac
+}
+
+_rank() {
+    case $1 in pass) _k=0 ;; fail) _k=1 ;; *) _k=2 ;; esac
+}
+
+# _source_end: merge the current source's outcome into the check
+_source_end() {
+    case $ss in
+        pass) _d="$_label satisfies $sd" ;;
+        fail) _d="$_label does not satisfy $sd" ;;
+        *) _d=$sd ;;
+    esac
+    _rank "$ss"
+    _new=$_k
+    _rank "$cs"
+    if [ -z "$cd" ] || [ "$_new" -gt "$_k" ]; then
+        cs=$ss cd=$_d
+    fi
+}
+
+# _fixed STATUS DESCRIPTION: result decided at compile time
+_fixed() {
+    cs=$1 cd=$2
+}
+
+# _emit ID VAR TITLE SEVERITY REMEDIATION
+_emit() {
+    if [ -n "$_blocked" ]; then
+        cs=skip cd="Skipped: prerequisite check did not pass: $_blocked"
+    fi
+    eval "_st_$2=\$cs"
+    _rem=
+    [ "$cs" = fail ] && _rem=$5
+    printf '{"type":"result","check_id":"%s","title":"%s","status":"%s","description":"%s","remediation":"%s","severity":"%s","timestamp":"%s"}\n' \
+        "$1" "$3" "$cs" "$cd" "$_rem" "$4" "$TS"
+}
+'''
+
+
+def to_ere(pattern: str) -> str:
+    """Translate a Python regular expression to a POSIX ERE.
+
+    Raises ValueError for constructs without an ERE equivalent, such as
+    lookarounds, backreferences and ``\\b``. Lazy quantifiers become greedy,
+    which does not change whether a pattern matches.
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == "\\":
+            if i + 1 >= n:
+                raise ValueError("trailing backslash")
+            escaped = pattern[i + 1]
+            if escaped in _ERE_ESCAPES:
+                out.append(_ERE_ESCAPES[escaped])
+            elif escaped.isalnum():
+                raise ValueError(f"unsupported escape \\{escaped}")
+            elif escaped in _ERE_SPECIAL:
+                out.append("\\" + escaped)
+            else:
+                out.append(escaped)
+            i += 2
+        elif char == "[":
+            i = _bracket(pattern, i, out)
+        elif char == "(" and pattern.startswith("(?", i):
+            raise ValueError("unsupported group (?...)")
+        elif char in "*+?}" and pattern.startswith("?", i + 1):
+            out.append(char)
+            i += 2
+        else:
+            out.append(char)
+            i += 1
+    return "".join(out)
+
+
+def _bracket(pattern: str, i: int, out: List[str]) -> int:
+    """Translate the bracket expression starting at i; return the index after it."""
+    parts = ["["]
+    j, n = i + 1, len(pattern)
+    if pattern.startswith("^", j):
+        parts.append("^")
+        j += 1
+    if pattern.startswith("]", j):
+        parts.append("]")
+        j += 1
+    while j < n and pattern[j] != "]":
+        if pattern[j] == "\\":
+            escaped = pattern[j + 1] if j + 1 < n else ""
+            if escaped in _CLASS_ESCAPES:
+                parts.append(_CLASS_ESCAPES[escaped])
+            elif not escaped or escaped.isalnum() or escaped in "]\\^-":
+                raise ValueError(f"unsupported escape \\{escaped} in character class")
+            else:
+                parts.append(escaped)
+            j += 2
+        elif pattern.startswith("[:", j):
+            end = pattern.find(":]", j)
+            if end < 0:
+                raise ValueError("unterminated character class")
+            parts.append(pattern[j:end + 2])
+            j = end + 2
+        else:
+            parts.append(pattern[j])
+            j += 1
+    if j >= n:
+        raise ValueError("unterminated character class")
+    out.append("".join(parts) + "]")
+    return j + 1
+
+
+def sh_quote(value: str) -> str:
+    """Quote a string as a single shell word."""
+    return "'" + value.replace("'", "'\\''") + "'"
+
+
+def json_fragment(value: str) -> str:
+    """Return value escaped for use inside a JSON string literal."""
+    return json.dumps(value)[1:-1]
+
+
+class ShellCompiler:
+    """Generate a POSIX shell collector from a profile definition.
+
+    ``root`` prefixes the /proc and /sys paths read by probes, so a
+    collector can be pointed at an alternate filesystem tree for testing.
+    """
+
+    def __init__(self, profile_data: Dict, profile: str, level: int = 1, root: str = "/"):
+        self.profile_data = profile_data
+        self.profile = profile
+        self.level = level
+        self.root = root
+        self.warnings: List[str] = []
+        self._source_ids: Dict[Source, str] = {}
+
+    def checks(self) -> List[Dict]:
+        """Profile checks the collector evaluates, in dependency order.
+
+        Raises ValueError for unknown ``applies_when`` conditions.
+        """
+        checks = [check for check in self.profile_data.get("checks", [])
+                  if check.get("audit_command") or check.get("probe")]
+        levels = {check_id: {"level": predicate["level"]}
+                  for check_id, predicate in profile_predicates(self.profile_data).items()
+                  if "level" in predicate}
+        pruned = Applicability(HostFacts(self.root), self.level).not_applicable(
+            {check["id"]: check.get("depends_on") or [] for check in checks}, levels)
+        checks = [check for check in checks if check["id"] not in pruned]
+        by_id = {check["id"]: check for check in checks}
+        specs = [CheckSpec(check["id"], None, depends_on=check.get("depends_on"))
+                 for check in checks]
+        return [by_id[spec.check_id] for wave in CheckScheduler(specs).build_waves()
+                for spec in wave]
+
+    def compile(self) -> str:
+        """Return the collector script."""
+        self.warnings = []
+        self._source_ids = {}
+        checks = self.checks()
+        rules, check_sources = group_rules(checks)
+
+        body = []
+        for check in checks:
+            body.extend(self._check(check, rules, check_sources[check["id"]]))
+
+        lines = [
+            "#!/bin/sh",
+            f"# CIS collector for profile {self.profile}, generated by cis-checker compile.",
+            "# Do not edit: regenerate it from the profile instead.",
+            "# Prints JSON Lines: one run record, then one result record per check.",
+            "",
+            PREAMBLE.rstrip(),
+            "",
+        ]
+        for source, source_id in self._source_ids.items():
+            lines.append(f"_s{source_id}() {{")
+            lines.extend("    " + line for line in self._source_body(source, rules[source]))
+            lines.append("}")
+        lines += [
+            "",
+            "TS=$(date +%Y-%m-%dT%H:%M:%S)",
+            'printf \'{"type":"run","host":"%s","profile":"%s","level":%s,"timestamp":"%s",'
+            '"collector":"sh"}\\n\' \\',
+            f'    "$(_json "$(uname -n)")" {sh_quote(json_fragment(self.profile))} '
+            f'{int(self.level)} "$TS"',
+            "",
+        ]
+        return "\n".join(lines + body) + "\n"
+
+    def _source_id(self, source: Source) -> str:
+        if source not in self._source_ids:
+            prefix = "p" if source[0] == "probe" else "c"
+            self._source_ids[source] = f"{prefix}{len(self._source_ids) + 1}"
+        return self._source_ids[source]
+
+    def _check(self, check: Dict, rules: Dict[Source, List[Rule]],
+               sources: List[Source]) -> List[str]:
+        check_id = check["id"]
+        lines = [f"# {check_id} {check.get('title', '')}".rstrip(), "_begin"]
+        for dep in check.get("depends_on") or []:
+            lines.append(f"_need {sh_quote(json_fragment(dep))} {_var(dep)}")
+
+        try:
+            evaluation = []
+            for source in sources:
+                evaluation.append(self._source_call(check, source))
+                for rule in rules[source]:
+                    if rule.check_id == check_id:
+                        evaluation.append(_rule_call(rule))
+                evaluation.append("_source_end")
+        except ValueError as e:
+            self.warnings.append(f"{check_id}: {e}")
+            message = f"Rule cannot be evaluated by the shell collector: {e}"
+            evaluation = [f"_fixed error {sh_quote(json_fragment(message))}"]
+
+        lines.append('if [ -z "$_blocked" ]; then')
+        lines.extend("    " + line for line in evaluation)
+        lines.append("fi")
+        lines.append(" ".join([
+            "_emit", sh_quote(json_fragment(check_id)), _var(check_id),
+            sh_quote(json_fragment(check.get("title", ""))),
+            sh_quote(json_fragment(check.get("severity", "medium"))),
+            sh_quote(json_fragment(check.get("remediation", ""))),
+        ]))
+        lines.append("")
+        return lines
+
+    def _source_call(self, check: Dict, source: Source) -> str:
+        args = ["_source", self._source_id(source)] + [sh_quote(a) for a in self._labels(source)]
+        if source[0] == "probe" and check.get("probe") == source[1] and check.get("audit_command"):
+            fallback = ("fallback", check["audit_command"])
+            args.append(self._source_id(fallback))
+            args.extend(sh_quote(a) for a in self._labels(fallback))
+        return " ".join(args)
+
+    def _source_body(self, source: Source, rules: List[Rule]) -> List[str]:
+        kind, name = source
+        if kind != "probe":
+            return [f"( {name}", ")"]
+
+        path = self._path
+        if name == "modules":
+            return [f"cat {sh_quote(path('proc', 'modules'))}"]
+        if name == "mounts":
+            return [f"cat {sh_quote(path('proc', 'mounts'))}"]
+        if name == "sys_modules":
+            directory = sh_quote(path('sys', 'module'))
+            return [f"[ -d {directory} ] || return 200", f"ls -1 {directory}"]
+        if name == "modprobe":
+            return [f"awk '{{ sub(/#.*/, \"\") }} NF {{ $1 = $1; print }}' "
+                    f"{sh_quote(path('etc', 'modprobe.d'))}/*.conf 2>/dev/null", "return 0"]
+
+        base = path("proc", "sys")
+        lines = [f"[ -d {sh_quote(base)} ] || return 200"]
+        keys = probe_keys(rules)
+        if keys is None:
+            lines += [
+                f"find {sh_quote(base)} -type f | sort | while IFS= read -r f; do",
+                '    v=$(cat "$f" 2>/dev/null) || continue',
+                f'    k=$(printf \'%s\' "${{f#{base}/}}" | tr / .)',
+                "    printf '%s = %s\\n' \"$k\" \"$v\"",
+                "done",
+            ]
+        else:
+            for key in sorted(keys):
+                key_path = sh_quote(os.path.join(base, *key.split(".")))
+                lines.append(f"v=$(cat {key_path} 2>/dev/null) && "
+                             f"printf '%s = %s\\n' {sh_quote(key)} \"$v\"")
+        lines.append("return 0")
+        return lines
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self.root, *parts)
+
+    def _labels(self, source: Source) -> Tuple[str, str]:
+        """Return the JSON-escaped label and error description of a source."""
+        kind, name = source
+        if kind == "probe":
+            label = PROBES[name][0]
+            path = self._path(*_PROBE_PATHS.get(name, label.strip("/").split("/")))
+            return json_fragment(label), json_fragment(f"{label} is unavailable: {path}")
+        return (json_fragment(f"Output of `{name}`"),
+                json_fragment(f"`{name}` could not be executed"))
+
+
+def _rule_call(rule: Rule) -> str:
+    describe = json_fragment(rule.describe())
+    if rule.type == "contains":
+        args = ["contains", rule.pattern, describe]
+    elif rule.type == "exact":
+        args = ["exact", rule.pattern.strip(), describe]
+    elif rule.type == "numeric":
+        ere = to_ere(rule.pattern)
+        if rule.pattern.startswith("^"):
+            expression = f"({ere}).*$"
+        else:
+            expression = f"^.*({ere}).*$"
+        d = _SED_DELIMITER
+        args = ["numeric", ere, describe, f"s{d}{expression}{d}\\2{d}p", rule.op, f"{rule.value:g}",
+                json_fragment(f"{rule.pattern!r} not found"),
+                json_fragment(f"no number captured by {rule.pattern!r}")]
+    else:
+        args = [rule.type, to_ere(rule.pattern) if rule.pattern else "", describe]
+    return "_rule " + " ".join(sh_quote(arg) for arg in args)
+
+
+def _var(check_id: str) -> str:
+    """Shell variable suffix for a check ID."""
+    return re.sub(r'[^A-Za-z0-9]', '_', check_id)
@@ -0,0 +1,6 @@
+from .accounts import Account, AccountDatabase, Group
+from .host import HostFacts
+from .kernel import PROBES, KernelSnapshot, ProbeUnavailable
+
+__all__ = ['Account', 'AccountDatabase', 'Group', 'HostFacts', 'PROBES', 'KernelSnapshot',
+           'ProbeUnavailable']
@@ -0,0 +1,212 @@
+"""
+Indexed view of the local account database (passwd, shadow and group).
+
+An ``AccountDatabase`` parses each file once per run and builds hash indexes
+by name and ID, so every account control is a single pass over the entries
+instead of a pairwise comparison. Home directories of interactive users are
+stat'ed once, in a parallel batch, and shared by all home directory controls.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .kernel import ProbeUnavailable
+
+# Login shells that do not give an interactive session
+NOLOGIN_SUFFIXES = ("nologin", "false", "sync", "shutdown", "halt")
+# Smallest batch of home directories stat'ed by one worker
+HOME_CHUNK = 64
+
+
+class Account(NamedTuple):
+    name: str
+    password: str
+    uid: int
+    gid: int
+    home: str
+    shell: str
+
+    @property
+    def interactive(self) -> bool:
+        return not self.shell.endswith(NOLOGIN_SUFFIXES)
+
+
+class Group(NamedTuple):
+    name: str
+    gid: int
+    members: Tuple[str, ...]
+
+
+class AccountDatabase:
+    """Parse and index /etc/passwd, /etc/shadow and /etc/group once per run."""
+
+    def __init__(self, root: str = "/", max_workers: int = 32):
+        self.root = root
+        self.max_workers = max_workers
+        self.malformed: List[str] = []
+        self._lock = threading.Lock()
+        self._accounts: Optional[List[Account]] = None
+        self._groups: Optional[List[Group]] = None
+        self._shadow: Optional[Dict[str, str]] = None
+        self._home_stats: Optional[Dict[str, Optional[os.stat_result]]] = None
+        self._by_name: Dict[str, List[Account]] = {}
+        self._by_uid: Dict[int, List[Account]] = {}
+        self._groups_by_name: Dict[str, List[Group]] = {}
+        self._groups_by_gid: Dict[int, List[Group]] = {}
+
+    def path(self, *parts: str) -> str:
+        return os.path.join(self.root, *parts)
+
+    @property
+    def accounts(self) -> List[Account]:
+        """Entries of /etc/passwd, in file order."""
+        self._load_accounts()
+        return self._accounts
+
+    @property
+    def groups(self) -> List[Group]:
+        """Entries of /etc/group, in file order."""
+        self._load_groups()
+        return self._groups
+
+    def _load_accounts(self):
+        with self._lock:
+            if self._accounts is None:
+                accounts = []
+                for fields in self._read_fields("passwd", 7):
+                    try:
+                        accounts.append(Account(fields[0], fields[1], int(fields[2]),
+                                                int(fields[3]), fields[5], fields[6]))
+                    except ValueError:
+                        self.malformed.append(f"passwd: {':'.join(fields)}")
+                for account in accounts:
+                    self._by_name.setdefault(account.name, []).append(account)
+                    self._by_uid.setdefault(account.uid, []).append(account)
+                self._accounts = accounts
+
+    def _load_groups(self):
+        with self._lock:
+            if self._groups is None:
+                groups = []
+                for fields in self._read_fields("group", 4):
+                    try:
+                        members = tuple(m for m in fields[3].split(",") if m)
+                        groups.append(Group(fields[0], int(fields[2]), members))
+                    except ValueError:
+                        self.malformed.append(f"group: {':'.join(fields)}")
+                for group in groups:
+                    self._groups_by_name.setdefault(group.name, []).append(group)
+                    self._groups_by_gid.setdefault(group.gid, []).append(group)
+                self._groups = groups
+
+    @property
+    def shadow(self) -> Dict[str, str]:
+        """Password field of /etc/shadow by account name."""
+        with self._lock:
+            if self._shadow is None:
+                self._shadow = {fields[0]: fields[1] for fields in self._read_fields("shadow", 2)}
+        return self._shadow
+
+    def user(self, name: str) -> Optional[Account]:
+        self._load_accounts()
+        entries = self._by_name.get(name)
+        return entries[0] if entries else None
+
+    def group(self, name: str) -> Optional[Group]:
+        self._load_groups()
+        entries = self._groups_by_name.get(name)
+        return entries[0] if entries else None
+
+    def users_with_uid(self, uid: int) -> List[Account]:
+        self._load_accounts()
+        return self._by_uid.get(uid, [])
+
+    def duplicate_uids(self) -> Dict[int, List[str]]:
+        self._load_accounts()
+        return {uid: [a.name for a in entries]
+                for uid, entries in self._by_uid.items() if len(entries) > 1}
+
+    def duplicate_user_names(self) -> List[str]:
+        self._load_accounts()
+        return [name for name, entries in self._by_name.items() if len(entries) > 1]
+
+    def duplicate_gids(self) -> Dict[int, List[str]]:
+        self._load_groups()
+        return {gid: [g.name for g in entries]
+                for gid, entries in self._groups_by_gid.items() if len(entries) > 1}
+
+    def duplicate_group_names(self) -> List[str]:
+        self._load_groups()
+        return [name for name, entries in self._groups_by_name.items() if len(entries) > 1]
+
+    def unshadowed_accounts(self) -> List[str]:
+        """Accounts whose passwd entry holds a password instead of ``x``."""
+        return [a.name for a in self.accounts if a.password != "x"]
+
+    def empty_passwords(self) -> List[str]:
+        """Accounts with an empty password field in /etc/shadow."""
+        return [name for name, password in self.shadow.items() if not password]
+
+    def missing_groups(self) -> Dict[int, List[str]]:
+        """Primary GIDs used in /etc/passwd that have no /etc/group entry."""
+        self._load_groups()
+        missing: Dict[int, List[str]] = {}
+        for account in self.accounts:
+            if account.gid not in self._groups_by_gid:
+                missing.setdefault(account.gid, []).append(account.name)
+        return missing
+
+    def root_equivalents(self) -> List[str]:
+        """Accounts other than root with UID 0."""
+        return [a.name for a in self.users_with_uid(0) if a.name != "root"]
+
+    def interactive_accounts(self) -> List[Account]:
+        return [a for a in self.accounts if a.interactive]
+
+    def home_stats(self) -> Dict[str, Optional[os.stat_result]]:
+        """Stat every interactive user's home directory once, in parallel.
+
+        Maps each home path to its stat result, or None if it does not exist.
+        Paths are stat'ed in chunks so that slow (network) home directories
+        overlap without paying a thread hand-off per path.
+        """
+        homes = sorted({a.home for a in self.interactive_accounts()})
+        with self._lock:
+            if self._home_stats is None:
+                size = max(-(-len(homes) // self.max_workers), HOME_CHUNK)
+                chunks = [homes[i:i + size] for i in range(0, len(homes), size)]
+                self._home_stats = {}
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    for chunk, stats in zip(chunks, executor.map(self._stat_all, chunks)):
+                        self._home_stats.update(zip(chunk, stats))
+        return self._home_stats
+
+    def _stat_all(self, homes: List[str]) -> List[Optional[os.stat_result]]:
+        stats = []
+        for home in homes:
+            try:
+                stats.append(os.stat(self.path(home.lstrip("/"))))
+            except OSError:
+                stats.append(None)
+        return stats
+
+    def _read_fields(self, name: str, min_fields: int) -> List[List[str]]:
+        path = self.path("etc", name)
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            raise ProbeUnavailable(path)
+
+        entries = []
+        for line in lines:
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split(":")
+            if len(fields) < min_fields:
+                self.malformed.append(f"{name}: {line}")
+                continue
+            entries.append(fields)
+        return entries
@@ -0,0 +1,125 @@
+"""
+Cheap host facts used to decide which controls apply to a host.
+
+Facts are read from a handful of files, on first use, and kept for the
+lifetime of the ``HostFacts`` object, so one instance can be shared by
+platform detection and by every applicability predicate of an audit.
+"""
+
+import os
+import threading
+from typing import Callable, Dict, FrozenSet, Optional
+
+from ..utils.system_detection import detect_os
+
+# DMI vendors and products reported by common hypervisors
+HYPERVISOR_VENDORS = ("qemu", "kvm", "vmware", "virtualbox", "innotek", "xen", "bochs",
+                      "parallels", "microsoft corporation virtual", "amazon ec2", "google")
+CONTAINER_MARKERS = (".dockerenv", "run/.containerenv")
+
+
+class HostFacts:
+    """Lazily computed, memoized facts about the host.
+
+    ``root`` points the facts at an alternate filesystem tree for testing;
+    the OS is then read from its ``etc/os-release`` instead of the running
+    system.
+    """
+
+    def __init__(self, root: str = "/"):
+        self.root = root
+        self._facts: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def path(self, *parts: str) -> str:
+        return os.path.join(self.root, *parts)
+
+    @property
+    def os_id(self) -> str:
+        """Detected platform, such as ``ubuntu_22_04``."""
+        return self._memo("os_id", self._read_os_id)
+
+    @property
+    def os_name(self) -> str:
+        """Platform name without its version, such as ``ubuntu``."""
+        return self.os_id.split("_", 1)[0]
+
+    @property
+    def systemd(self) -> bool:
+        """True if the host was booted with systemd."""
+        return self._memo("systemd", lambda: os.path.isdir(self.path("run", "systemd", "system")))
+
+    @property
+    def container(self) -> bool:
+        """True inside a container."""
+        return self._memo("container", self._read_container)
+
+    @property
+    def virtualized(self) -> bool:
+        """True on a virtual machine."""
+        return self._memo("virtualized", self._read_virtualized)
+
+    @property
+    def bare_metal(self) -> bool:
+        """True on physical hardware, outside any container."""
+        return not (self.container or self.virtualized)
+
+    @property
+    def packages(self) -> Optional[FrozenSet[str]]:
+        """Names of installed dpkg packages, or None without a dpkg database."""
+        return self._memo("packages", self._read_packages)
+
+    def _memo(self, name: str, compute: Callable[[], object]):
+        with self._lock:
+            if name not in self._facts:
+                self._facts[name] = compute()
+            return self._facts[name]
+
+    def _read(self, *parts: str) -> Optional[str]:
+        try:
+            with open(self.path(*parts), 'r', encoding='utf-8', errors='replace') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _read_os_id(self) -> str:
+        if self.root == "/":
+            return detect_os()
+        fields = {}
+        for line in (self._read("etc", "os-release") or "").splitlines():
+            key, sep, value = line.partition("=")
+            if sep:
+                fields[key.strip()] = value.strip().strip('"\'')
+        if not fields.get("ID"):
+            return "unknown"
+        return f"{fields['ID']}_{fields.get('VERSION_ID', '').replace('.', '_')}"
+
+    def _read_container(self) -> bool:
+        if any(os.path.exists(self.path(marker)) for marker in CONTAINER_MARKERS):
+            return True
+        if (self._read("run", "systemd", "container") or "").strip():
+            return True
+        environ = self._read("proc", "1", "environ") or ""
+        return any(item.startswith("container=") for item in environ.split("\0"))
+
+    def _read_virtualized(self) -> bool:
+        cpuinfo = self._read("proc", "cpuinfo") or ""
+        for line in cpuinfo.splitlines():
+            if line.startswith("flags") and "hypervisor" in line.split(":", 1)[-1].split():
+                return True
+        dmi = " ".join((self._read("sys", "class", "dmi", "id", name) or "").strip()
+                       for name in ("sys_vendor", "product_name")).lower()
+        return any(vendor in dmi for vendor in HYPERVISOR_VENDORS)
+
+    def _read_packages(self) -> Optional[FrozenSet[str]]:
+        status = self._read("var", "lib", "dpkg", "status")
+        if status is None:
+            return None
+        installed = set()
+        for stanza in status.split("\n\n"):
+            start = stanza.find("\nStatus: ")
+            if not stanza.startswith("Package: ") or start < 0:
+                continue
+            if stanza[start + 1:].split("\n", 1)[0].endswith(" ok installed"):
+                installed.add(stanza[9:].split("\n", 1)[0].strip())
+        return frozenset(installed)
@@ -0,0 +1,118 @@
+"""
+Native kernel probes reading procfs, sysfs and modprobe configuration.
+
+A ``KernelSnapshot`` is created once per run and reads each source at most
+once, replacing ``lsmod``, ``sysctl`` and ``mount`` subprocesses. Every probe
+renders its data as text in the same shape as the command it replaces, so
+profile rules written against command output work unchanged. ``root``
+points the snapshot at an alternate filesystem tree for testing.
+"""
+
+import glob
+import os
+import threading
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+class ProbeUnavailable(Exception):
+    """Raised when a probe's source does not exist on this host."""
+
+
+class KernelSnapshot:
+    """Read kernel state directly from the filesystem, memoized per run."""
+
+    def __init__(self, root: str = "/"):
+        self.root = root
+        self._cache: Dict[Tuple, str] = {}
+        self._lock = threading.Lock()
+
+    def path(self, *parts: str) -> str:
+        return os.path.join(self.root, *parts)
+
+    def read(self, probe: str, keys: Optional[Iterable[str]] = None) -> str:
+        """Return the text rendered by a named probe.
+
+        ``keys`` limits the ``sysctl`` probe to the listed parameters;
+        other probes ignore it.
+        """
+        if probe not in PROBES:
+            raise ValueError(f"Unknown probe: {probe}")
+        key = (probe, frozenset(keys) if keys is not None and probe == "sysctl" else None)
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = PROBES[probe][1](self, key[1])
+        return self._cache[key]
+
+    def modules(self, _keys=None) -> str:
+        """Loaded modules, as in /proc/modules (``lsmod``)."""
+        return self._read_required("proc", "modules")
+
+    def mounts(self, _keys=None) -> str:
+        """Mounted filesystems, as in /proc/mounts (``mount``)."""
+        return self._read_required("proc", "mounts")
+
+    def sys_modules(self, _keys=None) -> str:
+        """Modules known to sysfs, loaded or built in, one name per line."""
+        directory = self.path("sys", "module")
+        if not os.path.isdir(directory):
+            raise ProbeUnavailable(directory)
+        return "".join(f"{name}\n" for name in sorted(os.listdir(directory)))
+
+    def modprobe(self, _keys=None) -> str:
+        """Directives from /etc/modprobe.d/*.conf with comments and blank lines removed."""
+        lines = []
+        for conf in sorted(glob.glob(self.path("etc", "modprobe.d", "*.conf"))):
+            try:
+                with open(conf, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        line = " ".join(line.split("#", 1)[0].split())
+                        if line:
+                            lines.append(line + "\n")
+            except OSError:
+                continue
+        return "".join(lines)
+
+    def sysctl(self, keys: Optional[Iterable[str]] = None) -> str:
+        """Kernel parameters as ``key = value`` lines (``sysctl -a`` format).
+
+        Only the listed keys are read when given; otherwise all of /proc/sys.
+        """
+        base = self.path("proc", "sys")
+        if not os.path.isdir(base):
+            raise ProbeUnavailable(base)
+
+        if keys is None:
+            paths = []
+            for directory, _, files in os.walk(base):
+                paths.extend(os.path.join(directory, name) for name in files)
+            items = sorted((os.path.relpath(p, base).replace(os.sep, "."), p) for p in paths)
+        else:
+            items = sorted((key, os.path.join(base, *key.split("."))) for key in keys)
+
+        lines = []
+        for key, path in items:
+            try:
+                with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                    value = f.read().strip()
+            except OSError:
+                continue
+            lines.append(f"{key} = {value}\n")
+        return "".join(lines)
+
+    def _read_required(self, *parts: str) -> str:
+        path = self.path(*parts)
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise ProbeUnavailable(path)
+
+
+# Probe name -> (description used in results, reader)
+PROBES: Dict[str, Tuple[str, Callable[[KernelSnapshot, Optional[frozenset]], str]]] = {
+    "modules": ("/proc/modules", KernelSnapshot.modules),
+    "mounts": ("/proc/mounts", KernelSnapshot.mounts),
+    "sys_modules": ("/sys/module", KernelSnapshot.sys_modules),
+    "modprobe": ("/etc/modprobe.d", KernelSnapshot.modprobe),
+    "sysctl": ("/proc/sys", KernelSnapshot.sysctl),
+}
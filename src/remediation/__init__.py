@@ -0,0 +1,4 @@
+from .plan import RemediationPlan, checks_to_remediate
+from .engine import RemediationEngine, RemediationError
+
+__all__ = ['RemediationPlan', 'RemediationEngine', 'RemediationError', 'checks_to_remediate']
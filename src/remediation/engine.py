@@ -0,0 +1,225 @@
+"""
+Transactional application of remediation plans.
+
+Every file a plan touches is backed up before the first change. If any step
+fails, changed files are restored (files and directories the plan created
+are removed) and services that were already reloaded are reloaded again so
+the restored configuration takes effect.
+
+Only files are rolled back. Installed or removed packages, services enabled
+with ``systemctl enable --now``, unloaded kernel modules and ``command``
+fixes stay applied; the error lists the ones that already ran.
+"""
+
+import os
+import shlex
+import shutil
+import stat
+import subprocess
+import tempfile
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .plan import SYSCTL_RELOAD, RemediationPlan
+from ..auditors.command_checks import run_shell
+from ..probes.kernel import KernelSnapshot, ProbeUnavailable
+
+if TYPE_CHECKING:
+    from ..auditors.base_auditor import BaseAuditor, CheckResult
+
+Step = Tuple[str, Callable[[], None]]
+
+
+class RemediationError(Exception):
+    """Raised when a remediation step fails after the changes were rolled back."""
+
+
+class RemediationEngine:
+    """Apply a remediation plan in one pass with backups and rollback.
+
+    ``root`` points the engine at an alternate filesystem tree for testing.
+    Backups go to ``backup_dir`` and are kept when it is given; otherwise
+    they are written to a temporary directory that is removed afterwards.
+    """
+
+    def __init__(self, root: str = "/", backup_dir: Optional[str] = None, timeout: float = 900,
+                 run_command: Callable[[str, float], Tuple[int, str]] = run_shell):
+        self.root = root
+        self.backup_dir = backup_dir
+        self.timeout = timeout
+        self.run_command = run_command
+        self.applied: List[str] = []
+
+    def path(self, path: str) -> str:
+        return os.path.join(self.root, path.lstrip("/"))
+
+    def steps(self, plan: RemediationPlan) -> List[Step]:
+        """Return the plan's steps, in the order they are applied."""
+        steps: List[Step] = []
+        for path, edits in plan.files.items():
+            steps.append((f"rewrite {path} ({len(edits)} settings)",
+                          lambda path=path, edits=edits: self._rewrite(path, edits)))
+        for path, mode in plan.modes.items():
+            steps.append((f"chmod {mode:03o} {path}",
+                          lambda path=path, mode=mode: os.chmod(self.path(path), mode)))
+
+        packages = plan.install + [f"{name}-" for name in plan.remove]
+        if packages:
+            steps.append(self._command("DEBIAN_FRONTEND=noninteractive apt-get install -y "
+                                       + " ".join(shlex.quote(p) for p in packages)))
+        if plan.enable:
+            steps.append(self._command("systemctl enable --now "
+                                       + " ".join(shlex.quote(s) for s in plan.enable)))
+        loaded = self._loaded_modules(plan.unload)
+        if loaded:
+            steps.append(self._command("modprobe -r -a " + " ".join(shlex.quote(m) for m in loaded)))
+        steps += [self._command(command) for command in plan.commands]
+        steps += [self._command(self._reload_command(service)) for service in plan.reloads]
+        return steps
+
+    def apply(self, plan: RemediationPlan) -> List[str]:
+        """Apply the plan and return the steps run; roll back and raise on failure.
+
+        Raises RemediationError before any change if the backups cannot be
+        written.
+        """
+        try:
+            backup_dir = self.backup_dir or tempfile.mkdtemp(prefix="cis-checker-backup-")
+        except OSError as e:
+            raise RemediationError(f"cannot create backup directory: {str(e)}") from e
+        self.applied = []
+        try:
+            try:
+                backups = self._backup(plan.targets(), backup_dir)
+            except OSError as e:
+                raise RemediationError(f"backup failed, nothing was changed: {str(e)}") from e
+            created = self._missing_dirs(plan.targets())
+            for description, run in self.steps(plan):
+                try:
+                    run()
+                except Exception as e:
+                    kept = self._rollback(plan, backups, created)
+                    message = f"{description} failed: {str(e)}; restored {len(backups)} files"
+                    if kept:
+                        message += f"; not rolled back: {', '.join(kept)}"
+                    raise RemediationError(message) from e
+                self.applied.append(description)
+        finally:
+            if not self.backup_dir:
+                shutil.rmtree(backup_dir, ignore_errors=True)
+        return self.applied
+
+    def verify(self, auditor: "BaseAuditor", check_ids: List[str]) -> List["CheckResult"]:
+        """Re-run only the given checks, and their prerequisites, in parallel."""
+        from ..auditors.scheduler import CheckScheduler
+
+        specs = {spec.check_id: spec for spec in auditor.get_check_specs()}
+        needed, pending = set(), [check_id for check_id in check_ids if check_id in specs]
+        while pending:
+            check_id = pending.pop()
+            if check_id not in needed:
+                needed.add(check_id)
+                pending.extend(specs[check_id].depends_on)
+
+        scheduler = CheckScheduler([spec for spec in specs.values() if spec.check_id in needed],
+                                   max_workers=auditor.max_workers)
+        wanted = set(check_ids)
+        return [result for result in scheduler.run() if result.check_id in wanted]
+
+    def _command(self, command: str) -> Step:
+        def run():
+            try:
+                returncode, _ = self.run_command(command, self.timeout)
+            except subprocess.TimeoutExpired:
+                raise RemediationError(f"timed out after {self.timeout:g}s")
+            except subprocess.SubprocessError as e:
+                raise RemediationError(str(e))
+            if returncode != 0:
+                raise RemediationError(f"exit status {returncode}")
+        return command, run
+
+    @staticmethod
+    def _reload_command(service: str) -> str:
+        if service == SYSCTL_RELOAD:
+            return "sysctl --system"
+        return f"systemctl reload-or-restart {shlex.quote(service)}"
+
+    def _loaded_modules(self, modules: List[str]) -> List[str]:
+        if not modules:
+            return []
+        try:
+            text = KernelSnapshot(self.root).read("modules")
+        except ProbeUnavailable:
+            return []
+        loaded = {line.split(" ", 1)[0] for line in text.splitlines()}
+        return [module for module in modules if module in loaded]
+
+    def _rewrite(self, path: str, edits):
+        """Apply all edits to a file in one atomic rewrite, keeping its mode."""
+        target = self.path(path)
+        try:
+            with open(target, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            mode = stat.S_IMODE(os.stat(target).st_mode)
+        except FileNotFoundError:
+            lines, mode = [], 0o644
+        for edit in edits:
+            lines = edit.apply(lines)
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp_path = target + ".cis-checker.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines) + "\n")
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+
+    def _backup(self, paths: List[str], backup_dir: str) -> Dict[str, Optional[str]]:
+        """Copy existing targets into backup_dir; map each path to its copy or None."""
+        backups = {}
+        for path in paths:
+            target = self.path(path)
+            if not os.path.exists(target):
+                backups[path] = None
+                continue
+            copy = os.path.join(backup_dir, path.lstrip("/"))
+            os.makedirs(os.path.dirname(copy), exist_ok=True)
+            shutil.copy2(target, copy)
+            backups[path] = copy
+        return backups
+
+    def _missing_dirs(self, paths: List[str]) -> List[str]:
+        """Return the directories that writing paths would create, deepest first."""
+        missing = set()
+        for path in paths:
+            directory = os.path.dirname(self.path(path))
+            while directory and not os.path.isdir(directory):
+                missing.add(directory)
+                directory = os.path.dirname(directory)
+        return sorted(missing, key=len, reverse=True)
+
+    def _rollback(self, plan: RemediationPlan, backups: Dict[str, Optional[str]],
+                  created: List[str]) -> List[str]:
+        """Restore files and reload services; return applied steps left in place."""
+        for path, copy in backups.items():
+            target = self.path(path)
+            try:
+                if copy is None:
+                    if os.path.exists(target):
+                        os.remove(target)
+                else:
+                    shutil.copy2(copy, target)
+            except OSError:
+                continue
+        for directory in created:
+            try:
+                os.rmdir(directory)
+            except OSError:
+                continue
+        reloads = [self._reload_command(service) for service in plan.reloads]
+        for command in reloads:
+            if command in self.applied:
+                try:
+                    self.run_command(command, self.timeout)
+                except (OSError, subprocess.SubprocessError):
+                    continue
+        return [step for step in self.applied
+                if not step.startswith(("rewrite ", "chmod ")) and step not in reloads]
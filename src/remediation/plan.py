@@ -0,0 +1,154 @@
+"""
+Remediation plans built from the ``fix`` actions of profile checks.
+
+Each check may declare a list of structured actions instead of relying on
+its free-text ``remediation``. A plan merges the actions of every selected
+check by target: all edits to one file become one rewrite, all package
+changes one apt transaction and every affected service is reloaded once.
+
+Supported action types:
+
+* ``file_line`` - set ``line`` in ``path``, replacing lines that match
+  ``match`` (default: lines starting with the same key); optional ``reload``
+* ``sysctl``    - persist ``key = value`` and reload kernel parameters
+* ``modprobe``  - disable ``module`` and unload it if it is loaded
+* ``mode``      - chmod ``path`` to the octal ``mode``
+* ``package``   - ``install`` or ``remove`` a package
+* ``service``   - ``enable`` and start a service
+* ``command``   - ``run`` a shell command after all other changes
+"""
+
+import re
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from ..auditors.base_auditor import CheckResult
+
+ACTION_TYPES = ("file_line", "sysctl", "modprobe", "mode", "package", "service", "command")
+SYSCTL_CONF = "/etc/sysctl.d/60-cis-checker.conf"
+MODPROBE_CONF = "/etc/modprobe.d/cis-checker.conf"
+# Pseudo-service reloaded with ``sysctl --system``
+SYSCTL_RELOAD = "sysctl"
+
+
+class FileEdit:
+    """Set one line of a configuration file."""
+
+    def __init__(self, line: str, match: Optional[str] = None):
+        self.line = line
+        key = re.split(r'[\s=]', line.strip(), 1)[0]
+        self.pattern = re.compile(match or rf'^\s*{re.escape(key)}(?=[\s=]|$)')
+
+    def apply(self, lines: List[str]) -> List[str]:
+        """Replace the first matching line, drop later ones, or append."""
+        result, replaced = [], False
+        for line in lines:
+            if self.pattern.match(line):
+                if not replaced:
+                    result.append(self.line)
+                    replaced = True
+            else:
+                result.append(line)
+        if not replaced:
+            result.append(self.line)
+        return result
+
+
+class RemediationPlan:
+    """Fixes for a set of checks, grouped by the target they change."""
+
+    def __init__(self):
+        self.check_ids: List[str] = []
+        self.manual: List[str] = []
+        self.files: Dict[str, List[FileEdit]] = {}
+        self.modes: Dict[str, int] = {}
+        self.install: List[str] = []
+        self.remove: List[str] = []
+        self.enable: List[str] = []
+        self.unload: List[str] = []
+        self.commands: List[str] = []
+        self.reloads: List[str] = []
+
+    @classmethod
+    def from_profile(cls, profile_data: Dict, check_ids: Iterable[str]) -> "RemediationPlan":
+        """Plan the fixes of the given checks; checks without ``fix`` are manual."""
+        checks = {check["id"]: check for check in profile_data.get("checks", [])}
+        plan = cls()
+        for check_id in check_ids:
+            fix = checks.get(check_id, {}).get("fix")
+            if fix:
+                plan.add(check_id, fix)
+            else:
+                _append(plan.manual, check_id)
+        return plan
+
+    def add(self, check_id: str, actions: List[Dict]):
+        """Merge a check's fix actions into the plan."""
+        for action in actions:
+            kind = action.get("type")
+            if kind not in ACTION_TYPES:
+                raise ValueError(f"Check {check_id}: unknown fix type {kind!r}")
+            if kind == "file_line":
+                self._edit(action["path"], FileEdit(action["line"], action.get("match")))
+                if action.get("reload"):
+                    _append(self.reloads, action["reload"])
+            elif kind == "sysctl":
+                self._edit(SYSCTL_CONF, FileEdit(f"{action['key']} = {action['value']}"))
+                _append(self.reloads, SYSCTL_RELOAD)
+            elif kind == "modprobe":
+                module = action["module"]
+                self._edit(MODPROBE_CONF, FileEdit(f"install {module} /bin/true",
+                                                   rf'^\s*install\s+{re.escape(module)}\s'))
+                self._edit(MODPROBE_CONF, FileEdit(f"blacklist {module}",
+                                                   rf'^\s*blacklist\s+{re.escape(module)}\s*$'))
+                _append(self.unload, module)
+            elif kind == "mode":
+                self.modes[action["path"]] = int(str(action["mode"]), 8)
+            elif kind == "package":
+                if action.get("install"):
+                    _append(self.install, action["install"])
+                if action.get("remove"):
+                    _append(self.remove, action["remove"])
+            elif kind == "service":
+                _append(self.enable, action["enable"])
+            else:
+                _append(self.commands, action["run"])
+        _append(self.check_ids, check_id)
+
+    def _edit(self, path: str, edit: FileEdit):
+        edits = self.files.setdefault(path, [])
+        if all(e.line != edit.line for e in edits):
+            edits.append(edit)
+
+    def targets(self) -> List[str]:
+        """Files the plan changes, which are backed up before applying it."""
+        return list(dict.fromkeys(list(self.files) + list(self.modes)))
+
+
+def checks_to_remediate(results: List["CheckResult"],
+                        depends_on: Dict[str, Iterable[str]]) -> List[str]:
+    """Return the failed checks and the skipped checks that remediation unblocks.
+
+    A check skipped because prerequisites did not pass is included when all
+    of those prerequisites are remediated too, so a fresh host is fixed in
+    one pass.
+    """
+    statuses = {result.check_id: result.status for result in results}
+    selected = {check_id for check_id, status in statuses.items() if status == "fail"}
+    changed = True
+    while changed:
+        changed = False
+        for check_id, status in statuses.items():
+            if status != "skip" or check_id in selected:
+                continue
+            blocking = [dep for dep in depends_on.get(check_id, ())
+                        if statuses.get(dep) != "pass"]
+            if blocking and all(dep in selected for dep in blocking):
+                selected.add(check_id)
+                changed = True
+    return [result.check_id for result in results if result.check_id in selected]
+
+
+def _append(items: List[str], item: str):
+    if item not in items:
+        items.append(item)
@@ -1,5 +1,9 @@
 from .html_reporter import HTMLReporter
 from .json_reporter import JSONReporter
 from .csv_reporter import CSVReporter
+from .compact_reporter import CompactReporter, load_audit_data
+from .fleet_reporter import FleetReporter, iter_runs
+from .jsonl_reader import read_jsonl
 
-__all__ = ['HTMLReporter', 'JSONReporter', 'CSVReporter']
+__all__ = ['HTMLReporter', 'JSONReporter', 'CSVReporter', 'CompactReporter', 'load_audit_data',
+           'FleetReporter', 'iter_runs', 'read_jsonl']
@@ -0,0 +1,201 @@
+"""
+Compact binary archive format for CIS compliance audits.
+
+Check text (title, severity, remediation) is stored once per profile and
+descriptions once per archive; each result is a small record of integer
+indices. The payload is gzip-framed compact JSON so archives can be read
+without extra dependencies.
+
+Values are stored as they are, so a round trip returns the original runs:
+a record may carry the result's other keys and the standard keys it lacks.
+"""
+
+import gzip
+import json
+import zlib
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from .jsonl_reader import is_jsonl, read_jsonl
+
+MAGIC = b"CISZ"
+FORMAT_VERSION = 1
+STATUSES = ("pass", "fail", "skip", "error")
+CHECK_FIELDS = ("check_id", "title", "severity", "remediation")
+RESULT_FIELDS = CHECK_FIELDS + ("status", "description", "timestamp")
+# Key order of CheckResult.to_dict(), so round-tripped reports look unchanged
+RESULT_ORDER = ("check_id", "title", "status", "description", "remediation",
+                "severity", "timestamp")
+
+
+def is_compact(path: str) -> bool:
+    """Return True if the file at path is a compact archive."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_audit_data(path: str) -> Dict:
+    """Load a single audit run from a JSON report, compact archive or collector output."""
+    if is_jsonl(path):
+        return read_jsonl(path)
+    if not is_compact(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    runs = CompactReporter().read(path)
+    if len(runs) != 1:
+        raise ValueError(f"{path} contains {len(runs)} audit runs, expected exactly one")
+    return runs[0]
+
+
+class CompactReporter:
+    """Generate compact binary compliance archives."""
+
+    def __init__(self, compresslevel: int = 9):
+        self.compresslevel = compresslevel
+
+    def generate(self, audit_data: Dict, output_path: str) -> str:
+        """Generate a compact archive from a single audit run."""
+        return self.write([audit_data], output_path)
+
+    def write(self, runs: List[Dict], output_path: str) -> str:
+        """Write one or more audit runs into a single archive."""
+        payload = json.dumps(self.pack(runs), separators=(',', ':'), ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(MAGIC + bytes([FORMAT_VERSION]))
+            f.write(gzip.compress(payload.encode('utf-8'), compresslevel=self.compresslevel))
+        return output_path
+
+    def read(self, input_path: str) -> List[Dict]:
+        """Read all audit runs from an archive.
+
+        Raises ValueError for files that are not archives or are truncated
+        or corrupt.
+        """
+        with open(input_path, 'rb') as f:
+            header = f.read(len(MAGIC) + 1)
+            if len(header) <= len(MAGIC) or header[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{input_path} is not a compact audit archive")
+            if header[len(MAGIC)] != FORMAT_VERSION:
+                raise ValueError(f"Unsupported archive version: {header[len(MAGIC)]}")
+            data = f.read()
+        try:
+            archive = json.loads(gzip.decompress(data).decode('utf-8'))
+            return self.unpack(archive)
+        except (OSError, EOFError, zlib.error, ValueError, LookupError, TypeError) as e:
+            raise ValueError(f"{input_path} is a corrupt compact audit archive: {e}") from e
+
+    def pack(self, runs: List[Dict]) -> Dict:
+        """Convert audit runs into the indexed archive structure."""
+        catalogues: Dict[str, List[List[str]]] = {}
+        check_index: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        strings: List[str] = []
+        string_index: Dict[str, int] = {}
+        packed_runs = []
+
+        for run in runs:
+            profile = str(run.get("profile", ""))
+            catalogue = catalogues.setdefault(profile, [])
+            base = _parse_timestamp(run.get("timestamp"))
+            records = []
+
+            for result in run.get("results", []):
+                check = tuple(result.get(field) for field in CHECK_FIELDS)
+                key = (profile, check if _hashable(check) else json.dumps(check))
+                if key not in check_index:
+                    check_index[key] = len(catalogue)
+                    catalogue.append(list(check))
+
+                extra = {k: v for k, v in result.items() if k not in RESULT_FIELDS}
+                description = result.get("description", "")
+                if not isinstance(description, str):
+                    extra["description"] = description
+                    description = ""
+                if description not in string_index:
+                    string_index[description] = len(strings)
+                    strings.append(description)
+
+                record = [
+                    check_index[key],
+                    _status_code(result.get("status")),
+                    string_index[description],
+                    _timestamp_offset(base, result.get("timestamp")),
+                ]
+                missing = [field for field in RESULT_ORDER if field not in result]
+                if extra or missing:
+                    record.append(extra)
+                if missing:
+                    record.append(missing)
+                records.append(record)
+
+            meta = {k: v for k, v in run.items() if k != "results"}
+            packed_runs.append({"meta": meta, "results": records})
+
+        return {"catalogues": catalogues, "strings": strings, "runs": packed_runs}
+
+    def unpack(self, archive: Dict) -> List[Dict]:
+        """Expand the indexed archive structure back into audit runs."""
+        catalogues = archive["catalogues"]
+        strings = archive["strings"]
+        runs = []
+
+        for packed in archive["runs"]:
+            meta = packed["meta"]
+            catalogue = catalogues[str(meta.get("profile", ""))]
+            base = _parse_timestamp(meta.get("timestamp"))
+            results = []
+
+            for record in packed["results"]:
+                result = dict(zip(CHECK_FIELDS, catalogue[record[0]]))
+                result["status"] = _status_name(record[1])
+                result["description"] = strings[record[2]]
+                result["timestamp"] = _timestamp_from_offset(base, record[3])
+                ordered = {field: result[field] for field in RESULT_ORDER}
+                if len(record) > 4:
+                    ordered.update(record[4])
+                for field in record[5] if len(record) > 5 else ():
+                    del ordered[field]
+                results.append(ordered)
+
+            run = dict(meta)
+            run["results"] = results
+            runs.append(run)
+
+        return runs
+
+
+def _hashable(values: Tuple) -> bool:
+    return all(isinstance(v, (str, int, float, bool)) or v is None for v in values)
+
+
+def _status_code(status):
+    return STATUSES.index(status) if status in STATUSES else status
+
+
+def _status_name(code) -> str:
+    return STATUSES[code] if isinstance(code, int) else code
+
+
+def _parse_timestamp(value):
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _timestamp_offset(base, value):
+    """Store a result timestamp as integer microseconds after the run timestamp."""
+    parsed = _parse_timestamp(value)
+    if base is None or parsed is None or parsed.isoformat() != value:
+        return value
+    try:
+        delta = parsed - base
+    except TypeError:
+        return value
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _timestamp_from_offset(base, offset):
+    if base is None or not isinstance(offset, int):
+        return offset
+    return (base + timedelta(microseconds=offset)).isoformat()
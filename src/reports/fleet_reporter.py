@@ -0,0 +1,433 @@
+"""
+Fleet dashboard generator for CIS compliance audits across many hosts.
+
+All input runs are aggregated in a single pass. The dashboard page embeds
+only compact per-host status strings and draws the controls x hosts heatmap
+on a canvas; per-host details are written as separate fragment pages that
+the dashboard loads on demand.
+
+Controls are keyed by profile and check ID, since different profiles may
+reuse an ID for unrelated controls.
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jinja2 import Template
+
+from .compact_reporter import CompactReporter, is_compact
+from .jsonl_reader import is_jsonl, read_jsonl
+
+STATUS_CODES = {"pass": "p", "fail": "f", "skip": "s", "error": "e"}
+MISSING = "-"
+_UNSAFE_CHARS = re.compile(r'[^A-Za-z0-9._-]')
+_FRAGMENT_NAME = re.compile(r'^\d{5}_[A-Za-z0-9._-]*\.html$')
+
+
+FLEET_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>CIS Fleet Compliance Dashboard</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
+            background: #f5f7fa;
+            padding: 20px;
+            line-height: 1.6;
+        }
+        .container { max-width: 1400px; margin: 0 auto; }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 40px;
+            border-radius: 12px;
+            margin-bottom: 30px;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+        }
+        .header h1 { font-size: 32px; margin-bottom: 10px; }
+        .header p { opacity: 0.9; font-size: 16px; }
+        .card {
+            background: white;
+            padding: 30px;
+            border-radius: 12px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            margin-bottom: 30px;
+        }
+        .score-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+        }
+        .stat-box { padding: 20px; border-radius: 8px; text-align: center; }
+        .stat-box h3 { font-size: 36px; margin-bottom: 5px; }
+        .stat-box p { color: #666; font-size: 14px; }
+        .stat-pass { background: #d4edda; color: #155724; }
+        .stat-fail { background: #f8d7da; color: #721c24; }
+        .stat-total { background: #d1ecf1; color: #0c5460; }
+        .section-title {
+            font-size: 24px;
+            margin: 40px 0 20px;
+            color: #333;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+        }
+        .columns { display: grid; grid-template-columns: 1fr 1fr; gap: 30px; }
+        table { width: 100%; border-collapse: collapse; font-size: 14px; }
+        th, td { text-align: left; padding: 6px 10px; border-bottom: 1px solid #e9ecef; }
+        th { color: #666; font-weight: 600; }
+        td.num { text-align: right; font-variant-numeric: tabular-nums; }
+        a.host { color: #667eea; cursor: pointer; text-decoration: none; }
+        .bar { background: #e9ecef; border-radius: 4px; height: 8px; width: 120px; }
+        .bar span { display: block; background: #28a745; height: 8px; border-radius: 4px; }
+        #heatmap-wrap { overflow: auto; max-height: 600px; }
+        #heatmap { image-rendering: pixelated; cursor: crosshair; }
+        #heatmap-info { font-size: 13px; color: #666; min-height: 20px; margin-top: 10px; }
+        .legend span { display: inline-block; width: 12px; height: 12px; margin: 0 4px 0 12px;
+                       vertical-align: middle; border-radius: 2px; }
+        #detail { width: 100%; height: 600px; border: none; }
+        .footer { text-align: center; margin-top: 40px; padding: 20px; color: #666; font-size: 14px; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🛡️ CIS Fleet Compliance Dashboard</h1>
+            <p><strong>Profiles:</strong> {{ profiles | join(', ') }}</p>
+            <p><strong>Generated:</strong> {{ timestamp }}</p>
+        </div>
+
+        <div class="card">
+            <div class="score-grid">
+                <div class="stat-box stat-total">
+                    <h3>{{ host_count }}</h3>
+                    <p>Hosts</p>
+                </div>
+                <div class="stat-box stat-total">
+                    <h3>{{ control_count }}</h3>
+                    <p>Controls</p>
+                </div>
+                <div class="stat-box stat-pass">
+                    <h3>{{ average_score }}%</h3>
+                    <p>Average Compliance</p>
+                </div>
+                <div class="stat-box stat-fail">
+                    <h3>{{ failing_hosts }}</h3>
+                    <p>Hosts Below {{ threshold }}%</p>
+                </div>
+            </div>
+        </div>
+
+        <h2 class="section-title">🗺️ Controls × Hosts</h2>
+        <div class="card">
+            <div class="legend">
+                <span style="background:#28a745"></span>Pass
+                <span style="background:#dc3545"></span>Fail
+                <span style="background:#ffc107"></span>Skip
+                <span style="background:#6c757d"></span>Error
+                <span style="background:#e9ecef"></span>Not run
+            </div>
+            <div id="heatmap-wrap"><canvas id="heatmap"></canvas></div>
+            <div id="heatmap-info">Hosts are rows (worst first), controls are columns (lowest pass rate first). Click a row for details.</div>
+        </div>
+
+        <div class="columns">
+            <div>
+                <h2 class="section-title">🚨 Worst Offenders</h2>
+                <div class="card">
+                    <table>
+                        <tr><th>Host</th><th>Profile</th><th class="num">Failed</th><th class="num">Score</th></tr>
+                        {% for host in worst_hosts %}
+                        <tr>
+                            <td><a class="host" data-index="{{ host.index }}">{{ host.name }}</a></td>
+                            <td>{{ host.profile }}</td>
+                            <td class="num">{{ host.failed }}</td>
+                            <td class="num">{{ host.score }}%</td>
+                        </tr>
+                        {% endfor %}
+                    </table>
+                </div>
+            </div>
+            <div>
+                <h2 class="section-title">📉 Least Compliant Controls</h2>
+                <div class="card">
+                    <table>
+                        <tr><th>Control</th><th class="num">Failing Hosts</th><th class="num">Pass Rate</th></tr>
+                        {% for control in worst_controls %}
+                        <tr title="{{ control.title }}">
+                            <td>{{ control.label }}</td>
+                            <td class="num">{{ control.fail }}</td>
+                            <td class="num">{{ control.pass_rate }}%</td>
+                        </tr>
+                        {% endfor %}
+                    </table>
+                </div>
+            </div>
+        </div>
+
+        <h2 class="section-title">🔎 Host Detail</h2>
+        <div class="card">
+            <iframe id="detail" title="Host detail"></iframe>
+        </div>
+
+        <h2 class="section-title">📋 Pass Rate per Control</h2>
+        <div class="card">
+            <table>
+                <tr><th>Control</th><th>Title</th><th>Severity</th><th class="num">Pass</th><th class="num">Fail</th><th class="num">Skip</th><th class="num">Error</th><th>Pass Rate</th></tr>
+                {% for control in controls %}
+                <tr>
+                    <td>{{ control.label }}</td>
+                    <td>{{ control.title }}</td>
+                    <td>{{ control.severity }}</td>
+                    <td class="num">{{ control.pass }}</td>
+                    <td class="num">{{ control.fail }}</td>
+                    <td class="num">{{ control.skip }}</td>
+                    <td class="num">{{ control.error }}</td>
+                    <td><div class="bar"><span style="width: {{ control.pass_rate }}%"></span></div></td>
+                </tr>
+                {% endfor %}
+            </table>
+        </div>
+
+        <div class="footer">
+            <p>Generated by CIS Benchmark Compliance Checker</p>
+            <p>For more information, visit <a href="https://github.com/SiteQ8/CIS-Benchmark-Compliance-Checker">GitHub Repository</a></p>
+        </div>
+    </div>
+    <script id="fleet-data" type="application/json">{{ data_json | safe }}</script>
+    <script>
+    (function () {
+        var data = JSON.parse(document.getElementById('fleet-data').textContent);
+        var colors = {p: '#28a745', f: '#dc3545', s: '#ffc107', e: '#6c757d', '-': '#e9ecef'};
+        var cell = Math.max(2, Math.min(12, Math.floor(1200 / Math.max(1, data.controls.length))));
+        var canvas = document.getElementById('heatmap');
+        var info = document.getElementById('heatmap-info');
+        canvas.width = data.controls.length * cell;
+        canvas.height = data.hosts.length * cell;
+        var ctx = canvas.getContext('2d');
+        data.hosts.forEach(function (host, row) {
+            for (var col = 0; col < host.c.length; col++) {
+                ctx.fillStyle = colors[host.c[col]];
+                ctx.fillRect(col * cell, row * cell, cell, cell);
+            }
+        });
+        function showHost(index) {
+            document.getElementById('detail').src = data.fragments + '/' + data.hosts[index].f;
+        }
+        canvas.addEventListener('mousemove', function (event) {
+            var row = Math.floor(event.offsetY / cell), col = Math.floor(event.offsetX / cell);
+            var host = data.hosts[row], control = data.controls[col];
+            if (host && control) {
+                info.textContent = host.n + ' · ' + control + ' · ' + ({p: 'pass', f: 'fail', s: 'skip', e: 'error', '-': 'not run'})[host.c[col]];
+            }
+        });
+        canvas.addEventListener('click', function (event) {
+            var row = Math.floor(event.offsetY / cell);
+            if (data.hosts[row]) { showHost(row); }
+        });
+        document.querySelectorAll('a.host').forEach(function (link) {
+            link.addEventListener('click', function () { showHost(+link.dataset.index); });
+        });
+    })();
+    </script>
+</body>
+</html>
+"""
+
+HOST_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>{{ host }}</title>
+    <style>
+        body { font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif; font-size: 14px; color: #333; }
+        h2 { margin-bottom: 6px; }
+        .meta { color: #666; margin-bottom: 16px; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { text-align: left; padding: 6px 10px; border-bottom: 1px solid #e9ecef; vertical-align: top; }
+        .badge { padding: 2px 8px; border-radius: 10px; font-size: 11px; font-weight: 600; text-transform: uppercase; }
+        .badge-fail { background: #f8d7da; color: #721c24; }
+        .badge-skip { background: #fff3cd; color: #856404; }
+        .badge-error { background: #e2e3e5; color: #383d41; }
+        code { background: #e9ecef; padding: 2px 6px; border-radius: 3px; font-size: 12px; }
+    </style>
+</head>
+<body>
+    <h2>{{ host }}</h2>
+    <p class="meta">{{ profile }} · Level {{ level }} · {{ timestamp }} · {{ score }}% compliant · {{ passed }} of {{ total }} passed</p>
+    <table>
+        <tr><th>Control</th><th>Status</th><th>Title</th><th>Details</th></tr>
+        {% for check in issues %}
+        <tr>
+            <td>{{ check.check_id }}</td>
+            <td><span class="badge badge-{{ check.status }}">{{ check.status }}</span></td>
+            <td>{{ check.title }}</td>
+            <td>{{ check.description }}{% if check.remediation %}<br><code>{{ check.remediation }}</code>{% endif %}</td>
+        </tr>
+        {% endfor %}
+    </table>
+    {% if not issues %}<p>All checks passed.</p>{% endif %}
+</body>
+</html>
+"""
+
+
+def _control_key(check_id: str):
+    """Sort CIS IDs numerically, so 1.10 follows 1.9."""
+    return [(0, int(part), "") if part.isdigit() else (1, 0, part)
+            for part in check_id.split(".")]
+
+
+def iter_runs(paths: Iterable[str]) -> Iterator[Dict]:
+    """Yield audit runs from JSON reports, collector output, compact archives and directories."""
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(n for n in os.listdir(path) if n.endswith((".json", ".cisz", ".jsonl")))
+            yield from iter_runs(os.path.join(path, n) for n in names)
+        elif is_jsonl(path):
+            yield read_jsonl(path)
+        elif is_compact(path):
+            for run in CompactReporter().read(path):
+                yield run
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                run = json.load(f)
+            run.setdefault("host", os.path.splitext(os.path.basename(path))[0])
+            yield run
+
+
+class FleetReporter:
+    """Generate a fleet-wide HTML compliance dashboard."""
+
+    def __init__(self, threshold: int = 80, top: int = 20):
+        self.threshold = threshold
+        self.top = top
+        self.template = Template(FLEET_TEMPLATE, autoescape=True)
+        self.host_template = Template(HOST_TEMPLATE, autoescape=True)
+
+    def generate(self, runs: Iterable[Dict], output_path: str) -> str:
+        """Aggregate runs and write the dashboard plus per-host fragments."""
+        output_dir = os.path.dirname(output_path) or '.'
+        fragments = os.path.splitext(os.path.basename(output_path))[0] + "_hosts"
+        fragment_dir = os.path.join(output_dir, fragments)
+        os.makedirs(fragment_dir, exist_ok=True)
+        # Drop fragments of hosts from earlier renders that may be gone now
+        for name in os.listdir(fragment_dir):
+            if _FRAGMENT_NAME.match(name):
+                os.remove(os.path.join(fragment_dir, name))
+
+        aggregates = self.aggregate(runs, fragment_dir)
+        html_content = self.render(aggregates, fragments)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(html_content)
+        return output_path
+
+    def aggregate(self, runs: Iterable[Dict], fragment_dir: Optional[str] = None) -> Dict:
+        """Build fleet aggregates in one pass, writing host fragments as runs stream by."""
+        control_index: Dict[Tuple[str, str], int] = {}
+        controls: List[Dict] = []
+        hosts: List[Dict] = []
+        profiles = set()
+
+        for run in runs:
+            codes: List[str] = [MISSING] * len(controls)
+            passed = failed = 0
+            profile = str(run.get("profile", ""))
+            for result in run.get("results", []):
+                check_id = result.get("check_id", "")
+                index = control_index.get((profile, check_id))
+                if index is None:
+                    index = control_index[(profile, check_id)] = len(controls)
+                    controls.append({"profile": profile, "check_id": check_id,
+                                     "title": result.get("title", ""),
+                                     "severity": result.get("severity", ""),
+                                     "pass": 0, "fail": 0, "skip": 0, "error": 0})
+                    codes.append(MISSING)
+                status = result.get("status", "")
+                if status in STATUS_CODES:
+                    controls[index][status] += 1
+                    codes[index] = STATUS_CODES[status]
+                passed += status == "pass"
+                failed += status == "fail"
+
+            total = len(run.get("results", []))
+            name = str(run.get("host") or f"host-{len(hosts) + 1}")
+            host = {
+                "name": name,
+                "profile": run.get("profile", ""),
+                "score": round(passed / total * 100, 1) if total else 0.0,
+                "failed": failed,
+                "codes": codes,
+                "fragment": f"{len(hosts):05d}_{_UNSAFE_CHARS.sub('_', name)}.html",
+            }
+            hosts.append(host)
+            profiles.add(profile)
+
+            if fragment_dir:
+                self._write_fragment(run, host, passed, total, fragment_dir)
+
+        for control in controls:
+            evaluated = control["pass"] + control["fail"] + control["error"]
+            control["pass_rate"] = round(control["pass"] / evaluated * 100, 1) if evaluated else 100.0
+            control["label"] = (control["check_id"] if len(profiles) < 2
+                                else f"{control['check_id']} ({control['profile']})")
+
+        return {"controls": controls, "hosts": hosts, "profiles": sorted(profiles)}
+
+    def render(self, aggregates: Dict, fragments: str) -> str:
+        """Render the dashboard page from precomputed aggregates."""
+        controls = aggregates["controls"]
+        hosts = aggregates["hosts"]
+
+        column_order = sorted(range(len(controls)), key=lambda i: (controls[i]["pass_rate"], i))
+        row_order = sorted(range(len(hosts)), key=lambda i: (hosts[i]["score"], i))
+        rows = []
+        for row, i in enumerate(row_order):
+            host = hosts[i]
+            host["index"] = row
+            codes = host["codes"] + [MISSING] * (len(controls) - len(host["codes"]))
+            rows.append({"n": host["name"], "f": host["fragment"],
+                         "c": "".join(codes[c] for c in column_order)})
+
+        data = {
+            "controls": [controls[c]["label"] for c in column_order],
+            "hosts": rows,
+            "fragments": fragments,
+        }
+        scores = [host["score"] for host in hosts]
+
+        return self.template.render(
+            profiles=aggregates["profiles"],
+            timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            host_count=len(hosts),
+            control_count=len(controls),
+            average_score=round(sum(scores) / len(scores), 1) if scores else 0.0,
+            threshold=self.threshold,
+            failing_hosts=sum(1 for score in scores if score < self.threshold),
+            worst_hosts=[hosts[i] for i in row_order[:self.top]],
+            worst_controls=[controls[c] for c in column_order[:self.top]],
+            controls=sorted(controls, key=lambda c: (c["profile"], _control_key(c["check_id"]))),
+            # Escape "</" so the JSON cannot close its script element
+            data_json=json.dumps(data, separators=(',', ':')).replace("</", "<\\/"),
+        )
+
+    def _write_fragment(self, run: Dict, host: Dict, passed: int, total: int,
+                        fragment_dir: str):
+        issues = [r for r in run.get("results", []) if r.get("status") != "pass"]
+        html_content = self.host_template.render(
+            host=host["name"],
+            profile=run.get("profile", ""),
+            level=run.get("level", 1),
+            timestamp=run.get("timestamp", ""),
+            score=host["score"],
+            passed=passed,
+            total=total,
+            issues=issues,
+        )
+        with open(os.path.join(fragment_dir, host["fragment"]), 'w', encoding='utf-8') as f:
+            f.write(html_content)
@@ -0,0 +1,69 @@
+"""
+Reading of JSON Lines results written by compiled shell collectors.
+
+A collector prints a ``run`` record followed by one ``result`` record per
+check; this module turns that stream into the audit data layout written by
+``BaseAuditor.export_results``.
+"""
+
+import json
+from typing import Dict, Iterable
+
+RESULT_KEYS = ("check_id", "title", "status", "description", "remediation",
+               "severity", "timestamp")
+
+
+def is_jsonl(path: str) -> bool:
+    """Return True if the file at path starts with a collector run record."""
+    with open(path, 'rb') as f:
+        first = f.readline(4096).strip()
+    if not first.startswith(b"{"):
+        return False
+    try:
+        record = json.loads(first)
+    except ValueError:
+        return False
+    return isinstance(record, dict) and record.get("type") == "run"
+
+
+def parse_jsonl(lines: Iterable[str]) -> Dict:
+    """Build audit data from collector output lines.
+
+    Raises ValueError for malformed lines or a stream without a run record.
+    """
+    run = None
+    results = []
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"line {number}: {e}")
+        if record.get("type") == "run":
+            run = record
+        elif record.get("type") == "result":
+            results.append({key: record.get(key, "") for key in RESULT_KEYS})
+    if run is None:
+        raise ValueError("collector output has no run record")
+
+    passed = sum(1 for r in results if r["status"] == "pass")
+    return {
+        "host": run.get("host", ""),
+        "profile": run.get("profile", ""),
+        "level": run.get("level", 1),
+        "compliance_score": (passed / len(results)) * 100 if results else 0.0,
+        "total_checks": len(results),
+        "passed": passed,
+        "failed": sum(1 for r in results if r["status"] == "fail"),
+        "skipped": sum(1 for r in results if r["status"] == "skip"),
+        "timestamp": run.get("timestamp", ""),
+        "results": results,
+    }
+
+
+def read_jsonl(path: str) -> Dict:
+    """Load audit data from a collector's JSON Lines output file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_jsonl(f)
@@ -0,0 +1,39 @@
+"""
+Loading of CIS profile definitions from the configs directory.
+"""
+
+import json
+import os
+from typing import Dict
+
+CONFIGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'configs')
+
+
+def profile_path(profile: str) -> str:
+    """Resolve a profile name such as ``ubuntu_22_04`` or a path to its JSON file."""
+    if os.path.isfile(profile):
+        return profile
+    name = profile if profile.startswith("cis_") else f"cis_{profile}"
+    return os.path.normpath(os.path.join(CONFIGS_DIR, f"{name}.json"))
+
+
+def load_profile(profile: str) -> Dict:
+    """Load a profile definition. Raises FileNotFoundError if it does not exist."""
+    with open(profile_path(profile), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def check_ttls(profile_data: Dict) -> Dict[str, float]:
+    """Return the cache TTL in seconds for every check in a profile.
+
+    A check's own ``cache_ttl`` wins over the ``cache_ttls`` entry for its
+    category, which wins over ``cache_ttls["default"]``. Checks without any
+    TTL are never served from the cache.
+    """
+    category_ttls = profile_data.get("cache_ttls", {})
+    default = category_ttls.get("default", 0)
+    ttls = {}
+    for check in profile_data.get("checks", []):
+        ttl = check.get("cache_ttl", category_ttls.get(check.get("category"), default))
+        ttls[check["id"]] = float(ttl)
+    return ttls
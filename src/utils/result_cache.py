@@ -0,0 +1,86 @@
+"""
+Persistent cache of check results with per-check TTLs.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from ..auditors.base_auditor import CheckResult
+
+
+def default_cache_path() -> str:
+    """Return the cache file location, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "cis-checker", "results.json")
+
+
+class ResultCache:
+    """Store check results on disk and serve them while they are fresh.
+
+    Entries are evicted once they are older than ``max_entry_age`` seconds,
+    and the oldest entries are dropped when there are more than
+    ``max_entries``. ``max_age`` caps every TTL, so ``max_age=0`` bypasses
+    the cache for reads.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_age: Optional[float] = None,
+                 max_entries: int = 10000, max_entry_age: float = 7 * 86400):
+        self.path = path or default_cache_path()
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.max_entry_age = max_entry_age
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def get(self, key: str, ttl: float) -> Optional[CheckResult]:
+        """Return the cached result for key if it is younger than ttl."""
+        if self.max_age is not None:
+            ttl = min(ttl, self.max_age)
+        with self._lock:
+            entry = self._entries.get(key)
+            if ttl <= 0 or entry is None or time.time() - entry["stored_at"] > ttl:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return CheckResult.from_dict(entry["result"])
+
+    def put(self, key: str, result: CheckResult):
+        """Store a fresh result."""
+        with self._lock:
+            self._entries[key] = {"stored_at": time.time(), "result": result.to_dict()}
+
+    def invalidate(self, keys: Iterable[str]):
+        """Drop the entries for keys, such as checks whose state was just changed."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def save(self):
+        """Evict stale and excess entries and write the cache to disk."""
+        now = time.time()
+        with self._lock:
+            entries = {k: v for k, v in self._entries.items()
+                       if now - v["stored_at"] <= self.max_entry_age}
+            if len(entries) > self.max_entries:
+                newest = sorted(entries.items(), key=lambda item: item[1]["stored_at"])
+                entries = dict(newest[-self.max_entries:])
+            self._entries = entries
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(entries, separators=(',', ':')))
+        os.replace(tmp_path, self.path)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
@@ -0,0 +1,75 @@
+"""
+Unit tests for the account database and section 6.2 controls.
+"""
+
+import os
+
+import pytest
+from src.auditors.account_checks import AccountChecks
+from src.probes import AccountDatabase
+
+# Owner of the home directories created by the fixture
+ALICE_UID = 1000 if os.getuid() == 0 else os.getuid()
+
+
+@pytest.fixture
+def root(tmp_path):
+    uid = ALICE_UID
+    (tmp_path / "etc").mkdir()
+    (tmp_path / "home" / "alice").mkdir(parents=True)
+    (tmp_path / "home" / "bob").mkdir()
+    if os.getuid() == 0:
+        os.chown(tmp_path / "home" / "alice", uid, uid)
+        os.chown(tmp_path / "home" / "bob", uid, uid)
+    os.chmod(tmp_path / "home" / "alice", 0o750)
+    os.chmod(tmp_path / "home" / "bob", 0o755)
+    (tmp_path / "etc" / "passwd").write_text(
+        "root:x:0:0:root:/root:/usr/sbin/nologin\n"
+        "toor:x:0:0::/root:/usr/sbin/nologin\n"
+        f"alice:x:{uid}:100::/home/alice:/bin/bash\n"
+        "bob:secret:3000:4242::/home/bob:/bin/bash\n"
+        "carol:x:3000:42::/home/carol:/bin/sh\n"
+        "daemon:x:1:1::/usr/sbin:/usr/sbin/nologin\n"
+        "broken line\n"
+    )
+    (tmp_path / "etc" / "shadow").write_text("root:*:19000::::::\nalice::19000::::::\n")
+    (tmp_path / "etc" / "group").write_text(
+        "root:x:0:\ndaemon:x:1:\nusers:x:100:\nshadow:x:42:alice\nstaff:x:100:\n")
+    return tmp_path
+
+
+def _statuses(root):
+    checks = AccountChecks(AccountDatabase(str(root)))
+    return {spec.check_id: spec.func() for spec in checks.specs()}
+
+
+def test_account_database_indexes(root):
+    """Test parsing, duplicate detection and malformed lines."""
+    db = AccountDatabase(str(root))
+    assert [a.name for a in db.accounts][:3] == ["root", "toor", "alice"]
+    assert db.malformed == ["passwd: broken line"]
+    assert db.duplicate_uids() == {0: ["root", "toor"], 3000: ["bob", "carol"]}
+    assert db.duplicate_gids() == {100: ["users", "staff"]}
+    assert db.missing_groups() == {4242: ["bob"]}
+    assert db.root_equivalents() == ["toor"]
+    assert [a.name for a in db.interactive_accounts()] == ["alice", "bob", "carol"]
+    assert db.home_stats()["/home/carol"] is None
+
+
+def test_account_controls(root):
+    """Test each control reports its offenders."""
+    results = _statuses(root)
+    failing = {cid: r.description for cid, r in results.items() if r.status == "fail"}
+    assert sorted(failing) == ["6.2.1", "6.2.10", "6.2.11", "6.2.12", "6.2.13", "6.2.2",
+                               "6.2.3", "6.2.4", "6.2.5", "6.2.6"]
+    assert failing["6.2.4"] == "2 found: alice; carol"
+    assert failing["6.2.5"] == "2 found: UID 0 (root, toor); UID 3000 (bob, carol)"
+    assert failing["6.2.12"] == f"1 found: bob: /home/bob is owned by UID {ALICE_UID}"
+    assert failing["6.2.13"] == "1 found: bob: /home/bob has mode 755"
+    assert results["6.2.7"].status == "pass"
+
+
+def test_missing_account_files_are_errors(tmp_path):
+    """Test a missing passwd file yields error results instead of exceptions."""
+    results = _statuses(tmp_path)
+    assert {r.status for r in results.values()} == {"error"}
@@ -0,0 +1,150 @@
+"""
+Unit tests for the fleet ingest server, store and client.
+"""
+
+import asyncio
+import json
+import threading
+import urllib.error
+import urllib.request
+import pytest
+from src.aggregation import IngestClient, IngestServer, ResultStore, compute_delta
+
+
+def _run(host, statuses, timestamp="2026-01-01T00:00:00"):
+    results = [{"check_id": f"1.1.{i}", "title": f"Check {i}", "status": status,
+                "description": "", "remediation": "", "severity": "medium",
+                "timestamp": "2026-01-01T00:00:00"}
+               for i, status in enumerate(statuses)]
+    return {"host": host, "profile": "ubuntu_22_04", "level": 1, "timestamp": timestamp,
+            "results": results}
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Run an ingest server on an ephemeral localhost port."""
+    loop = asyncio.new_event_loop()
+    srv = IngestServer(ResultStore(str(tmp_path)), port=0, flush_interval=0.05)
+    loop.run_until_complete(srv.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield srv
+    asyncio.run_coroutine_threadsafe(srv.close(), loop).result(timeout=5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    loop.close()
+
+
+def test_store_applies_delta(tmp_path):
+    """Test that a delta only replaces the changed results."""
+    store = ResultStore(str(tmp_path))
+    previous = _run("web-1", ["pass", "fail", "fail"])
+    current = _run("web-1", ["pass", "pass", "fail"])
+    store.apply(previous)
+
+    delta = compute_delta(previous, current)
+    assert [r["check_id"] for r in delta["results"]] == ["1.1.1"]
+
+    store.apply(delta)
+    assert [r["status"] for r in store.hosts["web-1"]["results"]] == ["pass", "pass", "fail"]
+    assert store.hosts["web-1"]["passed"] == 2
+
+    store.flush(["web-1"])
+    reloaded = ResultStore(str(tmp_path))
+    assert reloaded.load() == 1
+
+
+def test_upload_and_summary(server, tmp_path):
+    """Test full and delta uploads end to end on localhost."""
+    client = IngestClient(f"http://127.0.0.1:{server.port}")
+    previous = _run("web-1", ["fail", "fail"])
+    client.upload(previous, "web-1")
+    client.upload(_run("web-2", ["pass", "pass"]), "web-2")
+    client.upload(_run("web-1", ["pass", "fail"], "2026-01-02T00:00:00"), "web-1", previous)
+    client.close()
+
+    for _ in range(100):
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/health") as response:
+            if json.load(response)["ingested"] == 3:
+                break
+        threading.Event().wait(0.02)
+
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/summary") as response:
+        summary = json.load(response)
+
+    assert summary["hosts"] == 2
+    assert summary["average_score"] == 75.0
+    assert summary["top_failures"] == [["1.1.1", 1]]
+    assert (tmp_path / "web-1.json").exists()
+
+
+def test_delta_without_base_falls_back_to_full(server):
+    """Test that a delta for an unknown host is answered with a conflict."""
+    client = IngestClient(f"http://127.0.0.1:{server.port}")
+    previous = _run("db-1", ["fail"])
+    assert client.upload(_run("db-1", ["pass"]), "db-1", previous) == {"accepted": 1}
+    client.close()
+
+
+def test_delta_against_unacknowledged_run_falls_back_to_full(server, tmp_path):
+    """Test that a delta based on a run the server never stored is refused."""
+    client = IngestClient(f"http://127.0.0.1:{server.port}")
+    client.upload(_run("web-1", ["fail", "fail"], "2026-01-01T00:00:00"), "web-1")
+    # The upload of the second run never reached the server
+    lost = _run("web-1", ["pass", "fail"], "2026-01-02T00:00:00")
+    current = _run("web-1", ["pass", "fail"], "2026-01-03T00:00:00")
+    assert compute_delta(lost, current)["results"] == []
+    assert client.upload(current, "web-1", lost) == {"accepted": 1}
+    client.close()
+
+    for _ in range(100):
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/health") as response:
+            if json.load(response)["ingested"] == 2:
+                break
+        threading.Event().wait(0.02)
+    assert [r["status"] for r in server.store.hosts["web-1"]["results"]] == ["pass", "fail"]
+
+
+def test_malformed_content_length_is_rejected(server):
+    """Test that a non-numeric Content-Length gets a 400 response."""
+    async def send():
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(b"POST /ingest HTTP/1.1\r\nContent-Length: abc\r\n\r\n{}")
+        await writer.drain()
+        status = await reader.readline()
+        writer.close()
+        return status
+
+    assert asyncio.run(send()).startswith(b"HTTP/1.1 400")
+
+
+def test_dropped_payloads_are_not_counted_as_ingested(tmp_path):
+    """Test that payloads the store rejects are counted separately."""
+    srv = IngestServer(ResultStore(str(tmp_path)))
+    srv._apply([_run("web-1", ["pass"]), dict(_run("db-1", ["pass"]), delta=True)])
+    assert (srv.ingested, srv.dropped) == (1, 1)
+
+
+def test_malformed_payload_is_rejected_and_writer_survives(server):
+    """Test bad payloads get a 400 and valid ones are still stored afterwards."""
+    for body in ({"host": "bad", "results": [1]}, {"host": 7}, {"host": "bad", "removed": "x"}):
+        request = urllib.request.Request(f"http://127.0.0.1:{server.port}/ingest",
+                                         data=json.dumps(body).encode('utf-8'), method="POST")
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(request)
+        assert error.value.code == 400
+
+    # A payload the store fails on is dropped without stopping the writer
+    loop = server._writer_task.get_loop()
+    asyncio.run_coroutine_threadsafe(
+        server._queue.put({"host": "bad", "results": [1]}), loop).result(timeout=5)
+    client = IngestClient(f"http://127.0.0.1:{server.port}")
+    client.upload(_run("web-1", ["pass"]), "web-1")
+    client.close()
+
+    for _ in range(100):
+        if "web-1" in server.store.hosts:
+            break
+        threading.Event().wait(0.02)
+    assert server.store.hosts["web-1"]["passed"] == 1
+    assert server.dropped == 1
@@ -0,0 +1,113 @@
+"""
+Unit tests for host facts and applicability pruning.
+"""
+
+import pytest
+from src.auditors.applicability import Applicability, profile_predicates
+from src.auditors.ubuntu_auditor import UbuntuAuditor
+from src.compiler import ShellCompiler
+from src.probes import HostFacts
+from src.utils.profile_loader import load_profile
+
+DPKG_STATUS = """Package: ufw
+Status: install ok installed
+Version: 0.36.1
+
+Package: auditd
+Status: deinstall ok config-files
+Version: 1:3.0.7
+"""
+
+
+def _host(root, container=False, systemd=True, packages=DPKG_STATUS):
+    (root / "etc").mkdir(parents=True, exist_ok=True)
+    (root / "etc" / "os-release").write_text('ID=ubuntu\nVERSION_ID="22.04"\n')
+    (root / "proc").mkdir(exist_ok=True)
+    (root / "proc" / "cpuinfo").write_text("processor\t: 0\nflags\t\t: fpu vme hypervisor\n")
+    if systemd:
+        (root / "run" / "systemd" / "system").mkdir(parents=True)
+    if container:
+        (root / ".dockerenv").write_text("")
+    if packages is not None:
+        (root / "var" / "lib" / "dpkg").mkdir(parents=True)
+        (root / "var" / "lib" / "dpkg" / "status").write_text(packages)
+    return HostFacts(str(root))
+
+
+def test_host_facts(tmp_path):
+    """Test facts are read from the host tree once and memoized."""
+    facts = _host(tmp_path)
+    assert facts.os_id == "ubuntu_22_04" and facts.os_name == "ubuntu"
+    assert facts.systemd and facts.virtualized
+    assert not facts.container and not facts.bare_metal
+    assert facts.packages == {"ufw"}
+
+    (tmp_path / "var" / "lib" / "dpkg" / "status").unlink()
+    (tmp_path / ".dockerenv").write_text("")
+    assert facts.packages == {"ufw"} and not facts.container
+    assert HostFacts(str(tmp_path)).packages is None
+
+
+def test_predicates_prune_controls_and_dependents(tmp_path):
+    """Test every condition, unknown facts and pruning of dependents."""
+    applicability = Applicability(_host(tmp_path, container=True), level=1)
+    predicates = {
+        "a": {"level": 2}, "b": {"packages": ["auditd"]}, "c": {"packages": "ufw"},
+        "d": {"systemd": False}, "e": {"container": False}, "f": {"os": ["ubuntu_2*"]},
+        "g": {"os": "rhel_*"}, "h": {"bare_metal": True}, "i": {"paths": ["/etc/os-release"]},
+        "j": {"paths": "/etc/ssh/sshd_config"},
+    }
+    depends_on = {check_id: [] for check_id in predicates}
+    depends_on.update({"k": ["c"], "l": ["m"], "m": ["a"]})
+
+    pruned = applicability.not_applicable(depends_on, predicates)
+    assert sorted(pruned) == ["a", "b", "d", "e", "g", "h", "j", "l", "m"]
+    assert pruned["a"] == "Not applicable: Level 2 control"
+    assert pruned["b"] == "Not applicable: requires package auditd"
+    assert pruned["l"] == "Not applicable: prerequisite m does not apply"
+
+    # Packages cannot be checked without a dpkg database
+    unknown = Applicability(_host(tmp_path / "bare", packages=None))
+    assert unknown.reason({"packages": ["auditd"]}) is None
+
+    with pytest.raises(ValueError, match="unknown applies_when condition 'kernel'"):
+        profile_predicates({"checks": [{"id": "1", "applies_when": {"kernel": "6"}}]})
+
+
+def test_firewall_policy_skipped_without_ufw(tmp_path):
+    """Test 3.5.1.7 is reported as skipped behind 3.5.1.1 on a host without ufw."""
+    auditor = UbuntuAuditor(level=1, facts=_host(tmp_path, packages=""))
+    results = {result.check_id: result for result in auditor.run_all_checks()}
+
+    assert results["3.5.1.1"].status == "fail"
+    assert results["3.5.1.7"].status == "skip"
+    assert "3.5.1.1" in results["3.5.1.7"].description
+
+
+def test_auditor_plans_before_running(tmp_path):
+    """Test the auditor prunes profile controls per host and level before any check runs."""
+    calls = []
+
+    class CountingAuditor(UbuntuAuditor):
+        def check_audit_logging(self):
+            calls.append("4.1.1.1")
+            return super().check_audit_logging()
+
+    container = CountingAuditor(level=2, facts=_host(tmp_path / "c", container=True))
+    specs = {spec.check_id for spec in container.get_applicable_specs()}
+    assert {"1.1.1", "1.1.2", "4.1.1.1", "4.1.1.2"} <= set(container.not_applicable)
+    assert "3.5.1.7" in specs and "6.2.1" in specs
+    assert calls == []
+
+    server = CountingAuditor(level=1, facts=_host(tmp_path / "s", packages=""))
+    server.get_applicable_specs()
+    assert server.not_applicable == {
+        "4.1.1.1": "Not applicable: Level 2 control",
+        "4.1.1.2": "Not applicable: Level 2 control",
+    }
+
+    # The shell collector leaves out controls above its level
+    profile_data = load_profile("ubuntu_22_04")
+    level1 = {check["id"] for check in ShellCompiler(profile_data, "p", level=1).checks()}
+    level2 = {check["id"] for check in ShellCompiler(profile_data, "p", level=2).checks()}
+    assert level2 - level1 == {"4.1.1.1", "4.1.1.2"}
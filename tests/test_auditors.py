@@ -3,8 +3,10 @@ Unit tests for auditor classes.
 """
 
 import pytest
+from src.auditors import ubuntu_auditor
 from src.auditors.base_auditor import BaseAuditor, CheckResult
 from src.auditors.ubuntu_auditor import UbuntuAuditor
+from src.probes import HostFacts
 
 
 def test_check_result_creation():
@@ -58,5 +60,20 @@ def test_compliance_score_calculation():
     assert score == 50.0  # 2 passed out of 4
 
 
+def test_missing_ufw_fails_firewall_check(tmp_path, monkeypatch):
+    """Test a missing ufw package or binary fails 3.5.1.1 instead of erroring."""
+    (tmp_path / "var" / "lib" / "dpkg").mkdir(parents=True)
+    (tmp_path / "var" / "lib" / "dpkg" / "status").write_text("")
+    result = UbuntuAuditor(facts=HostFacts(str(tmp_path))).check_firewall_status()
+    assert result.status == "fail" and result.description == "UFW is not installed"
+
+    def no_binary(*args, **kwargs):
+        raise FileNotFoundError(args[0][0])
+
+    monkeypatch.setattr(ubuntu_auditor.subprocess, "run", no_binary)
+    result = UbuntuAuditor(facts=HostFacts(str(tmp_path / "nodpkg"))).check_firewall_status()
+    assert result.status == "fail" and result.description == "UFW is not installed"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
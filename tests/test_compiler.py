@@ -0,0 +1,162 @@
+"""
+Test harness comparing compiled shell collectors with the Python engine.
+"""
+
+import functools
+import os
+import shutil
+import subprocess
+
+import pytest
+from src.auditors import ubuntu_auditor
+from src.auditors.command_checks import CommandCheckRunner
+from src.auditors.ubuntu_auditor import UbuntuAuditor
+from src.auditors.scheduler import CheckScheduler, CheckSpec
+from src.compiler import ShellCompiler, to_ere
+from src.probes import HostFacts, KernelSnapshot
+from src.reports.compact_reporter import load_audit_data
+from src.reports.jsonl_reader import parse_jsonl
+from src.utils.profile_loader import CONFIGS_DIR, load_profile
+
+pytestmark = pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX shell")
+
+LOGIN_DEFS = "printf 'PASS_MAX_DAYS\\t99999\\nPASS_MIN_DAYS 1\\nPASS_WARN_AGE x\\n'"
+PROFILE = {"checks": [
+    {"id": "1", "audit_command": LOGIN_DEFS,
+     "match": {"type": "numeric", "pattern": r"^\s*PASS_MAX_DAYS\s+(\d+)", "op": "<=", "value": 365}},
+    {"id": "2", "audit_command": LOGIN_DEFS,
+     "match": {"type": "numeric", "pattern": r"^PASS_MIN_DAYS (\d+)", "op": ">=", "value": 1}},
+    {"id": "3", "audit_command": LOGIN_DEFS,
+     "match": {"type": "numeric", "pattern": r"^PASS_WARN_AGE (\S+)", "op": ">=", "value": 7}},
+    {"id": "4", "audit_command": LOGIN_DEFS,
+     "match": {"type": "numeric", "pattern": r"^ENCRYPT_METHOD (\w+)", "op": "==", "value": 1}},
+    {"id": "5", "audit_command": LOGIN_DEFS, "expected_result": "PASS_MIN_DAYS 2",
+     "remediation": "edit 'login.defs'"},
+    {"id": "6", "audit_command": "printf '  net.ipv4.ip_forward = 0  \\n'",
+     "match": [{"type": "exact", "pattern": "net.ipv4.ip_forward = 0"},
+               {"type": "regex", "pattern": r"^\s+net\.ipv4\.[a-z_]+ = [01]\s*$"}]},
+    {"id": "7", "audit_command": "printf 'cramfs 1 0\\n'",
+     "match": {"type": "absent", "pattern": r"^(cramfs|freevxfs)\s"}},
+    {"id": "8", "audit_command": "true", "expected_result": ""},
+    {"id": "9", "audit_command": "no-such-command-anywhere", "expected_result": "x"},
+    {"id": "10", "audit_command": "echo ok", "expected_result": "ok", "depends_on": ["7"]},
+    {"id": "11", "audit_command": "echo ok", "expected_result": "ok", "depends_on": ["6"]},
+    {"id": "12", "probe": "sysctl", "audit_command": "printf 'kernel.x = 1\\n'",
+     "match": {"type": "exact", "pattern": "net.ipv4.ip_forward = 1"}},
+    {"id": "13", "probe": "mounts", "audit_command": "printf '/dev/sda1 /tmp ext4 rw,nodev 0 0\\n'",
+     "match": {"type": "regex", "pattern": r"\s/tmp\s.*nodev"}},
+    {"id": "14", "probe": "modules",
+     "match": [{"type": "absent", "pattern": r"^cramfs\s"},
+               {"type": "regex", "pattern": r"^install cramfs /bin/(true|false)$",
+                "probe": "modprobe"}]},
+]}
+
+
+def python_results(checks, snapshot):
+    runner = CommandCheckRunner(checks, snapshot=snapshot)
+    specs = [CheckSpec(c["id"], functools.partial(runner.result, c["id"]),
+                       depends_on=c.get("depends_on")) for c in checks]
+    return {r.check_id: (r.status, r.description, r.remediation)
+            for r in CheckScheduler(specs).run()}
+
+
+def shell_results(profile_data, root="/", level=1):
+    script = ShellCompiler(profile_data, "test", level=level, root=root).compile()
+    output = subprocess.run(["sh", "-c", script], capture_output=True, text=True, check=True).stdout
+    data = parse_jsonl(output.splitlines())
+    return {r["check_id"]: (r["status"], r["description"], r["remediation"])
+            for r in data["results"]}
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "proc" / "sys" / "net" / "ipv4").mkdir(parents=True)
+    (tmp_path / "proc" / "sys" / "net" / "ipv4" / "ip_forward").write_text("1\n")
+    (tmp_path / "proc" / "modules").write_text("cramfs 1 0 - Live 0x0\n")
+    (tmp_path / "etc" / "modprobe.d").mkdir(parents=True)
+    (tmp_path / "etc" / "modprobe.d" / "cramfs.conf").write_text("install cramfs   /bin/false # x\n")
+    return tmp_path
+
+
+def test_to_ere():
+    """Test translation of Python regex syntax to POSIX EREs."""
+    assert to_ere(r"^\s*PASS_MAX_DAYS\s+(\d+)") == "^[[:space:]]*PASS_MAX_DAYS[[:space:]]+([0-9]+)"
+    assert to_ere(r"net\.ipv4\.[\w.]+ = \S*?$") == r"net\.ipv4\.[[:alnum:]_.]+ = [^[:space:]]*$"
+    for unsupported in (r"(?i)yes", r"\bword", r"(a)\1", r"[\S]"):
+        with pytest.raises(ValueError):
+            to_ere(unsupported)
+
+
+def test_collector_matches_python_engine(root):
+    """Test every rule type, errors, skips and probe fallback agree with the Python engine."""
+    shell = shell_results(PROFILE, root=str(root))
+    assert shell == python_results(PROFILE["checks"], KernelSnapshot(str(root)))
+    assert shell["13"][1].startswith("Output of `printf")
+    assert shell["10"][0] == "skip"
+
+
+def test_collector_matches_python_engine_on_profile():
+    """Test the shipped profile evaluates identically on this host."""
+    profile_data = load_profile("ubuntu_22_04")
+    checks = ShellCompiler(profile_data, "ubuntu_22_04").checks()
+    assert shell_results(profile_data) == python_results(checks, KernelSnapshot())
+
+
+def test_collector_matches_audit_on_profile(tmp_path):
+    """Test the collector and cis-checker audit agree on every control they share."""
+    (tmp_path / "run" / "systemd" / "system").mkdir(parents=True)
+    auditor = UbuntuAuditor(level=2, facts=HostFacts(str(tmp_path)))
+    audit = {r.check_id: r.status for r in auditor.run_all_checks()}
+    shell = {check_id: result[0] for check_id, result
+             in shell_results(auditor.get_profile_data(), level=2).items()}
+
+    assert set(shell) <= set(audit)
+    assert shell == {check_id: audit[check_id] for check_id in shell}
+
+
+@pytest.mark.parametrize("enabled, active, expected", [
+    ("enabled", "active", "pass"),
+    ("enabled", "inactive", "fail"),
+    ("disabled", "active", "fail"),
+    (None, None, "error"),
+])
+def test_auditd_service_parity(monkeypatch, enabled, active, expected):
+    """Test the collector, the Python engine and the audit agree on 4.1.1.2 output."""
+    check = next(c for c in load_profile("ubuntu_22_04")["checks"] if c["id"] == "4.1.1.2")
+    command = "no-such-systemctl" if enabled is None else f"printf '{enabled}\\n{active}\\n'"
+    profile = {"checks": [{"id": "4.1.1.2", "audit_command": command, "match": check["match"]}]}
+
+    def systemctl(args, **kwargs):
+        if enabled is None:
+            raise FileNotFoundError(args[0])
+        state = enabled if args[1] == "is-enabled" else active
+        return subprocess.CompletedProcess(args, 0, state + "\n", "")
+
+    with monkeypatch.context() as patched:
+        patched.setattr(ubuntu_auditor.subprocess, "run", systemctl)
+        audit = UbuntuAuditor().check_auditd_service().status
+    shell = shell_results(profile)["4.1.1.2"][0]
+    python = python_results(profile["checks"], KernelSnapshot())["4.1.1.2"][0]
+    assert shell == python == audit == expected
+
+
+def test_shipped_collector_is_up_to_date():
+    """Test scripts/bash/ubuntu_checks.sh is the compiled ubuntu_22_04 profile."""
+    path = os.path.join(CONFIGS_DIR, "..", "scripts", "bash", "ubuntu_checks.sh")
+    with open(path, 'r', encoding='utf-8') as f:
+        shipped = f.read()
+    assert shipped == ShellCompiler(load_profile("ubuntu_22_04"), "ubuntu_22_04").compile()
+
+
+def test_report_reads_collector_output(tmp_path):
+    """Test collector output loads as a regular audit run."""
+    script = ShellCompiler(PROFILE, "test").compile()
+    path = tmp_path / "host.jsonl"
+    with open(path, 'w') as f:
+        subprocess.run(["sh", "-c", script], stdout=f, check=True)
+
+    data = load_audit_data(str(path))
+    assert data["profile"] == "test"
+    assert data["total_checks"] == len(PROFILE["checks"])
+    assert data["passed"] + data["failed"] + data["skipped"] <= data["total_checks"]
+    assert data["host"]
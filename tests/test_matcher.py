@@ -0,0 +1,96 @@
+"""
+Unit tests for profile rule matching and command-based checks.
+"""
+
+import pytest
+from src.auditors.command_checks import CommandCheckRunner
+from src.auditors.matcher import Rule, SourceMatcher
+
+SYSCTL = """net.ipv4.conf.all.accept_redirects = 1
+net.ipv4.conf.all.send_redirects = 0
+net.ipv4.conf.default.send_redirects = 0
+net.ipv4.ip_forward = 0
+"""
+
+
+def _outcome(rules, output):
+    return {k: v[0] for k, v in SourceMatcher(rules).evaluate(output).items()}
+
+
+def test_rule_types():
+    """Test exact, regex, numeric, absent and contains semantics."""
+    rules = [
+        Rule("exact", "exact", "net.ipv4.ip_forward = 0"),
+        Rule("regex", "regex", r"^net\.ipv4\.conf\.all\.accept_redirects = [01]$"),
+        Rule("numeric", "numeric", r"^net\.ipv4\.conf\.all\.accept_redirects = (\d+)", "<=", 0),
+        Rule("absent", "absent", r"^net\.ipv6"),
+        Rule("contains", "contains", "send_redirects = 0"),
+        Rule("empty", "absent"),
+    ]
+    assert _outcome(rules, SYSCTL) == {
+        "exact": True, "regex": True, "numeric": False,
+        "absent": True, "contains": True, "empty": False,
+    }
+
+
+def test_anchored_rules_use_line_index():
+    """Test leading-field keys derived from anchored patterns."""
+    assert Rule("a", "absent", r"^cramfs\s").key == "cramfs"
+    assert Rule("a", "numeric", r"^\s*PASS_MAX_DAYS\s+(\d+)", "<=", 365).key == "PASS_MAX_DAYS"
+    assert Rule("a", "regex", r"^net\.ipv6").key_is_prefix
+    assert Rule("a", "regex", r"^foo|bar").key is None
+    assert Rule("a", "regex", r"Status: active").key is None
+
+
+def test_contains_literal_searched_once():
+    """Test that checks sharing a contains literal search the output once."""
+    class CountingOutput(str):
+        searches = 0
+
+        def __contains__(self, item):
+            CountingOutput.searches += 1
+            return super().__contains__(item)
+
+    rules = [Rule(str(i), "contains", "send_redirects = 0") for i in range(5)]
+    rules.append(Rule("5", "contains", "ip_forward = 1"))
+    outcome = _outcome(rules, CountingOutput(SYSCTL))
+    assert outcome == {"0": True, "1": True, "2": True, "3": True, "4": True, "5": False}
+    assert CountingOutput.searches == 2
+
+
+def test_check_passes_only_if_all_rules_pass():
+    """Test that a check with several rules fails if any rule fails."""
+    check = {"id": "3.2.1", "match": [
+        {"type": "exact", "pattern": "net.ipv4.conf.all.send_redirects = 0"},
+        {"type": "exact", "pattern": "net.ipv4.conf.default.send_redirects = 1"},
+    ]}
+    assert _outcome(Rule.from_check(check), SYSCTL) == {"3.2.1": False}
+
+
+def test_unknown_match_type_rejected():
+    """Test that invalid match definitions raise ValueError."""
+    with pytest.raises(ValueError):
+        Rule("x", "fuzzy", "a")
+    with pytest.raises(ValueError):
+        Rule("x", "numeric", r"(\d+)")
+
+
+def test_shared_command_runs_once():
+    """Test that checks reading the same command share one execution."""
+    calls = []
+
+    def run_command(command, timeout):
+        calls.append(command)
+        return 0, SYSCTL
+
+    checks = [
+        {"id": "3.2.2", "audit_command": "sysctl -a", "expected_result": "net.ipv4.ip_forward = 0"},
+        {"id": "3.3.2", "audit_command": "sysctl -a", "remediation": "sysctl -w ...",
+         "match": {"type": "exact", "pattern": "net.ipv4.conf.all.accept_redirects = 0"}},
+    ]
+    runner = CommandCheckRunner(checks, run_command=run_command)
+
+    assert runner.result("3.2.2").status == "pass"
+    failed = runner.result("3.3.2")
+    assert failed.status == "fail" and failed.remediation
+    assert calls == ["sysctl -a"]
@@ -0,0 +1,71 @@
+"""
+Unit tests for native kernel probes.
+"""
+
+import pytest
+from src.auditors.command_checks import CommandCheckRunner
+from src.probes import KernelSnapshot, ProbeUnavailable
+
+CRAMFS = {
+    "id": "1.1.1", "title": "cramfs", "audit_command": "lsmod", "probe": "modules",
+    "match": [
+        {"type": "absent", "pattern": r"^cramfs\s"},
+        {"type": "regex", "pattern": r"^install cramfs /bin/(true|false)$", "probe": "modprobe"},
+    ],
+}
+IP_FORWARD = {
+    "id": "3.2.2", "title": "ip_forward", "audit_command": "sysctl -a", "probe": "sysctl",
+    "match": {"type": "exact", "pattern": "net.ipv4.ip_forward = 0"},
+}
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "proc" / "sys" / "net" / "ipv4").mkdir(parents=True)
+    (tmp_path / "proc" / "sys" / "net" / "ipv4" / "ip_forward").write_text("0\n")
+    (tmp_path / "proc" / "sys" / "net" / "ipv4" / "tcp_syncookies").write_text("1\n")
+    (tmp_path / "proc" / "modules").write_text("ext4 1 0 - Live 0x0\ncramfs 2 0 - Live 0x0\n")
+    (tmp_path / "etc" / "modprobe.d").mkdir(parents=True)
+    (tmp_path / "etc" / "modprobe.d" / "cramfs.conf").write_text(
+        "# disable cramfs\ninstall  cramfs   /bin/true  # CIS 1.1.1\n")
+    return tmp_path
+
+
+def test_probes_render_command_format(root):
+    """Test probes render text shaped like the commands they replace."""
+    snapshot = KernelSnapshot(str(root))
+    assert snapshot.read("sysctl") == "net.ipv4.ip_forward = 0\nnet.ipv4.tcp_syncookies = 1\n"
+    assert snapshot.read("sysctl", ["net.ipv4.ip_forward"]) == "net.ipv4.ip_forward = 0\n"
+    assert snapshot.read("modprobe") == "install cramfs /bin/true\n"
+    assert snapshot.read("modules").startswith("ext4 ")
+    with pytest.raises(ProbeUnavailable):
+        snapshot.read("mounts")
+
+
+def test_runner_reads_probes_instead_of_commands(root):
+    """Test probe-backed checks never run their audit command."""
+    def run_command(command, timeout):
+        raise AssertionError(f"unexpected command: {command}")
+
+    runner = CommandCheckRunner([CRAMFS, IP_FORWARD], run_command=run_command,
+                                snapshot=KernelSnapshot(str(root)))
+    cramfs = runner.result("1.1.1")
+    assert cramfs.status == "fail"
+    assert cramfs.description.startswith("/proc/modules does not satisfy")
+    assert runner.result("3.2.2").status == "pass"
+
+
+def test_unavailable_probe_falls_back_to_command(tmp_path):
+    """Test checks use their audit command when the probe source is missing."""
+    calls = []
+
+    def run_command(command, timeout):
+        calls.append(command)
+        return 0, "net.ipv4.ip_forward = 1\n"
+
+    runner = CommandCheckRunner([IP_FORWARD], run_command=run_command,
+                                snapshot=KernelSnapshot(str(tmp_path)))
+    result = runner.result("3.2.2")
+    assert result.status == "fail"
+    assert result.description.startswith("Output of `sysctl -a`")
+    assert calls == ["sysctl -a"]
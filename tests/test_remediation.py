@@ -0,0 +1,130 @@
+"""
+Unit tests for remediation planning and the remediation engine.
+"""
+
+import subprocess
+
+import pytest
+from src.auditors.base_auditor import CheckResult
+from src.remediation import (RemediationEngine, RemediationError, RemediationPlan,
+                             checks_to_remediate)
+from src.utils.profile_loader import load_profile
+
+PROFILE = {"checks": [
+    {"id": "1.1.1", "fix": [{"type": "modprobe", "module": "cramfs"}]},
+    {"id": "3.2.2", "fix": [{"type": "sysctl", "key": "net.ipv4.ip_forward", "value": "0"}]},
+    {"id": "3.3.2", "fix": [
+        {"type": "sysctl", "key": "net.ipv4.conf.all.accept_redirects", "value": "0"}]},
+    {"id": "4.1.1.1", "fix": [{"type": "package", "install": "auditd"}]},
+    {"id": "5.2.1", "fix": [{"type": "file_line", "path": "/etc/ssh/sshd_config",
+                             "line": "PermitRootLogin no", "reload": "ssh"}]},
+    {"id": "5.2.2", "fix": [{"type": "file_line", "path": "/etc/ssh/sshd_config",
+                             "line": "MaxAuthTries 4", "reload": "ssh"},
+                            {"type": "package", "remove": "telnet"}]},
+    {"id": "6.2.7", "remediation": "Rename or remove the duplicate accounts"},
+]}
+
+
+@pytest.fixture
+def root(tmp_path):
+    (tmp_path / "etc" / "ssh").mkdir(parents=True)
+    (tmp_path / "etc" / "ssh" / "sshd_config").write_text(
+        "# PermitRootLogin prohibit-password\nPermitRootLogin yes\nPermitRootLogin yes\n")
+    (tmp_path / "proc").mkdir()
+    (tmp_path / "proc" / "modules").write_text("cramfs 1 0 - Live 0x0\n")
+    return tmp_path
+
+
+def _plan():
+    return RemediationPlan.from_profile(PROFILE, [c["id"] for c in PROFILE["checks"]])
+
+
+def test_plan_groups_fixes_by_target():
+    """Test fixes are merged per file, package transaction and service."""
+    plan = _plan()
+    assert plan.manual == ["6.2.7"]
+    assert len(plan.files["/etc/ssh/sshd_config"]) == 2
+    assert len(plan.files["/etc/sysctl.d/60-cis-checker.conf"]) == 2
+    assert plan.install == ["auditd"] and plan.remove == ["telnet"]
+    assert plan.reloads == ["sysctl", "ssh"]
+
+
+def test_firewall_fix_allows_ssh_before_enabling():
+    """Test enabling ufw cannot lock out the SSH session running the fix."""
+    plan = RemediationPlan.from_profile(load_profile("ubuntu_22_04"), ["3.5.1.1"])
+    assert plan.install == ["ufw"]
+    assert len(plan.commands) == 2 and "ufw allow" in plan.commands[0]
+    assert plan.commands[1] == "ufw --force enable"
+
+
+def test_blocked_dependents_are_remediated_with_prerequisites():
+    """Test checks skipped behind a failed prerequisite are planned in the same pass."""
+    results = [CheckResult("3.5.1.1", "", "fail"), CheckResult("3.5.1.7", "", "skip"),
+               CheckResult("4.1.1.1", "", "error"), CheckResult("4.1.1.2", "", "skip"),
+               CheckResult("5.1", "", "pass"), CheckResult("5.2", "", "skip"),
+               CheckResult("5.3", "", "skip")]
+    depends_on = {"3.5.1.7": ["3.5.1.1"], "4.1.1.2": ["4.1.1.1"], "5.3": ["5.2", "5.1"]}
+    assert checks_to_remediate(results, depends_on) == ["3.5.1.1", "3.5.1.7"]
+
+
+def test_apply_runs_one_pass(root):
+    """Test one rewrite per file, one apt transaction and one reload per service."""
+    commands = []
+    engine = RemediationEngine(str(root), run_command=lambda c, t: commands.append(c) or (0, ""))
+    engine.apply(_plan())
+
+    assert (root / "etc" / "ssh" / "sshd_config").read_text() == (
+        "# PermitRootLogin prohibit-password\nPermitRootLogin no\nMaxAuthTries 4\n")
+    assert (root / "etc" / "modprobe.d" / "cis-checker.conf").read_text() == (
+        "install cramfs /bin/true\nblacklist cramfs\n")
+    assert commands == [
+        "DEBIAN_FRONTEND=noninteractive apt-get install -y auditd telnet-",
+        "modprobe -r -a cramfs",
+        "sysctl --system",
+        "systemctl reload-or-restart ssh",
+    ]
+
+
+def test_failed_step_rolls_back(root):
+    """Test files are restored and created files and directories removed when a step fails."""
+    commands = []
+
+    def run_command(command, timeout):
+        commands.append(command)
+        return (1, "") if command.startswith("systemctl") else (0, "")
+
+    engine = RemediationEngine(str(root), run_command=run_command)
+    with pytest.raises(RemediationError, match="reload-or-restart ssh failed") as raised:
+        engine.apply(_plan())
+
+    assert "PermitRootLogin yes" in (root / "etc" / "ssh" / "sshd_config").read_text()
+    assert not (root / "etc" / "sysctl.d").exists()
+    assert not (root / "etc" / "modprobe.d").exists()
+    # Package and module changes are reported, not reversed
+    assert str(raised.value).endswith("not rolled back: DEBIAN_FRONTEND=noninteractive "
+                                      "apt-get install -y auditd telnet-, modprobe -r -a cramfs")
+    # Kernel parameters are reloaded again from the restored configuration
+    assert commands[-1] == "sysctl --system"
+
+
+def test_timed_out_step_rolls_back(root):
+    """Test a hung command is reported as a failed step and rolled back."""
+    def run_command(command, timeout):
+        if command.startswith("DEBIAN_FRONTEND"):
+            raise subprocess.TimeoutExpired(command, timeout)
+        return 0, ""
+
+    engine = RemediationEngine(str(root), timeout=5, run_command=run_command)
+    with pytest.raises(RemediationError, match="apt-get .* failed: timed out after 5s"):
+        engine.apply(_plan())
+    assert "PermitRootLogin yes" in (root / "etc" / "ssh" / "sshd_config").read_text()
+
+
+def test_backup_failure_changes_nothing(root, tmp_path):
+    """Test an unwritable backup directory aborts before the first change."""
+    (tmp_path / "backups").write_text("not a directory")
+    engine = RemediationEngine(str(root), backup_dir=str(tmp_path / "backups"),
+                               run_command=lambda c, t: (0, ""))
+    with pytest.raises(RemediationError, match="backup failed"):
+        engine.apply(_plan())
+    assert "PermitRootLogin yes" in (root / "etc" / "ssh" / "sshd_config").read_text()
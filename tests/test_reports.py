@@ -0,0 +1,143 @@
+"""
+Unit tests for report generators.
+"""
+
+import json
+import pytest
+from src.auditors.base_auditor import CheckResult
+from src.reports.compact_reporter import CompactReporter, is_compact, load_audit_data
+from src.reports.fleet_reporter import FleetReporter, iter_runs
+
+
+def _audit_data(profile="ubuntu_22_04"):
+    results = [
+        CheckResult("1.1.1", "Ensure cramfs is disabled", "pass", "cramfs not loaded"),
+        CheckResult("6.1.2", "Ensure /etc/shadow permissions", "fail",
+                    "/etc/shadow has incorrect permissions: 640",
+                    remediation="chmod 000 /etc/shadow", severity="critical"),
+        CheckResult("4.1.1.2", "Ensure auditd is active", "skip", "Skipped"),
+    ]
+    return {
+        "profile": profile,
+        "level": 1,
+        "compliance_score": 33.3,
+        "total_checks": 3,
+        "passed": 1,
+        "failed": 1,
+        "skipped": 1,
+        "timestamp": results[-1].timestamp.isoformat(),
+        "results": [r.to_dict() for r in results],
+    }
+
+
+def test_compact_round_trip(tmp_path):
+    """Test that a compact archive loads back to the original audit data."""
+    data = _audit_data()
+    path = tmp_path / "audit.cisz"
+    CompactReporter().generate(data, str(path))
+
+    assert is_compact(str(path))
+    assert load_audit_data(str(path)) == data
+
+
+def test_compact_round_trip_keeps_types_and_missing_keys():
+    """Test that None, non-string values and absent keys survive a round trip."""
+    runs = [{"host": "web-1", "profile": "ubuntu_22_04", "timestamp": None, "results": [
+        {"check_id": "1.1.1", "title": None, "status": "pass", "description": None,
+         "severity": 3, "timestamp": None, "remediation": ""},
+        {"check_id": "1.1.2", "title": "x", "status": None, "description": "",
+         "timestamp": "not a time", "extra": [1]},
+        {"check_id": "1.1.3", "title": ["x"], "status": "fail"},
+    ]}]
+    reporter = CompactReporter()
+    assert reporter.unpack(json.loads(json.dumps(reporter.pack(runs)))) == runs
+
+
+def test_corrupt_compact_archive_raises_value_error(tmp_path):
+    """Test truncated and corrupt archives are reported as ValueError."""
+    path = tmp_path / "audit.cisz"
+    CompactReporter().generate(_audit_data(), str(path))
+    data = path.read_bytes()
+    for broken in (data[:len(data) // 2], data[:5] + b"garbage", data[:4]):
+        path.write_bytes(broken)
+        with pytest.raises(ValueError):
+            load_audit_data(str(path))
+
+
+def test_load_audit_data_reads_json(tmp_path):
+    """Test that load_audit_data still accepts plain JSON reports."""
+    data = _audit_data()
+    path = tmp_path / "audit.json"
+    path.write_text(json.dumps(data))
+
+    assert load_audit_data(str(path)) == data
+
+
+def test_compact_archive_shares_check_text(tmp_path):
+    """Test that check text is stored once across runs of the same profile."""
+    runs = [_audit_data() for _ in range(50)]
+    reporter = CompactReporter()
+    packed = reporter.pack(runs)
+
+    assert len(packed["catalogues"]["ubuntu_22_04"]) == 3
+    path = tmp_path / "fleet.cisz"
+    reporter.write(runs, str(path))
+    assert reporter.read(str(path)) == runs
+    with pytest.raises(ValueError):
+        load_audit_data(str(path))
+
+
+def test_fleet_aggregates_in_one_pass(tmp_path):
+    """Test per-control pass rates and per-host scores across runs."""
+    runs = [dict(_audit_data(), host=f"host-{i}") for i in range(3)]
+    runs[0]["results"][1]["status"] = "pass"
+
+    aggregates = FleetReporter().aggregate(iter(runs))
+    controls = {c["check_id"]: c for c in aggregates["controls"]}
+
+    assert controls["6.1.2"]["pass"] == 1 and controls["6.1.2"]["fail"] == 2
+    assert controls["6.1.2"]["pass_rate"] == 33.3
+    assert controls["4.1.1.2"]["pass_rate"] == 100.0  # only skipped
+    assert [h["codes"] for h in aggregates["hosts"]] == [["p", "p", "s"], ["p", "f", "s"], ["p", "f", "s"]]
+
+
+def test_fleet_dashboard_reads_mixed_inputs(tmp_path):
+    """Test dashboard generation from JSON files and compact archives."""
+    inputs = tmp_path / "fleet"
+    inputs.mkdir()
+    (inputs / "web-1.json").write_text(json.dumps(_audit_data()))
+    CompactReporter().write([dict(_audit_data(), host="db-1"), dict(_audit_data(), host="db-2")],
+                            str(inputs / "db.cisz"))
+
+    output = tmp_path / "dashboard.html"
+    FleetReporter().generate(iter_runs([str(inputs)]), str(output))
+
+    html = output.read_text()
+    assert "db-2" in html and "web-1" in html
+    assert len(list((tmp_path / "dashboard_hosts").iterdir())) == 3
+
+
+def test_fleet_keys_controls_by_profile(tmp_path):
+    """Test that profiles reusing a check ID get separate columns."""
+    runs = [dict(_audit_data(), host="web-1"), dict(_audit_data("rhel_9"), host="db-1")]
+    runs[1]["results"][1]["status"] = "pass"
+
+    aggregates = FleetReporter().aggregate(iter(runs))
+    controls = {(c["profile"], c["check_id"]): c for c in aggregates["controls"]}
+
+    assert len(controls) == 6
+    assert controls[("ubuntu_22_04", "6.1.2")]["fail"] == 1
+    assert controls[("rhel_9", "6.1.2")]["pass"] == 1
+    assert controls[("rhel_9", "6.1.2")]["label"] == "6.1.2 (rhel_9)"
+
+
+def test_fleet_dashboard_removes_stale_fragments(tmp_path):
+    """Test that a render drops fragments of hosts no longer in the fleet."""
+    output = tmp_path / "dashboard.html"
+    FleetReporter().generate(iter([dict(_audit_data(), host=f"host-{i}") for i in range(3)]),
+                             str(output))
+    (tmp_path / "dashboard_hosts" / "notes.txt").write_text("kept")
+    FleetReporter().generate(iter([dict(_audit_data(), host="host-9")]), str(output))
+
+    names = sorted(p.name for p in (tmp_path / "dashboard_hosts").iterdir())
+    assert names == ["00000_host-9.html", "notes.txt"]
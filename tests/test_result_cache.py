@@ -0,0 +1,81 @@
+"""
+Unit tests for the persistent check result cache.
+"""
+
+import time
+from src.auditors.base_auditor import CheckResult
+from src.auditors.scheduler import CheckSpec
+from src.auditors.ubuntu_auditor import UbuntuAuditor
+from src.probes import HostFacts
+from src.utils.profile_loader import check_ttls, load_profile
+from src.utils.result_cache import ResultCache
+
+
+def test_ttls_from_profile():
+    """Test TTL resolution from check, category and default entries."""
+    ttls = check_ttls(load_profile("ubuntu_22_04"))
+    assert ttls["1.1.1"] == 86400  # Initial Setup category
+    assert ttls["4.1.1.2"] == 0  # per-check override
+
+
+def test_cache_respects_ttl_and_max_age(tmp_path):
+    """Test that entries expire by TTL and that max_age caps the TTL."""
+    path = str(tmp_path / "cache.json")
+    cache = ResultCache(path)
+    cache.put("p:1.1.1", CheckResult("1.1.1", "Test", "pass"))
+    cache.save()
+
+    reloaded = ResultCache(path)
+    assert reloaded.get("p:1.1.1", ttl=60).status == "pass"
+    assert reloaded.get("p:1.1.1", ttl=0) is None
+    assert ResultCache(path, max_age=0).get("p:1.1.1", ttl=60) is None
+
+
+def test_cache_eviction_bounds_size_and_age(tmp_path):
+    """Test that save drops old entries and keeps at most max_entries."""
+    cache = ResultCache(str(tmp_path / "cache.json"), max_entries=2, max_entry_age=100)
+    for i in range(3):
+        cache.put(f"p:{i}", CheckResult(str(i), "Test", "pass"))
+    cache._entries["p:0"]["stored_at"] = time.time() - 1000
+    cache.save()
+
+    assert sorted(cache._entries) == ["p:1", "p:2"]
+
+
+def test_auditor_serves_cached_results(tmp_path):
+    """Test that an auditor skips probes whose cached result is fresh."""
+    calls = []
+
+    class CountingAuditor(UbuntuAuditor):
+        def get_check_specs(self):
+            def probe():
+                calls.append(1)
+                return CheckResult("1.1.1", "cramfs", "pass")
+            return [CheckSpec("1.1.1", probe), CheckSpec("2.1.1", probe)]
+
+    path = str(tmp_path / "cache.json")
+    facts = HostFacts(str(tmp_path))
+    CountingAuditor(cache=ResultCache(path), facts=facts).run_all_checks()
+    cache = ResultCache(path)
+    CountingAuditor(cache=cache, facts=facts).run_all_checks()
+
+    # 1.1.1 has a one-day TTL; 2.1.1 is not in the profile and always runs
+    assert len(calls) == 3
+    assert cache.hits == 1
+
+
+def test_remediated_checks_are_evicted(tmp_path):
+    """Test that invalidating remediated checks drops only their cached results."""
+    class FixedAuditor(UbuntuAuditor):
+        def get_check_specs(self):
+            return [CheckSpec(check_id, lambda check_id=check_id: CheckResult(check_id, "", "fail"))
+                    for check_id in ("1.1.1", "1.1.2")]
+
+    path = str(tmp_path / "cache.json")
+    auditor = FixedAuditor(cache=ResultCache(path, max_age=0), facts=HostFacts(str(tmp_path)))
+    auditor.run_all_checks()
+    auditor.invalidate_cached(["1.1.1"])
+
+    cache = ResultCache(path)
+    assert cache.get("ubuntu_22_04:1.1.1", ttl=60) is None
+    assert cache.get("ubuntu_22_04:1.1.2", ttl=60).status == "fail"
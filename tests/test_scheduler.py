@@ -0,0 +1,68 @@
+"""
+Unit tests for the dependency-aware check scheduler.
+"""
+
+import pytest
+from src.auditors.base_auditor import CheckResult
+from src.auditors.scheduler import CheckScheduler, CheckSpec
+
+
+def _check(check_id, status, calls=None):
+    def run():
+        if calls is not None:
+            calls.append(check_id)
+        return CheckResult(check_id, f"Check {check_id}", status)
+    return run
+
+
+def test_waves_follow_dependencies():
+    """Test that checks are grouped into topological waves."""
+    specs = [
+        CheckSpec("4.1.1.2", _check("4.1.1.2", "pass"), depends_on=["4.1.1.1"]),
+        CheckSpec("4.1.1.1", _check("4.1.1.1", "pass")),
+        CheckSpec("3.5.1.1", _check("3.5.1.1", "pass")),
+    ]
+    waves = CheckScheduler(specs).build_waves()
+
+    assert [[s.check_id for s in wave] for wave in waves] == [
+        ["4.1.1.1", "3.5.1.1"],
+        ["4.1.1.2"],
+    ]
+
+
+def test_failed_prerequisite_skips_dependents():
+    """Test that dependents of a failing check are skipped without running."""
+    calls = []
+    specs = [
+        CheckSpec("4.1.1.1", _check("4.1.1.1", "fail", calls)),
+        CheckSpec("4.1.1.2", _check("4.1.1.2", "pass", calls), depends_on=["4.1.1.1"]),
+        CheckSpec("4.1.3.1", _check("4.1.3.1", "pass", calls), depends_on=["4.1.1.2"]),
+    ]
+    results = CheckScheduler(specs).run()
+
+    assert calls == ["4.1.1.1"]
+    assert [r.status for r in results] == ["fail", "skip", "skip"]
+    assert "4.1.1.1 (fail)" in results[1].description
+
+
+def test_exception_becomes_error_result():
+    """Test that an exception raised by a check is reported as an error."""
+    def broken():
+        raise RuntimeError("boom")
+
+    results = CheckScheduler([CheckSpec("1.1.1", broken)]).run()
+    assert results[0].status == "error"
+    assert "boom" in results[0].description
+
+
+def test_cycle_and_unknown_dependency_rejected():
+    """Test that invalid dependency graphs raise ValueError."""
+    cycle = [
+        CheckSpec("a", _check("a", "pass"), depends_on=["b"]),
+        CheckSpec("b", _check("b", "pass"), depends_on=["a"]),
+    ]
+    with pytest.raises(ValueError):
+        CheckScheduler(cycle).build_waves()
+
+    with pytest.raises(ValueError):
+        CheckScheduler([CheckSpec("a", _check("a", "pass"), depends_on=["x"])]).build_waves()